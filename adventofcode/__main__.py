@@ -0,0 +1,175 @@
+"""Command line entry point, e.g., `python -m adventofcode run --year 2021 --day 1 --day 2`."""
+import argparse
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from typing import List, Optional
+
+from adventofcode import benchmark, generators, imports, runner
+from adventofcode.cache import AnswerCache
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="adventofcode", description=__doc__)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the solutions of the selected years and days concurrently.")
+    _add_selection_arguments(run_parser)
+    run_parser.add_argument("--workers", type=int, default=None, help="Number of worker processes.")
+    run_parser.add_argument("--json", action="store_true", help="Print the results as JSON.")
+    run_parser.add_argument("--no-cache", action="store_true", help="Run every solution, ignoring stored answers.")
+    run_parser.set_defaults(func=_run)
+
+    invalidate_parser = subparsers.add_parser("invalidate", help="Remove the stored answers of the selected days.")
+    _add_selection_arguments(invalidate_parser)
+    invalidate_parser.set_defaults(func=_invalidate)
+
+    importtime_parser = subparsers.add_parser("importtime", help="Report the slowest imports of a solution module.")
+    importtime_parser.add_argument("module", help="Module name, e.g., problems_2022.day1.solution.")
+    importtime_parser.add_argument("--run", action="store_true", help="Also run main(), to include lazy imports.")
+    importtime_parser.add_argument("--top", type=int, default=20, help="Number of imports to show.")
+    importtime_parser.set_defaults(func=_importtime)
+
+    bench_parser = subparsers.add_parser("bench", help="Benchmark the selected days and check for regressions.")
+    _add_selection_arguments(bench_parser)
+    bench_parser.add_argument("--warmup", type=int, default=1, help="Number of untimed runs of each phase.")
+    bench_parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs of each phase.")
+    bench_parser.add_argument("--history", type=Path, default=benchmark.DEFAULT_HISTORY_PATH, help="History file.")
+    bench_parser.add_argument(
+        "--baseline", default=None, help="Revision to compare against. Defaults to the latest other recorded revision."
+    )
+    bench_parser.add_argument(
+        "--threshold", type=float, default=0.2, help="Relative slowdown beyond which a phase is a regression."
+    )
+    bench_parser.add_argument("--no-record", action="store_true", help="Do not store the timings in the history.")
+    bench_parser.add_argument(
+        "--size", type=int, help="Benchmark on generated inputs of this size instead, e.g., 100000000 depth readings."
+    )
+    bench_parser.add_argument("--seed", type=int, default=0, help="Seed of the generated inputs.")
+    bench_parser.add_argument(
+        "--parse-cache", action="store_true", help="Let the parsers load their output from the parse cache."
+    )
+    bench_parser.set_defaults(func=_bench)
+
+    generate_parser = subparsers.add_parser("generate", help="Write a large synthetic input of a day.")
+    generate_parser.add_argument("--year", type=int, required=True)
+    generate_parser.add_argument("--day", type=int, required=True)
+    generate_parser.add_argument(
+        "--size", type=int, required=True, help="Size of the input; its meaning depends on the day."
+    )
+    generate_parser.add_argument("--seed", type=int, default=0, help="Seed of the random generator.")
+    generate_parser.add_argument("--output", type=Path, required=True, help="File to write the input to.")
+    generate_parser.set_defaults(func=_generate)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+def _add_selection_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--year", type=int, action="append", help="Year to select; can be repeated. Defaults to all.")
+    parser.add_argument("--day", type=int, action="append", help="Day to select; can be repeated. Defaults to all.")
+
+
+def _run(args: argparse.Namespace) -> int:
+    answer_cache = None if args.no_cache else AnswerCache()
+    results = runner.run(years=args.year, days=args.day, max_workers=args.workers, answer_cache=answer_cache)
+
+    if args.json:
+        print(json.dumps([asdict(x) for x in results], indent=2))
+    else:
+        for result in results:
+            status = "ok" if result.ok else "FAILED"
+            if result.cached_parts:
+                status += f" ({len(result.cached_parts)}/{len(result.answers)} cached)"
+            print(f"{result.year} day {result.day:>2}  {result.wall_time:8.3f}s  {status}")
+            for part_name, lines in result.answers.items():
+                for line in lines:
+                    print(f"    {part_name}: {line}")
+            if not result.ok:
+                print(result.error, file=sys.stderr)
+
+    return 0 if all(x.ok for x in results) else 1
+
+
+def _invalidate(args: argparse.Namespace) -> int:
+    answer_cache = AnswerCache()
+    if args.year is None and args.day is None:
+        num_removed = answer_cache.invalidate()
+    else:
+        num_removed = sum(
+            answer_cache.invalidate(source_path=x.file_path)
+            for x in runner.discover_solutions(years=args.year, days=args.day)
+        )
+    answer_cache.save()
+
+    print(f"Removed {num_removed} stored answer(s).")
+    return 0
+
+
+def _importtime(args: argparse.Namespace) -> int:
+    import_times = imports.import_time_report(module_name=args.module, run_main=args.run)
+
+    # Only the imports made directly by the module (and `main()`) add up to the total.
+    print(f"Total: {sum(x.cumulative_us for x in import_times if x.depth == 0) / 1000:.1f} ms")
+    print(f"{'cumulative [ms]':>16} {'self [ms]':>10}  module")
+    for import_time in sorted(import_times, key=lambda x: x.cumulative_us, reverse=True)[: args.top]:
+        print(f"{import_time.cumulative_us / 1000:16.1f} {import_time.self_us / 1000:10.1f}  {import_time.module_name}")
+
+    return 0
+
+
+def _bench(args: argparse.Namespace) -> int:
+    timings = benchmark.benchmark(
+        years=args.year,
+        days=args.day,
+        warmup=args.warmup,
+        repeat=args.repeat,
+        size=args.size,
+        seed=args.seed,
+        parse_cache=args.parse_cache,
+    )
+    for day_key, day_timings in timings.items():
+        for phase, phase_timings in day_timings.items():
+            print(f"{day_key:<12} {phase:<24} min {phase_timings['min']:9.4f}s  median {phase_timings['median']:9.4f}s")
+
+    revision = benchmark.current_revision()
+    history = benchmark.load_history(history_path=args.history)
+    baseline = args.baseline or benchmark.latest_other_revision(history=history, revision=revision)
+    if not args.no_record:
+        benchmark.record(timings=timings, revision=revision, history_path=args.history)
+
+    if baseline is None:
+        print("No baseline revision to compare against.")
+        return 0
+
+    if baseline not in history:
+        print(f"Baseline revision {baseline} is not in {args.history}.", file=sys.stderr)
+        return 1
+
+    regressions = benchmark.find_regressions(
+        timings=timings, baseline_timings=history[baseline]["timings"], threshold=args.threshold
+    )
+    for regression in regressions:
+        print(
+            f"Regression in {regression.day_key} {regression.phase}: {regression.baseline_seconds:.4f}s -> "
+            f"{regression.current_seconds:.4f}s ({regression.ratio:.2f}x).",
+            file=sys.stderr,
+        )
+    print(f"Compared against {baseline}: {len(regressions)} regression(s).")
+
+    return 1 if regressions else 0
+
+
+def _generate(args: argparse.Namespace) -> int:
+    if (args.year, args.day) not in generators.available():
+        days = ", ".join(f"{year} day {day}" for year, day in generators.available())
+        print(f"No input generator for {args.year} day {args.day}; available: {days}.", file=sys.stderr)
+        return 1
+
+    generators.write_input(year=args.year, day=args.day, size=args.size, file_path=args.output, seed=args.seed)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
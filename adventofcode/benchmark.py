@@ -0,0 +1,219 @@
+"""Benchmarks the solutions and detects per-day performance regressions.
+
+For each solution module, the input parsing (`_read_data`, if the module has one), each part, and the whole `main()` are
+timed separately, after a number of warmup runs.  A lazy parser, e.g., one returning a generator, is consumed within the
+timed call.  A module solving both parts, `solution.py`, exposes them as `part1(data)` and `part2(data)`, which take the
+output of `_read_data`; each is timed on a freshly parsed input, without the parsing.  Since `main()` reads its own
+input, its time includes parsing.  The parse cache (see `adventofcode.cache.cached_parser`) is disabled by default, so
+the timed runs parse their input instead of loading the output of the warmup runs.
+
+With a `size`, the days with an input generator (see `adventofcode.generators`) are benchmarked on a synthetic input of
+that size instead, e.g., 10^8 depth readings for 2021 day 1, timing `solve(data_file_path)` on the generated file.  The
+timings of such a run are keyed by "<year>/day<day>@<size>", so they are only compared against runs of the same size.
+
+The results are stored in a JSON history file keyed by the git revision, so each run can be compared against a
+previously recorded revision:
+
+    {
+        "<revision>": {
+            "recorded_at": "2022-12-20T12:00:00",
+            "timings": {"2022/day15": {"solution.parse": {"min": ..., "median": ..., "samples": [...]}, ...}},
+        },
+    }
+"""
+import collections.abc
+import contextlib
+import datetime
+import functools
+import importlib
+import io
+import json
+import os
+import statistics
+import subprocess
+import tempfile
+import time
+import types
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from adventofcode import cache, generators, runner
+
+DEFAULT_HISTORY_PATH = runner.REPO_ROOT / ".benchmarks" / "history.json"
+
+# Timings of a benchmark run, keyed by "<year>/day<day>" and then by the phase name, e.g., "solution_part1.parse" or
+# "solution.part2".
+Timings = Dict[str, Dict[str, Dict[str, object]]]
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A phase that became slower than the baseline by more than the threshold."""
+
+    day_key: str
+    phase: str
+    baseline_seconds: float
+    current_seconds: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_seconds / self.baseline_seconds
+
+
+def benchmark(
+    years: Optional[Iterable[int]] = None,
+    days: Optional[Iterable[int]] = None,
+    warmup: int = 1,
+    repeat: int = 5,
+    size: Optional[int] = None,
+    seed: int = 0,
+    parse_cache: bool = False,
+) -> Timings:
+    """Benchmarks the selected solutions in the current process and returns their timings.
+
+    Each phase is run `warmup` times untimed and then `repeat` times timed.  With a `size`, the solutions are run on
+    generated inputs of that size, and the days without an input generator are skipped.  The parsers only use the parse
+    cache if `parse_cache`.
+    """
+    runner.initialize_worker()
+
+    ret: Timings = {}
+    with tempfile.TemporaryDirectory() as directory, contextlib.ExitStack() as stack:
+        if not parse_cache:
+            stack.enter_context(cache.parse_cache_disabled())
+
+        for solution in runner.discover_solutions(years=years, days=days):
+            if size is not None and (solution.year, solution.day) not in generators.available():
+                continue
+
+            module = importlib.import_module(solution.module_name)
+            if size is None:
+                day_key = _day_key(solution.year, solution.day)
+                data_file_path = os.path.join(os.path.dirname(module.__file__), "data.txt")
+                run = module.main
+            else:
+                day_key = f"{_day_key(solution.year, solution.day)}@{size}"
+                data_file_path = os.path.join(directory, f"{solution.year}_day{solution.day}.txt")
+                if not os.path.exists(data_file_path):
+                    generators.write_input(
+                        year=solution.year, day=solution.day, size=size, file_path=data_file_path, seed=seed
+                    )
+                run = functools.partial(module.solve, data_file_path=data_file_path)
+
+            day_timings = ret.setdefault(day_key, {})
+            if hasattr(module, "_read_data") and os.path.exists(data_file_path):
+                parse = functools.partial(_parse, module=module, data_file_path=data_file_path)
+                day_timings[f"{solution.part_name}.parse"] = _time_function(parse, warmup=warmup, repeat=repeat)
+                for part in ["part1", "part2"]:
+                    if hasattr(module, part):
+                        day_timings[f"{solution.part_name}.{part}"] = _time_function(
+                            getattr(module, part), warmup=warmup, repeat=repeat, setup=parse
+                        )
+
+            day_timings[solution.part_name] = _time_function(run, warmup=warmup, repeat=repeat)
+
+    return ret
+
+
+def _parse(module: types.ModuleType, data_file_path: str) -> object:
+    """Returns the output of the module's `_read_data`, as a list if it is an iterator, e.g., a generator."""
+    ret = module._read_data(data_file_path=data_file_path)
+    return list(ret) if isinstance(ret, collections.abc.Iterator) else ret
+
+
+def _time_function(
+    function: Callable[..., object], warmup: int, repeat: int, setup: Optional[Callable[[], object]] = None
+) -> Dict[str, object]:
+    """Returns the min, median and all samples of the wall time in seconds, discarding anything `function` prints.
+
+    With a `setup`, each call is `function(setup())`, and only `function` is timed.
+    """
+    samples = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(warmup):
+            function(*([setup()] if setup is not None else []))
+
+        for _ in range(repeat):
+            args = [setup()] if setup is not None else []
+            start_time = time.perf_counter()
+            function(*args)
+            samples.append(time.perf_counter() - start_time)
+
+    return {"min": min(samples), "median": statistics.median(samples), "samples": samples}
+
+
+def _day_key(year: int, day: int) -> str:
+    return f"{year}/day{day}"
+
+
+def current_revision() -> str:
+    """Returns the current git revision, with a "-dirty" suffix if tracked files are modified."""
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            cwd=runner.REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def load_history(history_path: Path = DEFAULT_HISTORY_PATH) -> Dict[str, Dict[str, object]]:
+    if not history_path.exists():
+        return {}
+
+    with open(history_path, "r") as file:
+        return json.load(file)
+
+
+def record(timings: Timings, revision: str, history_path: Path = DEFAULT_HISTORY_PATH) -> None:
+    """Stores the timings under `revision` in the history file, merging with the days already recorded for it."""
+    history = load_history(history_path=history_path)
+
+    # Re-insert the entry so the most recently recorded revision is always the last one.
+    entry = history.pop(revision, {"timings": {}})
+    entry["recorded_at"] = datetime.datetime.now().isoformat(timespec="seconds")
+    entry["timings"].update(timings)
+    history[revision] = entry
+
+    history_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(history_path, "w") as file:
+        json.dump(history, file, indent=2)
+
+
+def latest_other_revision(history: Dict[str, Dict[str, object]], revision: str) -> Optional[str]:
+    """Returns the most recently recorded revision other than `revision`, or None if there is none."""
+    others = [x for x in history if x != revision]
+    return others[-1] if others else None
+
+
+def find_regressions(
+    timings: Timings, baseline_timings: Timings, threshold: float = 0.2, min_seconds: float = 0.001
+) -> List[Regression]:
+    """Returns the phases whose minimum time grew by more than `threshold` (relative) over the baseline.
+
+    Phases faster than `min_seconds` in both runs are ignored, as their timings are dominated by noise.  Phases missing
+    from the baseline are not compared.
+    """
+    ret = []
+    for day_key, day_timings in timings.items():
+        for phase, phase_timings in day_timings.items():
+            baseline_phase_timings = baseline_timings.get(day_key, {}).get(phase)
+            if baseline_phase_timings is None:
+                continue
+
+            baseline_seconds, current_seconds = baseline_phase_timings["min"], phase_timings["min"]
+            if max(baseline_seconds, current_seconds) < min_seconds:
+                continue
+
+            if current_seconds > baseline_seconds * (1 + threshold):
+                ret.append(
+                    Regression(
+                        day_key=day_key, phase=phase, baseline_seconds=baseline_seconds, current_seconds=current_seconds
+                    )
+                )
+
+    return ret
@@ -0,0 +1,362 @@
+"""Content-addressed, on-disk caches of parsed inputs and of answers.
+
+A parsed input is keyed by the hash of the input file content, the identity of the parser (its qualified name and the
+hash of the source of its module and of the repository modules it imports) and the storage format, so editing the
+input, the parser or a helper it calls invalidates the entry.  NumPy arrays are stored as
+`.npy` files, and any other picklable object as a pickle.  The least recently used entries are evicted once the total
+size of the cache exceeds its bound.
+
+Decorate a `_read_data(data_file_path)` function to use the default cache:
+
+    @cached_parser
+    def _read_data(data_file_path: str) -> List[np.ndarray]:
+        ...
+
+The cache directory defaults to `~/.cache/adventofcode` and can be changed with the `ADVENTOFCODE_CACHE_DIR`
+environment variable.  Set `ADVENTOFCODE_PARSE_CACHE=0` to disable the cache, or disable it within a block with
+`parse_cache_disabled()`, e.g., to time the parsers themselves.
+
+`AnswerCache` stores the answers of the solution modules, so the runner can skip the modules whose source, the source of
+the repository modules they import, and input are unchanged.
+"""
+import ast
+import contextlib
+import functools
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+
+DEFAULT_CACHE_DIR = Path(os.environ.get("ADVENTOFCODE_CACHE_DIR", Path.home() / ".cache" / "adventofcode"))
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# The directory containing the `adventofcode` package and all the `problems_<year>` packages.
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+
+_NPY_SUFFIX = ".npy"
+_PICKLE_SUFFIX = ".pkl"
+# The format of the stored entries, part of their keys: a pickle of objects of another Python or NumPy version may not
+# load, or load differently.
+_FORMAT = f"pickle{pickle.HIGHEST_PROTOCOL}:python{sys.version_info[0]}.{sys.version_info[1]}:numpy{np.__version__}"
+
+# Hashes of the files already hashed by this process, keyed by (path, modification time, size).
+_file_hashes: Dict[Tuple[str, int, int], str] = {}
+# The repository modules imported by the files already parsed by this process, keyed likewise.
+_imported_module_paths_by_file: Dict[Tuple[str, int, int], List[Path]] = {}
+
+
+def file_hash(file_path: str) -> str:
+    """Returns the SHA-256 hex digest of the file content."""
+    stat = os.stat(file_path)
+    key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+    if key not in _file_hashes:
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as file:
+            for block in iter(functools.partial(file.read, 1024 * 1024), b""):
+                digest.update(block)
+        _file_hashes[key] = digest.hexdigest()
+
+    return _file_hashes[key]
+
+
+def source_hash(source_path: Path) -> str:
+    """Returns the SHA-256 hex digest of the source of a module and of the repository modules it imports.
+
+    See `imported_sources`.
+    """
+    digest = hashlib.sha256()
+    for path in imported_sources(source_path):
+        digest.update(f"{path.relative_to(_REPO_ROOT)}:{file_hash(str(path))}\n".encode())
+    return digest.hexdigest()
+
+
+def imported_sources(source_path: Path) -> List[Path]:
+    """Returns the source files of a module and of the repository modules it imports, transitively, sorted.
+
+    The imports are found statically, so imports inside functions count too, while third-party modules and the names
+    passed to `lazy_import` are ignored.
+    """
+    ret: Set[Path] = set()
+    to_visit = [Path(source_path).resolve()]
+    while to_visit:
+        path = to_visit.pop()
+        if path in ret:
+            continue
+
+        ret.add(path)
+        to_visit.extend(_imported_module_paths(path))
+
+    return sorted(ret)
+
+
+def _imported_module_paths(path: Path) -> List[Path]:
+    """Returns the source files of the repository modules imported directly by the module at `path`."""
+    stat = os.stat(path)
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    if key not in _imported_module_paths_by_file:
+        with open(path, "rb") as file:
+            tree = ast.parse(file.read(), filename=str(path))
+
+        ret = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                module_names = [x.name for x in node.names]
+            elif isinstance(node, ast.ImportFrom):
+                package = _resolve_relative_import(path=path, module=node.module, level=node.level)
+                # Each imported name may be a submodule or a name defined in the package.
+                module_names = [package] + [f"{package}.{x.name}" for x in node.names]
+            else:
+                continue
+
+            for module_name in module_names:
+                ret.extend(_module_source_paths(module_name))
+        _imported_module_paths_by_file[key] = ret
+
+    return _imported_module_paths_by_file[key]
+
+
+def _resolve_relative_import(path: Path, module: Optional[str], level: int) -> str:
+    if level == 0:
+        return module or ""
+
+    package_parts = list(path.relative_to(_REPO_ROOT).parent.parts)
+    package_parts = package_parts[: len(package_parts) - (level - 1)]
+    return ".".join(package_parts + ([module] if module else []))
+
+
+def _module_source_paths(module_name: str) -> List[Path]:
+    """Returns the source file of a repository module and of the packages containing it, or [] if it is not one."""
+    ret = []
+    parts = module_name.split(".")
+    for num_parts in range(1, len(parts) + 1):
+        base_path = _REPO_ROOT.joinpath(*parts[:num_parts])
+        for path in [base_path.with_suffix(".py"), base_path / "__init__.py"]:
+            if path.is_file():
+                ret.append(path)
+    return ret
+
+
+def function_identity(function: Callable) -> str:
+    """Returns a string identifying the function by its qualified name and the hash of its source code.
+
+    The source code of a function defined in a file is the whole file and the repository modules it imports, see
+    `source_hash`, so editing a helper the function calls changes its identity too.
+    """
+    try:
+        code = source_hash(Path(inspect.getsourcefile(function))).encode()
+    except (OSError, TypeError):
+        # The source is not available, e.g., for functions defined in an interactive session.
+        code = function.__code__.co_code
+
+    return f"{function.__module__}.{function.__qualname__}:{hashlib.sha256(code).hexdigest()}"
+
+
+class ParsedInputCache:
+    """An on-disk cache of parser outputs, bounded to `max_bytes` with least-recently-used eviction."""
+
+    def __init__(self, directory: Path = DEFAULT_CACHE_DIR / "parsed", max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    def get_or_parse(self, parser: Callable[[str], T], file_path: str) -> T:
+        """Returns the cached output of `parser(file_path)`, calling the parser and storing its output on a miss."""
+        key = hashlib.sha256(f"{function_identity(parser)}:{file_hash(file_path)}:{_FORMAT}".encode()).hexdigest()
+
+        found, value = self._load(key)
+        if found:
+            return value
+
+        value = parser(file_path)
+        self._store(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Removes all entries."""
+        for path in self._entry_paths():
+            _unlink_if_exists(path)
+
+    def _load(self, key: str) -> Tuple[bool, Optional[object]]:
+        for suffix in [_NPY_SUFFIX, _PICKLE_SUFFIX]:
+            path = self.directory / (key + suffix)
+            if not path.exists():
+                continue
+
+            try:
+                if suffix == _NPY_SUFFIX:
+                    value = np.load(path, allow_pickle=False)
+                else:
+                    with open(path, "rb") as file:
+                        value = pickle.load(file)
+            except Exception:
+                # A corrupted entry, or a pickle of classes that cannot be imported in this process.  Treat as a miss.
+                return False, None
+
+            # Mark as recently used.
+            os.utime(path)
+            return True, value
+
+        return False, None
+
+    def _store(self, key: str, value: object) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        suffix = _NPY_SUFFIX if isinstance(value, np.ndarray) and value.dtype != object else _PICKLE_SUFFIX
+
+        # Write to a temporary file first, so concurrent readers never see a partially written entry.
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                if suffix == _NPY_SUFFIX:
+                    np.save(file, value, allow_pickle=False)
+                else:
+                    pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, self.directory / (key + suffix))
+        except Exception:
+            os.unlink(temporary_path)
+            # Unpicklable values are simply not cached.
+            return
+
+        self._evict()
+
+    def _evict(self) -> None:
+        """Removes the least recently used entries until the total size is within `max_bytes`."""
+        entries = []
+        for path in self._entry_paths():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # Evicted concurrently by another process.
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total_size = sum(x[1] for x in entries)
+        for _, size, path in sorted(entries, key=lambda x: x[0]):
+            if total_size <= self.max_bytes:
+                break
+
+            _unlink_if_exists(path)
+            total_size -= size
+
+    def _entry_paths(self) -> List[Path]:
+        if not self.directory.exists():
+            return []
+
+        return [x for x in self.directory.iterdir() if x.suffix in {_NPY_SUFFIX, _PICKLE_SUFFIX}]
+
+
+def _unlink_if_exists(path: Path) -> None:
+    # `Path.unlink(missing_ok=True)` needs Python 3.8.
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        # Removed concurrently by another process.
+        pass
+
+
+_default_cache = ParsedInputCache()
+# Whether `cached_parser` uses the default cache, unless disabled by the environment; see `parse_cache_disabled`.
+_parse_cache_enabled = True
+
+
+def cached_parser(parser: Callable[[str], T]) -> Callable[[str], T]:
+    """Decorates a `_read_data(data_file_path)` function to cache its output in the default cache."""
+
+    @functools.wraps(parser)
+    def wrapper(data_file_path: str) -> T:
+        if not _parse_cache_enabled or os.environ.get("ADVENTOFCODE_PARSE_CACHE", "1") == "0":
+            return parser(data_file_path)
+
+        return _default_cache.get_or_parse(parser, data_file_path)
+
+    return wrapper
+
+
+@contextlib.contextmanager
+def parse_cache_disabled() -> Iterator[None]:
+    """Makes the parsers decorated with `cached_parser` parse their input every time within the block."""
+    global _parse_cache_enabled
+    previous = _parse_cache_enabled
+    _parse_cache_enabled = False
+    try:
+        yield
+    finally:
+        _parse_cache_enabled = previous
+
+
+class AnswerCache:
+    """A bounded store of solution answers keyed by (module source hash, input hash, part).
+
+    An answer is only reused if neither the input nor the source of the solution module changed, including the source of
+    the repository modules it imports, e.g., `solution_part1.py` of the same day or `adventofcode.util`; see
+    `source_hash`.
+
+    The entries are kept in memory and written to a JSON file by `save()`.  Beyond `max_entries`, the least recently used
+    entries are evicted.
+    """
+
+    def __init__(self, path: Path = DEFAULT_CACHE_DIR / "answers.json", max_entries: int = 1024) -> None:
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self._entries: Dict[str, Dict[str, object]] = {}
+        if self.path.exists():
+            try:
+                with open(self.path, "r") as file:
+                    self._entries = json.load(file)
+            except (OSError, ValueError):
+                # A corrupted store is treated as empty.
+                self._entries = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, source_path: Path, input_path: Path, part: str) -> Optional[List[str]]:
+        """Returns the stored answers, or None if the source, the input or the part has no stored answers."""
+        entry = self._entries.get(self._key(source_path=source_path, input_path=input_path, part=part))
+        if entry is None:
+            return None
+
+        entry["last_used"] = time.time()
+        return entry["answers"]
+
+    def put(self, source_path: Path, input_path: Path, part: str, answers: List[str]) -> None:
+        self._entries[self._key(source_path=source_path, input_path=input_path, part=part)] = {
+            "source": str(source_path),
+            "part": part,
+            "answers": answers,
+            "last_used": time.time(),
+        }
+
+        if len(self._entries) > self.max_entries:
+            keys_by_last_use = sorted(self._entries, key=lambda x: self._entries[x]["last_used"])
+            for key in keys_by_last_use[: len(self._entries) - self.max_entries]:
+                del self._entries[key]
+
+    def invalidate(self, source_path: Optional[Path] = None) -> int:
+        """Removes the answers of the given solution module, or all answers if None; returns the number removed."""
+        keys = [x for x, entry in self._entries.items() if source_path is None or entry["source"] == str(source_path)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def save(self) -> None:
+        """Writes the entries to the JSON file, atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(file_descriptor, "w") as file:
+            json.dump(self._entries, file)
+        os.replace(temporary_path, self.path)
+
+    @staticmethod
+    def _key(source_path: Path, input_path: Path, part: str) -> str:
+        # Some solutions have no input file.
+        input_hash = file_hash(str(input_path)) if input_path.exists() else ""
+        return f"{source_hash(source_path)}:{input_hash}:{part}"
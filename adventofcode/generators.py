@@ -0,0 +1,384 @@
+"""Seeded generators of large, valid puzzle inputs, for scaling tests and benchmarks.
+
+Each generator is registered for a (year, day) and yields the input text in chunks, so inputs much larger than memory can
+be written to disk.  The meaning of `size` depends on the day, e.g., the number of lines, or the side length of a grid;
+see the docstring of each generator.  The same (year, day, size, seed) always produces the same input.
+
+    write_input(year=2021, day=15, size=1000, file_path="risk_map.txt", seed=0)
+"""
+import string
+from typing import Callable, Dict, Iterator, List, Tuple
+
+import numpy as np
+
+# A generator takes the size and a random generator, and yields chunks of the input text.
+Generator = Callable[[int, np.random.Generator], Iterator[str]]
+
+# Number of lines (or grid rows, for large grids) formatted at a time.
+_CHUNK_NUM_LINES = 1 << 16
+
+_GENERATORS: Dict[Tuple[int, int], Generator] = {}
+
+# The wires of each digit of a seven-segment display, in the order of the digits 0 to 9.
+_SEVEN_SEGMENT_DIGITS = ["abcefg", "cf", "acdeg", "acdfg", "bcdf", "abdfg", "abdefg", "acf", "abcdefg", "abcdfg"]
+
+
+def register(year: int, day: int) -> Callable[[Generator], Generator]:
+    """Registers the decorated function as the generator of the given day."""
+
+    def decorator(generator: Generator) -> Generator:
+        _GENERATORS[(year, day)] = generator
+        return generator
+
+    return decorator
+
+
+def available() -> List[Tuple[int, int]]:
+    """Returns the (year, day) tuples that have a generator."""
+    return sorted(_GENERATORS)
+
+
+def iter_input(year: int, day: int, size: int, seed: int = 0) -> Iterator[str]:
+    """Yields the chunks of a generated input."""
+    if (year, day) not in _GENERATORS:
+        raise KeyError(f"No input generator for {year} day {day}!")
+
+    return _GENERATORS[(year, day)](size, np.random.default_rng(seed))
+
+
+def generate(year: int, day: int, size: int, seed: int = 0) -> str:
+    """Returns a generated input as a single string."""
+    return "".join(iter_input(year=year, day=day, size=size, seed=seed))
+
+
+def write_input(year: int, day: int, size: int, file_path: str, seed: int = 0) -> None:
+    """Writes a generated input to a file, one chunk at a time."""
+    with open(file_path, "w") as file:
+        for chunk in iter_input(year=year, day=day, size=size, seed=seed):
+            file.write(chunk)
+
+
+def _lines(rows: np.ndarray) -> str:
+    """Returns the rows of a 1D array or the rows of a 2D array of strings, one per line."""
+    if rows.ndim == 2:
+        rows = np.array(["".join(x) for x in rows])
+    return "\n".join(rows.astype(str).tolist()) + "\n"
+
+
+def _chunk_sizes(size: int, chunk_size: int = _CHUNK_NUM_LINES) -> Iterator[int]:
+    for start in range(0, size, chunk_size):
+        yield min(chunk_size, size - start)
+
+
+def _digit_grid(size: int, rng: np.random.Generator, low: int, high: int) -> Iterator[str]:
+    """Yields a `size` by `size` grid of digits in [low, high]."""
+    for num_rows in _chunk_sizes(size, chunk_size=max(1, _CHUNK_NUM_LINES * 16 // size)):
+        rows = rng.integers(low, high + 1, size=(num_rows, size), dtype=np.uint8) + ord("0")
+        # Append the line breaks and emit the bytes as they are, without formatting each digit.
+        yield np.concatenate([rows, np.full((num_rows, 1), ord("\n"), dtype=np.uint8)], axis=1).tobytes().decode()
+
+
+@register(2021, 1)
+def _sonar_sweep(size: int, rng: np.random.Generator) -> Iterator[str]:
+    """`size` depth readings, as a random walk that stays positive."""
+    depth = 100
+    for num_lines in _chunk_sizes(size):
+        depths = depth + np.cumsum(rng.integers(-10, 20, size=num_lines))
+        depths = np.abs(depths) + 1
+        depth = int(depths[-1])
+        yield _lines(depths)
+
+
+@register(2021, 2)
+def _dive(size: int, rng: np.random.Generator) -> Iterator[str]:
+    """`size` submarine commands."""
+    commands = np.array(["forward", "down", "up"])
+    for num_lines in _chunk_sizes(size):
+        # Go down more often than up, so the submarine mostly stays below the surface.
+        names = commands[rng.choice(3, size=num_lines, p=[0.4, 0.35, 0.25])]
+        yield _lines(np.char.add(np.char.add(names, " "), rng.integers(1, 10, size=num_lines).astype(str)))
+
+
+@register(2021, 3)
+def _binary_diagnostic(size: int, rng: np.random.Generator) -> Iterator[str]:
+    """`size` distinct binary numbers, at least 12 bits wide."""
+    num_bits = max(12, int(np.ceil(np.log2(max(size, 1)))) + 2)
+    # Draw more than needed and keep the first distinct ones, so the ratings always end at a single number.
+    numbers = np.zeros(shape=(0,), dtype=np.int64)
+    while len(numbers) < size:
+        numbers = np.unique(np.concatenate([numbers, rng.integers(0, 1 << num_bits, size=size)]))
+    numbers = rng.permutation(numbers)[:size]
+
+    for start in range(0, size, _CHUNK_NUM_LINES):
+        yield _lines(np.array([np.binary_repr(x, width=num_bits) for x in numbers[start : start + _CHUNK_NUM_LINES]]))
+
+
+@register(2021, 4)
+def _giant_squid(size: int, rng: np.random.Generator) -> Iterator[str]:
+    """The draw order of the numbers 0 to 99, and `size` bingo boards."""
+    yield ",".join(rng.permutation(100).astype(str).tolist()) + "\n"
+
+    for num_boards in _chunk_sizes(size, chunk_size=_CHUNK_NUM_LINES // 8):
+        # 25 distinct numbers per board.
+        boards = np.argsort(rng.random(size=(num_boards, 100)), axis=1)[:, :25].reshape(num_boards, 5, 5)
+        cells = np.char.rjust(boards.astype(str), 2)
+        yield "".join("\n" + "\n".join(" ".join(row) for row in board) + "\n" for board in cells)
+
+
+@register(2021, 5)
+def _hydrothermal_venture(size: int, rng: np.random.Generator, max_coordinate: int = 1000) -> Iterator[str]:
+    """`size` horizontal, vertical or diagonal line segments with coordinates in [0, 1000)."""
+    for num_lines in _chunk_sizes(size):
+        x1, y1 = rng.integers(0, max_coordinate, size=(2, num_lines))
+        length = rng.integers(0, max_coordinate // 2, size=num_lines)
+        kind = rng.integers(0, 3, size=num_lines)
+        direction = rng.choice([-1, 1], size=(2, num_lines))
+        # Horizontal segments only move x, vertical ones only y, and diagonal ones both.
+        x2 = np.clip(x1 + direction[0] * length * (kind != 1), 0, max_coordinate - 1)
+        y2 = np.clip(y1 + direction[1] * length * (kind != 0), 0, max_coordinate - 1)
+        # Clipping can shorten one axis of a diagonal more than the other; keep both the same length.
+        diagonal_length = np.minimum(np.abs(x2 - x1), np.abs(y2 - y1))
+        x2 = np.where(kind == 2, x1 + np.sign(x2 - x1) * diagonal_length, x2)
+        y2 = np.where(kind == 2, y1 + np.sign(y2 - y1) * diagonal_length, y2)
+        yield "".join(f"{a},{b} -> {c},{d}\n" for a, b, c, d in zip(x1, y1, x2, y2))
+
+
+@register(2021, 6)
+def _lanternfish(size: int, rng: np.random.Generator) -> Iterator[str]:
+    """`size` lanternfish timers between 1 and 5, on a single line."""
+    yield ",".join(rng.integers(1, 6, size=size).astype(str).tolist()) + "\n"
+
+
+@register(2021, 7)
+def _treachery_of_whales(size: int, rng: np.random.Generator) -> Iterator[str]:
+    """`size` crab positions in [0, 2000), on a single line."""
+    yield ",".join(rng.integers(0, 2000, size=size).astype(str).tolist()) + "\n"
+
+
+@register(2021, 8)
+def _seven_segment_search(size: int, rng: np.random.Generator) -> Iterator[str]:
+    """`size` displays, each with its own random wiring, 10 shuffled patterns and a 4-digit output."""
+    for num_lines in _chunk_sizes(size, chunk_size=_CHUNK_NUM_LINES // 4):
+        lines = []
+        for _ in range(num_lines):
+            wiring = dict(zip("abcdefg", rng.permutation(list("abcdefg"))))
+            patterns = ["".join(rng.permutation([wiring[x] for x in digit])) for digit in _SEVEN_SEGMENT_DIGITS]
+            outputs = ["".join(rng.permutation(list(patterns[x]))) for x in rng.integers(0, 10, size=4)]
+            lines.append(" ".join(rng.permutation(patterns)) + " | " + " ".join(outputs))
+        yield "\n".join(lines) + "\n"
+
+
+@register(2021, 9)
+def _smoke_basin(size: int, rng: np.random.Generator) -> Iterator[str]:
+    """A `size` by `size` height map."""
+    return _digit_grid(size, rng, low=0, high=9)
+
+
+@register(2021, 10)
+def _syntax_scoring(size: int, rng: np.random.Generator, max_length: int = 120) -> Iterator[str]:
+    """`size` navigation lines, each either corrupted or incomplete."""
+    open_chars, close_chars = "([{<", ")]}>"
+    for num_lines in _chunk_sizes(size, chunk_size=_CHUNK_NUM_LINES // 16):
+        lines = []
+        for length, is_corrupted in zip(rng.integers(10, max_length, size=num_lines), rng.random(size=num_lines) < 0.5):
+            stack, line = [], []
+            for to_open, bracket in zip(rng.random(size=length) < 0.6, rng.integers(0, 4, size=length)):
+                if to_open or not stack:
+                    stack.append(bracket)
+                    line.append(open_chars[bracket])
+                else:
+                    line.append(close_chars[stack.pop()])
+
+            if not stack:
+                # A complete line is neither corrupted nor incomplete, so leave one more bracket open.
+                bracket = int(rng.integers(0, 4))
+                stack.append(bracket)
+                line.append(open_chars[bracket])
+            if is_corrupted:
+                # Close with a bracket that does not match the last opened one.
+                line.append(close_chars[(stack[-1] + rng.integers(1, 4)) % 4])
+            lines.append("".join(line))
+        yield "\n".join(lines) + "\n"
+
+
+@register(2021, 11)
+def _dumbo_octopus(size: int, rng: np.random.Generator) -> Iterator[str]:
+    """A `size` by `size` energy level map that is sure to synchronize, so part 2 terminates.
+
+    Random maps almost never synchronize.  Instead, the energy levels are a random base level `k` in [1, 8], plus 1 at
+    random cells, and minus 1 at random cells of even row and column, which are never neighbors.  At step `9 - k`, the
+    first in which any octopus flashes, the levels are thus 8 to 10, and the 10s flash.  The cells other than the 8s
+    are connected, so the flashes reach all the 9s, and then every 8 has at least 3 flashing neighbors: all the
+    octopuses flash in that step.
+    """
+    base_level = int(rng.integers(1, 9))
+    for start in range(0, size, max(1, _CHUNK_NUM_LINES * 16 // size)):
+        num_rows = min(max(1, _CHUNK_NUM_LINES * 16 // size), size - start)
+        levels = base_level + rng.integers(0, 2, size=(num_rows, size), dtype=np.uint8)
+        can_be_lower = ((np.arange(start, start + num_rows) % 2 == 0)[:, None]) & (np.arange(size) % 2 == 0)
+        levels[can_be_lower & (rng.random(size=(num_rows, size)) < 0.5)] = base_level - 1
+        if start == 0:
+            # At least one octopus is above the base level, and flashes first.
+            levels[0, min(1, size - 1)] = base_level + 1
+
+        rows = levels + np.uint8(ord("0"))
+        yield np.concatenate([rows, np.full((num_rows, 1), ord("\n"), dtype=np.uint8)], axis=1).tobytes().decode()
+
+
+@register(2021, 15)
+def _chiton(size: int, rng: np.random.Generator) -> Iterator[str]:
+    """A `size` by `size` risk level map."""
+    return _digit_grid(size, rng, low=1, high=9)
+
+
+@register(2022, 1)
+def _calorie_counting(size: int, rng: np.random.Generator) -> Iterator[str]:
+    """The snacks of `size` elves, each carrying 1 to 10 snacks."""
+    for num_elves in _chunk_sizes(size, chunk_size=_CHUNK_NUM_LINES // 8):
+        calories = rng.integers(1000, 10000, size=(num_elves, 10)).astype(str)
+        num_snacks = rng.integers(1, 11, size=num_elves)
+        yield "".join("\n".join(row[:n]) + "\n\n" for row, n in zip(calories, num_snacks))
+
+
+@register(2022, 2)
+def _rock_paper_scissors(size: int, rng: np.random.Generator) -> Iterator[str]:
+    """`size` rounds of the strategy guide."""
+    for num_lines in _chunk_sizes(size):
+        yield _lines(
+            np.char.add(
+                np.char.add(np.array(list("ABC"))[rng.integers(0, 3, size=num_lines)], " "),
+                np.array(list("XYZ"))[rng.integers(0, 3, size=num_lines)],
+            )
+        )
+
+
+@register(2022, 4)
+def _camp_cleanup(size: int, rng: np.random.Generator) -> Iterator[str]:
+    """`size` pairs of section ranges within [1, 99]."""
+    for num_lines in _chunk_sizes(size):
+        bounds = np.sort(rng.integers(1, 100, size=(num_lines, 2, 2)), axis=2)
+        yield "".join(f"{a}-{b},{c}-{d}\n" for (a, b), (c, d) in bounds)
+
+
+@register(2022, 6)
+def _tuning_trouble(size: int, rng: np.random.Generator) -> Iterator[str]:
+    """A datastream of `size` characters from a small alphabet, with a start-of-message marker near the end."""
+    letters = np.array(list("abc"), dtype="<U1")
+    for num_chars in _chunk_sizes(max(size - 14, 0), chunk_size=_CHUNK_NUM_LINES * 16):
+        # With three letters, there are never 4 or 14 distinct characters in a row.
+        yield "".join(letters[rng.integers(0, 3, size=num_chars)])
+    yield "".join(rng.permutation(list(string.ascii_lowercase))[:14]) + "\n"
+
+
+@register(2022, 7)
+def _no_space_left_on_device(size: int, rng: np.random.Generator, depth_bias: float = 0.9) -> Iterator[str]:
+    """A terminal log of browsing `size` directories, each with up to 5 files.
+
+    Each new directory is created in the most recently created one with probability `depth_bias`, and in a random one
+    otherwise, so a bias close to 1 makes very deep trees.
+    """
+    parents = [-1]
+    for index in range(1, size):
+        parents.append(index - 1 if rng.random() < depth_bias else int(rng.integers(0, index)))
+
+    children: List[List[int]] = [[] for _ in range(size)]
+    for index, parent in enumerate(parents[1:], start=1):
+        children[parent].append(index)
+
+    # Walk the tree depth first without recursion, as it can be arbitrarily deep.
+    lines = ["$ cd /"]
+    stack = [(0, False)]
+    while stack:
+        index, visited = stack.pop()
+        if visited:
+            lines.append("$ cd ..")
+            continue
+
+        if index != 0:
+            lines.append(f"$ cd d{index}")
+            stack.append((index, True))
+
+        lines.append("$ ls")
+        lines.extend(f"dir d{x}" for x in children[index])
+        lines.extend(f"{x} f{i}.txt" for i, x in enumerate(rng.integers(1, 300000, size=rng.integers(0, 6))))
+        stack.extend((x, False) for x in reversed(children[index]))
+
+        if len(lines) >= _CHUNK_NUM_LINES:
+            yield "\n".join(lines) + "\n"
+            lines = []
+
+    yield "\n".join(lines) + "\n"
+
+
+@register(2022, 8)
+def _treetop_tree_house(size: int, rng: np.random.Generator) -> Iterator[str]:
+    """A `size` by `size` tree height map."""
+    return _digit_grid(size, rng, low=0, high=9)
+
+
+@register(2022, 12)
+def _hill_climbing(size: int, rng: np.random.Generator) -> Iterator[str]:
+    """A `size` by `size` height map that rises from "a" on the left to "z" on the right, with `size` at least 26.
+
+    The columns rise by at most one level at a time, and reach "z" in the last column.  Random cells are lowered by up
+    to 2 levels, except on the top row and the last column, so there is always a path from the start "S" at the top
+    left, along the top row and then down the last column to the end "E".
+    """
+    if size < 26:
+        raise ValueError(f"The map must be at least 26 columns wide to rise from a to z, got {size}!")
+
+    letters = np.frombuffer(string.ascii_lowercase.encode(), dtype=np.uint8)
+    heights = np.minimum(np.arange(size) * 26 // size, 25)
+    for start in range(0, size, max(1, _CHUNK_NUM_LINES * 16 // size)):
+        num_rows = min(max(1, _CHUNK_NUM_LINES * 16 // size), size - start)
+        lowering = rng.integers(0, 3, size=(num_rows, size))
+        lowering[:, -1] = 0
+        if start == 0:
+            lowering[0] = 0
+        rows = letters[np.clip(np.broadcast_to(heights, (num_rows, size)) - lowering, 0, 25)]
+        if start == 0:
+            rows[0, 0] = ord("S")
+        if start <= size // 2 < start + num_rows:
+            rows[size // 2 - start, size - 1] = ord("E")
+        yield np.concatenate([rows, np.full((num_rows, 1), ord("\n"), dtype=np.uint8)], axis=1).tobytes().decode()
+
+
+@register(2022, 15)
+def _beacon_exclusion_zone(size: int, rng: np.random.Generator, max_coordinate: int = 4000000) -> Iterator[str]:
+    """`size` sensors (at least 4) around [0, 4000000] squared, leaving a single distress beacon position uncovered.
+
+    The distress beacon is at a random point D.  Four sensors at D + (+-L, +-L), with L = 4000001, each report a
+    beacon at distance 2L - 1, so together they cover the whole square except D.  The other sensors are random points
+    of the square, each reporting its own beacon at a random distance less than its distance to D.  The beacons are not
+    checked against each other: a sensor may be closer to the beacon of another sensor than to its own.
+    """
+    distress = rng.integers(0, max_coordinate + 1, size=2)
+    offset = max_coordinate + 1
+    lines = []
+    for sign_x, sign_y in [(1, 1), (1, -1), (-1, 1), (-1, -1)]:
+        sx, sy = distress + (sign_x * offset, sign_y * offset)
+        # On the far side from D.
+        bx, by = sx + sign_x * (2 * offset - 1), sy
+        lines.append(f"Sensor at x={sx}, y={sy}: closest beacon is at x={bx}, y={by}\n")
+    yield "".join(lines)
+
+    for num_sensors in _chunk_sizes(max(size - 4, 0), chunk_size=1024):
+        sensors = rng.integers(0, max_coordinate + 1, size=(num_sensors, 2))
+        distances = np.abs(sensors - distress).sum(axis=1)
+        # A sensor at D itself has no room for a beacon; move it next to D.
+        sensors[distances == 0, 0] += np.where(distress[0] < max_coordinate, 1, -1)
+        distances = np.maximum(distances, 1)
+
+        radii = (rng.random(size=num_sensors) * distances).astype(np.int64)
+        along_x = (rng.random(size=num_sensors) * (radii + 1)).astype(np.int64)
+        beacons = sensors + np.stack(
+            [
+                along_x * rng.choice([-1, 1], size=num_sensors),
+                (radii - along_x) * rng.choice([-1, 1], size=num_sensors),
+            ],
+            axis=1,
+        )
+        yield "".join(
+            f"Sensor at x={sx}, y={sy}: closest beacon is at x={bx}, y={by}\n"
+            for (sx, sy), (bx, by) in zip(sensors, beacons)
+        )
@@ -0,0 +1,106 @@
+"""Lazy imports of heavy dependencies, and a report of where the import time goes.
+
+Importing `scipy`, `skimage`, `matplotlib` or `networkx` takes longer than solving most of the problems.  A solution
+imports them lazily at the top of the module instead:
+
+    nx = lazy_import("networkx")
+
+and the import only happens when an attribute, e.g., `nx.DiGraph`, is first used.  Annotations using a lazily imported
+module must then be strings, e.g., `-> "nx.DiGraph"`, so defining the function does not trigger the import.
+
+`import_time_report` runs a module under `python -X importtime` to find the imports that are still slow.
+"""
+import importlib
+import re
+import subprocess
+import sys
+import types
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List
+
+# The directory containing the `adventofcode` package and all the `problems_<year>` packages.
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# A line printed by `-X importtime`, e.g., "import time:       512 |       1024 |   numpy.core".
+_IMPORT_TIME_PATTERN = re.compile(r"import time:\s*(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)")
+
+
+class _LazyModule(types.ModuleType):
+    """A placeholder that imports the real module when one of its attributes is first accessed."""
+
+    def __getattr__(self, name: str) -> object:
+        # Only called for attributes that are not found in the placeholder, i.e., before the first import.
+        module = importlib.import_module(self.__name__)
+        # Copy the attributes, so any later access is a plain lookup without going through `__getattr__`.
+        self.__dict__.update(module.__dict__)
+        return getattr(module, name)
+
+    def __repr__(self) -> str:
+        return f"<lazy module {self.__name__!r}>"
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """Returns the module `name`, to be imported on first attribute access.
+
+    If the module is already imported, it is returned as is.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    return _LazyModule(name)
+
+
+@dataclass(frozen=True)
+class ImportTime:
+    """The import time of a module as reported by `-X importtime`.
+
+    Args:
+        module_name: The name of the imported module.
+        self_us: The time in microseconds spent in the module itself.
+        cumulative_us: The time in microseconds including the modules it imported.
+        depth: The nesting level of the import; 0 for modules imported directly by the profiled code.
+    """
+
+    module_name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def import_time_report(module_name: str, run_main: bool = False) -> List[ImportTime]:
+    """Imports `module_name` in a fresh interpreter under `-X importtime` and returns the time of every import.
+
+    If `run_main`, the `main()` of the module is also run (with its output discarded), so the lazy imports it triggers
+    are included.  The imports are returned in the order they completed, as printed by the interpreter.
+    """
+    code = f"import {module_name}"
+    if run_main:
+        code += f"; import contextlib, io; contextlib.redirect_stdout(io.StringIO()).__enter__(); {module_name}.main()"
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=_REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    ret = []
+    for line in process.stderr.splitlines():
+        match = _IMPORT_TIME_PATTERN.match(line)
+        if match is None:
+            continue
+
+        self_us, cumulative_us, indentation, name = match.groups()
+        # Each nesting level is indented by two spaces after the first.
+        ret.append(
+            ImportTime(
+                module_name=name,
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=(len(indentation) - 1) // 2,
+            )
+        )
+
+    return ret
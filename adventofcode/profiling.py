@@ -0,0 +1,262 @@
+"""Opt-in instrumentation of named phases, e.g., parsing and each part of a solution.
+
+Wrap a phase in `phase`, as a context manager or a decorator:
+
+    with phase("parse"):
+        data = _read_data(...)
+
+    @phase("part1")
+    def _part1(data):
+        ...
+
+Profiling is enabled by setting the environment variable `ADVENTOFCODE_PROFILE=1`; otherwise `phase` does nothing.  When
+enabled, each phase records its number of calls, wall time and CPU time, and a sampling profiler records the call stack
+of the thread running the phases every `ADVENTOFCODE_PROFILE_INTERVAL` seconds (defaults to 0.01).  The stacks are
+sampled from a background thread, so the phases run at nearly full speed and their times are representative.
+
+Set `ADVENTOFCODE_PROFILE_MEMORY=1` to also record the peak memory traced by `tracemalloc` in each phase.  Tracing slows
+down every allocation, so the times of such a run are not representative.
+
+Whenever an outermost phase exits, two files are written to `ADVENTOFCODE_PROFILE_DIR` (defaults to `./profiles`):
+
+    profile_<pid>.json: The statistics of each phase, and the number of samples in which each function is on the stack.
+    profile_<pid>.folded: The collapsed stacks ("phase;module:function;... <microseconds>" per line), which can be
+        rendered with `flamegraph.pl` or speedscope.
+"""
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import FrameType
+from typing import Dict, List, Optional, Tuple
+
+_SEPARATOR = ";"
+_DEFAULT_INTERVAL = 0.01
+
+
+def enabled() -> bool:
+    return os.environ.get("ADVENTOFCODE_PROFILE", "0") not in {"", "0"}
+
+
+def memory_enabled() -> bool:
+    return os.environ.get("ADVENTOFCODE_PROFILE_MEMORY", "0") not in {"", "0"}
+
+
+@dataclass
+class PhaseStats:
+    """The accumulated statistics of a phase.
+
+    Args:
+        calls: The number of times the phase was entered.
+        wall_time: The total wall time in seconds.
+        cpu_time: The total CPU time of the process in seconds.
+        peak_memory: The largest peak of memory in bytes traced by `tracemalloc` during a single call, on top of the
+            memory traced when the phase was entered.  Only recorded with `ADVENTOFCODE_PROFILE_MEMORY=1`.
+    """
+
+    calls: int = 0
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    peak_memory: int = 0
+
+
+class _Sampler:
+    """Records the call stacks of the thread running the phases, with the phases inserted as frames.
+
+    A background thread samples the stack every `interval` seconds, and attributes the wall time elapsed since the
+    previous sample to it.  The thread needs the GIL to sample, so while the phases run pure Python code, the samples
+    are at least `sys.getswitchinterval()` apart.
+    """
+
+    def __init__(self) -> None:
+        # The open phases, outermost first, with the frame that entered each.
+        self.phases: List[Tuple[str, FrameType]] = []
+        self.times_by_stack: Dict[str, float] = defaultdict(float)
+        self.samples_by_function: Counter = Counter()
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    def start(self, interval: float) -> None:
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(threading.get_ident(), interval), name="adventofcode-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self, thread_id: int, interval: float) -> None:
+        last_time = time.perf_counter()
+        while not self._stop_event.wait(interval):
+            now = time.perf_counter()
+            self._sample(thread_id=thread_id, elapsed=now - last_time)
+            last_time = now
+
+    def _sample(self, thread_id: int, elapsed: float) -> None:
+        frame = sys._current_frames().get(thread_id)
+        phases = list(self.phases)
+        if frame is None or not phases:
+            return
+
+        phase_names_by_frame = defaultdict(list)
+        for name, entering_frame in phases:
+            phase_names_by_frame[id(entering_frame)].append(name)
+
+        # The frames below the one that entered the outermost phase, innermost first.
+        root_frame = phases[0][1]
+        frames = []
+        while frame is not None and frame is not root_frame:
+            frames.append(frame)
+            frame = frame.f_back
+        if frame is None:
+            # The outermost phase exited since.
+            return
+
+        stack = list(phase_names_by_frame[id(root_frame)])
+        function_names = set()
+        for frame in reversed(frames):
+            # Ignore the profiling machinery itself.
+            if frame.f_code.co_filename == __file__:
+                continue
+
+            function_name = _function_name(frame)
+            function_names.add(function_name)
+            stack.append(function_name)
+            stack.extend(phase_names_by_frame.get(id(frame), []))
+
+        self.times_by_stack[_SEPARATOR.join(stack)] += elapsed
+        self.samples_by_function.update(function_names)
+
+
+def _function_name(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{frame.f_globals.get('__name__', '?')}:{getattr(code, 'co_qualname', code.co_name)}"
+
+
+_stats_by_phase: Dict[str, PhaseStats] = defaultdict(PhaseStats)
+_sampler = _Sampler()
+# Peak memory of the nested phases that already exited, for each phase on the stack tracing memory.
+# `tracemalloc.reset_peak()` is called when a phase is entered, so the peak of an outer phase must include the peaks of
+# its inner phases.
+_nested_peaks: List[int] = []
+# `tracemalloc.reset_peak()` needs Python 3.9.  Without it, the traced peak only grows, so a phase knows its own peak
+# only if it raised the traced peak, and otherwise falls back to the memory traced when it exits.
+_can_reset_peak = hasattr(tracemalloc, "reset_peak")
+
+
+class phase(contextlib.ContextDecorator):
+    """Instruments a named phase; a no-op unless profiling is enabled.  See the module docstring."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._active = False
+        self._traces_memory = False
+        self._started_tracing = False
+
+    def _recreate_cm(self) -> "phase":
+        # A fresh instance for each call of a decorated function, so recursive calls do not share the start times.
+        return phase(self.name)
+
+    def __enter__(self) -> "phase":
+        self._active = enabled()
+        if not self._active:
+            return self
+
+        self._traces_memory = memory_enabled()
+        if self._traces_memory:
+            self._enter_memory_tracing()
+
+        _sampler.phases.append((self.name, sys._getframe(1)))
+        if len(_sampler.phases) == 1:
+            _sampler.start(interval=float(os.environ.get("ADVENTOFCODE_PROFILE_INTERVAL", _DEFAULT_INTERVAL)))
+
+        self._start_wall_time = time.perf_counter()
+        self._start_cpu_time = time.process_time()
+        return self
+
+    def __exit__(self, *args) -> None:
+        if not self._active:
+            return
+
+        wall_time = time.perf_counter() - self._start_wall_time
+        cpu_time = time.process_time() - self._start_cpu_time
+
+        _sampler.phases.pop()
+        is_outermost = not _sampler.phases
+        if is_outermost:
+            _sampler.stop()
+
+        stats = _stats_by_phase[self.name]
+        stats.calls += 1
+        stats.wall_time += wall_time
+        stats.cpu_time += cpu_time
+        if self._traces_memory:
+            stats.peak_memory = max(stats.peak_memory, self._exit_memory_tracing())
+
+        if is_outermost:
+            dump()
+
+    def _enter_memory_tracing(self) -> None:
+        # Tracing started by someone else is left running on exit.
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+
+        self._start_memory, self._start_peak = tracemalloc.get_traced_memory()
+        if _can_reset_peak:
+            if _nested_peaks:
+                _nested_peaks[-1] = max(_nested_peaks[-1], self._start_peak)
+            tracemalloc.reset_peak()
+        _nested_peaks.append(0)
+
+    def _exit_memory_tracing(self) -> int:
+        """Returns the peak traced memory of this call, on top of the memory traced when it was entered."""
+        memory, peak = tracemalloc.get_traced_memory()
+        if not _can_reset_peak and peak == self._start_peak:
+            # The traced peak was reached before this phase.
+            peak = memory
+        peak = max(_nested_peaks.pop(), peak)
+
+        if _nested_peaks:
+            # Let the enclosing phase see this phase's peak.
+            _nested_peaks[-1] = max(_nested_peaks[-1], peak)
+        if self._started_tracing:
+            tracemalloc.stop()
+
+        return peak - self._start_memory
+
+
+def stats() -> Dict[str, PhaseStats]:
+    """Returns the statistics of the phases recorded so far in this process."""
+    return dict(_stats_by_phase)
+
+
+def dump(directory: Optional[Path] = None) -> None:
+    """Writes the phase statistics and the collapsed stacks recorded so far in this process."""
+    directory = Path(directory or os.environ.get("ADVENTOFCODE_PROFILE_DIR", "profiles"))
+    directory.mkdir(parents=True, exist_ok=True)
+
+    with open(directory / f"profile_{os.getpid()}.json", "w") as file:
+        json.dump(
+            {
+                "phases": {name: asdict(x) for name, x in _stats_by_phase.items()},
+                "samples_by_function": dict(_sampler.samples_by_function.most_common()),
+            },
+            file,
+            indent=2,
+        )
+
+    with open(directory / f"profile_{os.getpid()}.folded", "w") as file:
+        for stack_key, elapsed in _sampler.times_by_stack.items():
+            microseconds = round(elapsed * 1e6)
+            if microseconds > 0:
+                file.write(f"{stack_key} {microseconds}\n")
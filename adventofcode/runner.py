@@ -0,0 +1,223 @@
+"""Discovers the solution modules and runs them concurrently in a process pool.
+
+Every `problems_<year>/day<day>/solution*.py` module is a solution module.  The modules of a day are run one after the
+other in the same worker process, and the days are run concurrently, so the total wall time of a run is close to the
+wall time of the slowest day rather than the sum of all days.
+
+Unless disabled, the answers of a solution module are stored in an `AnswerCache`, and reused without running the module
+as long as its source and its input are unchanged.
+"""
+import contextlib
+import importlib
+import io
+import os
+import re
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from adventofcode.cache import AnswerCache
+from adventofcode.profiling import phase
+
+# The directory containing the `adventofcode` package and all the `problems_<year>` packages.
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+_YEAR_PATTERN = re.compile(r"problems_(\d+)")
+_DAY_PATTERN = re.compile(r"day(\d+)")
+
+
+@dataclass(frozen=True)
+class Solution:
+    """A solution module.
+
+    Args:
+        year: The year of the problem.
+        day: The day of the problem.
+        module_name: The fully qualified module name, e.g., "problems_2021.day1.solution_part1".
+    """
+
+    year: int
+    day: int
+    module_name: str
+
+    @property
+    def part_name(self) -> str:
+        """The last component of the module name, e.g., "solution_part1"."""
+        return self.module_name.rsplit(".", 1)[-1]
+
+    @property
+    def file_path(self) -> Path:
+        return REPO_ROOT.joinpath(*self.module_name.split(".")).with_suffix(".py")
+
+    @property
+    def input_path(self) -> Path:
+        return self.file_path.parent / "data.txt"
+
+
+@dataclass
+class DayResult:
+    """The result of running all solution modules of a day.
+
+    Args:
+        year: The year of the problem.
+        day: The day of the problem.
+        answers: The lines printed by each solution module, keyed by the part name (e.g., "solution_part1").
+        wall_time: The wall time in seconds of running all solution modules of the day.
+        error: The formatted traceback if a solution module raised an exception; None otherwise.
+        cached_parts: The part names whose answers were taken from the answer cache instead of being computed.
+    """
+
+    year: int
+    day: int
+    answers: Dict[str, List[str]] = field(default_factory=dict)
+    wall_time: float = 0.0
+    error: Optional[str] = None
+    cached_parts: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def discover_solutions(
+    years: Optional[Iterable[int]] = None, days: Optional[Iterable[int]] = None, root: Path = REPO_ROOT
+) -> List[Solution]:
+    """Returns the solution modules under `root`, sorted by year, day and module name.
+
+    If `years` or `days` is given, only the solutions of the given years or days are returned.
+    """
+    years = set(years) if years is not None else None
+    days = set(days) if days is not None else None
+
+    ret = []
+    for module_path in root.glob("problems_*/day*/solution*.py"):
+        year_match = _YEAR_PATTERN.fullmatch(module_path.parent.parent.name)
+        day_match = _DAY_PATTERN.fullmatch(module_path.parent.name)
+        if year_match is None or day_match is None:
+            continue
+
+        year, day = int(year_match.group(1)), int(day_match.group(1))
+        if (years is not None and year not in years) or (days is not None and day not in days):
+            continue
+
+        module_name = ".".join([module_path.parent.parent.name, module_path.parent.name, module_path.stem])
+        ret.append(Solution(year=year, day=day, module_name=module_name))
+
+    return sorted(ret, key=lambda x: (x.year, x.day, x.module_name))
+
+
+def run(
+    years: Optional[Iterable[int]] = None,
+    days: Optional[Iterable[int]] = None,
+    max_workers: Optional[int] = None,
+    answer_cache: Optional[AnswerCache] = None,
+) -> List[DayResult]:
+    """Runs the selected days concurrently and returns their results, sorted by year and day.
+
+    Each day is run in its own task in a `ProcessPoolExecutor` with `max_workers` processes (defaults to the number of
+    CPUs).  A day that raises an exception does not stop the other days; its traceback is stored in the result.
+
+    If `answer_cache` is given, only the solution modules without stored answers are run, and their answers are stored
+    in the cache afterwards.  A day whose answers are all stored is not submitted to the pool at all.
+    """
+    solutions_by_day: Dict[Tuple[int, int], List[Solution]] = {}
+    for solution in discover_solutions(years=years, days=days):
+        solutions_by_day.setdefault((solution.year, solution.day), []).append(solution)
+
+    results_by_day: Dict[Tuple[int, int], DayResult] = {}
+    solutions_to_run_by_day: Dict[Tuple[int, int], List[Solution]] = {}
+    for day_key, solutions in solutions_by_day.items():
+        result = DayResult(year=day_key[0], day=day_key[1])
+        start_time = time.perf_counter()
+        for solution in solutions:
+            answers = _cached_answers(answer_cache=answer_cache, solution=solution)
+            if answers is None:
+                solutions_to_run_by_day.setdefault(day_key, []).append(solution)
+                continue
+
+            result.answers[solution.part_name] = answers
+            result.cached_parts.append(solution.part_name)
+        result.wall_time = time.perf_counter() - start_time
+        results_by_day[day_key] = result
+
+    if solutions_to_run_by_day:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=initialize_worker) as executor:
+            futures = {x: executor.submit(run_day, solutions) for x, solutions in solutions_to_run_by_day.items()}
+            for day_key, future in futures.items():
+                _merge_day_result(result=results_by_day[day_key], computed_result=future.result())
+
+    if answer_cache is not None:
+        for day_key, solutions in solutions_to_run_by_day.items():
+            result = results_by_day[day_key]
+            for solution in solutions:
+                if solution.part_name in result.answers:
+                    answer_cache.put(
+                        source_path=solution.file_path,
+                        input_path=solution.input_path,
+                        part=solution.part_name,
+                        answers=result.answers[solution.part_name],
+                    )
+        answer_cache.save()
+
+    # Keep the answers in the order of the part names, whether they were cached or computed.
+    for day_key, result in results_by_day.items():
+        result.answers = {
+            x.part_name: result.answers[x.part_name] for x in solutions_by_day[day_key] if x.part_name in result.answers
+        }
+
+    return sorted(results_by_day.values(), key=lambda x: (x.year, x.day))
+
+
+def _cached_answers(answer_cache: Optional[AnswerCache], solution: Solution) -> Optional[List[str]]:
+    if answer_cache is None:
+        return None
+
+    return answer_cache.get(source_path=solution.file_path, input_path=solution.input_path, part=solution.part_name)
+
+
+def _merge_day_result(result: DayResult, computed_result: DayResult) -> None:
+    result.answers.update(computed_result.answers)
+    result.wall_time += computed_result.wall_time
+    result.error = computed_result.error
+
+
+def run_day(solutions: List[Solution]) -> DayResult:
+    """Runs the solution modules of a single day in the current process."""
+    result = DayResult(year=solutions[0].year, day=solutions[0].day)
+
+    start_time = time.perf_counter()
+    for solution in solutions:
+        try:
+            with phase(f"{solution.year}/day{solution.day}/{solution.part_name}"):
+                result.answers[solution.part_name] = _run_module(module_name=solution.module_name)
+        except Exception:
+            result.error = traceback.format_exc()
+            break
+    result.wall_time = time.perf_counter() - start_time
+
+    return result
+
+
+def _run_module(module_name: str) -> List[str]:
+    """Runs the `main()` of a solution module and returns the lines it printed."""
+    module = importlib.import_module(module_name)
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        module.main()
+
+    return [line.rstrip() for line in output.getvalue().splitlines()]
+
+
+def initialize_worker() -> None:
+    """Prepares the current process for running solution modules."""
+    # The solution modules import `adventofcode` and each other by their absolute module names.
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+
+    # Some solutions plot their answers.  Never open a window from a worker process.
+    os.environ.setdefault("MPLBACKEND", "Agg")
@@ -0,0 +1,118 @@
+"""A library interface to the solutions: each day solves `(part1, part2)` from an input text or file, in process.
+
+Every solution module defines `solve(data_file_path)`.  A module solving a single part, e.g., `solution_part1.py`,
+returns the answer of that part, and a module solving both parts, `solution.py`, returns both answers.  `get_solver`
+combines the modules of a day behind the `Solver` interface:
+
+    solver = get_solver(year=2021, day=1)
+    part1, part2 = solver.solve("problems_2021/day1/data.txt")
+    answers = solver.solve_many([text_1, text_2, text_3])
+
+The modules are imported once, so a long-lived process can solve many inputs without paying the interpreter startup and
+the imports each time.  A day with a single part, e.g., day 25, returns None as its second answer.
+"""
+import abc
+import contextlib
+import importlib
+import os
+import re
+import tempfile
+import types
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from adventofcode import runner
+
+Answer = Union[int, str]
+Answers = Tuple[Answer, Optional[Answer]]
+# An input is either its text or the path of its file.
+TextOrPath = Union[str, os.PathLike]
+
+
+class Solver(abc.ABC):
+    """Solves both parts of the problem of a day."""
+
+    @abc.abstractmethod
+    def solve_file(self, data_file_path: str) -> Answers:
+        """Returns the answers of both parts for the input file."""
+
+    def solve(self, text_or_path: TextOrPath) -> Answers:
+        """Returns the answers of both parts for the input.  See `input_file` for how text and paths are told apart."""
+        with input_file(text_or_path) as data_file_path:
+            return self.solve_file(data_file_path)
+
+    def solve_many(self, inputs: Iterable[TextOrPath]) -> List[Answers]:
+        """Returns the answers of each input, in order."""
+        return [self.solve(x) for x in inputs]
+
+
+class ModuleSolver(Solver):
+    """The solver of a day whose solution modules each define `solve(data_file_path)`.
+
+    The answers of the modules are concatenated in the order of the modules, e.g., part 1 then part 2.
+    """
+
+    def __init__(self, modules: Sequence[types.ModuleType]) -> None:
+        self.modules = list(modules)
+
+    def solve_file(self, data_file_path: str) -> Answers:
+        answers = []
+        for module in self.modules:
+            answer = module.solve(data_file_path=data_file_path)
+            answers.extend(answer if isinstance(answer, tuple) else [answer])
+
+        if not 1 <= len(answers) <= 2:
+            raise ValueError(f"Expected the answers of one or two parts, got {len(answers)}!")
+
+        return answers[0], answers[1] if len(answers) == 2 else None
+
+
+def get_solver(year: int, day: int) -> Solver:
+    """Returns the solver of a day, importing its solution modules."""
+    solutions = runner.discover_solutions(years=[year], days=[day])
+    if not solutions:
+        raise KeyError(f"No solution for {year} day {day}!")
+
+    runner.initialize_worker()
+    return ModuleSolver(modules=[importlib.import_module(x.module_name) for x in solutions])
+
+
+def solve(year: int, day: int, text_or_path: Optional[TextOrPath] = None) -> Answers:
+    """Returns the answers of both parts of a day, for the given input or the day's own `data.txt`."""
+    if text_or_path is None:
+        text_or_path = runner.discover_solutions(years=[year], days=[day])[0].input_path
+
+    return get_solver(year=year, day=day).solve(text_or_path)
+
+
+@contextlib.contextmanager
+def input_file(text_or_path: TextOrPath) -> Iterator[str]:
+    """Yields the path of a file containing the input.
+
+    A path-like object, or a string naming an existing file, is used as is.  A single-line string that looks like a
+    path, i.e., containing a path separator or ending with a file extension like ".txt", but that names no file, raises
+    FileNotFoundError.  Any other string is the text of the input, and is written to a temporary file that is removed
+    afterwards.
+    """
+    if isinstance(text_or_path, os.PathLike) or os.path.isfile(text_or_path) or _looks_like_path(text_or_path):
+        if not os.path.isfile(text_or_path):
+            raise FileNotFoundError(f"No input file {os.fspath(text_or_path)}!")
+
+        yield os.fspath(text_or_path)
+        return
+
+    file_descriptor, temporary_path = tempfile.mkstemp(suffix=".txt")
+    try:
+        with os.fdopen(file_descriptor, "w") as file:
+            file.write(text_or_path)
+        yield temporary_path
+    finally:
+        os.unlink(temporary_path)
+
+
+def _looks_like_path(text: str) -> bool:
+    # The single-line puzzle inputs, e.g., "3,4,3,1,2" or "target area: x=20..30, y=-10..-5", have neither.
+    if "\n" in text.strip():
+        return False
+
+    separators = [os.sep] + ([os.altsep] if os.altsep else [])
+    return any(x in text for x in separators) or re.search(r"\.[A-Za-z0-9]+$", text.strip()) is not None
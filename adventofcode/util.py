@@ -1,8 +1,293 @@
 """Utilities for solving Advent of Code problems."""
-from typing import List
+import itertools
+import mmap
+import os
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+# Number of bytes read at a time by `iter_chunks`.  The temporaries of parsing a chunk are a small multiple of this.
+_INT_CHUNK_SIZE = 8 * 1024 * 1024
+# Number of grid cells translated at a time by `parse_grid`.
+_GRID_BLOCK_SIZE = 256 * 1024
+
+_MINUS = ord("-")
+_ZERO = ord("0")
+_NEWLINE = ord("\n")
+_CARRIAGE_RETURN = ord("\r")
+_WHITESPACE = b" \t\r\n"
+# Bytes after which `iter_ints` may cut a chunk: none of them can be part of a number.
+_INT_SEPARATORS = b" \t\n,"
 
 
 def read_lines_stripping_both_ends(file_path: str) -> List[str]:
     """Returns a list of strings representing the lines in the input file, stripped at both ends."""
     with open(file_path, "r") as file:
-        return [x.strip() for x in file.readlines()]
+        return [x.strip() for x in file]
+
+
+class MappedFile:
+    """A read-only memory-mapped file.
+
+    The file content is never copied as a whole: `buffer` and `as_array()` are views of the mapped pages, and
+    `iter_lines()` copies one line at a time.  Use as a context manager:
+
+        with MappedFile(file_path) as mapped_file:
+            for line in mapped_file.iter_lines():
+                ...
+
+    Arrays returned by `as_array()` keep the mapping alive after `close()`; it is unmapped once they are all garbage
+    collected.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        with open(file_path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            # An empty file cannot be mapped.
+            self._mmap = mmap.mmap(file.fileno(), length=0, access=mmap.ACCESS_READ) if size > 0 else None
+
+    def __enter__(self) -> "MappedFile":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._mmap) if self._mmap is not None else 0
+
+    def close(self) -> None:
+        if self._mmap is None:
+            return
+
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Views returned by `as_array()` are still alive; the mapping is released together with them.
+            pass
+
+    def find(self, sub: bytes, start: int = 0) -> int:
+        """Returns the lowest index of `sub` at or after `start`, or -1 if not found."""
+        return self._mmap.find(sub, start) if self._mmap is not None else -1
+
+    @property
+    def buffer(self) -> Union[memoryview, bytes]:
+        """A zero-copy view of the whole file."""
+        return memoryview(self._mmap) if self._mmap is not None else b""
+
+    def as_array(self, dtype: np.dtype = np.uint8) -> np.ndarray:
+        """Returns a read-only, zero-copy array of the file content."""
+        if self._mmap is None:
+            return np.zeros(shape=(0,), dtype=dtype)
+
+        return np.frombuffer(self._mmap, dtype=dtype)
+
+    def iter_lines(self, strip: bool = True) -> Iterator[bytes]:
+        """Lazily yields the lines without the line breaks, stripped at both ends if `strip`.
+
+        A trailing line break does not produce an empty last line.
+        """
+        if self._mmap is None:
+            return
+
+        start = 0
+        length = len(self._mmap)
+        while start < length:
+            end = self._mmap.find(b"\n", start)
+            if end == -1:
+                end = length
+
+            line = self._mmap[start:end]
+            yield line.strip() if strip else line.rstrip(b"\r")
+            start = end + 1
+
+
+def iter_lines(file_path: str, strip: bool = True) -> Iterator[bytes]:
+    """Lazily yields the lines of a file as bytes, without reading the whole file into memory."""
+    with MappedFile(file_path) as mapped_file:
+        yield from mapped_file.iter_lines(strip=strip)
+
+
+def parse_ints(buffer: Union[bytes, memoryview, np.ndarray], signed: bool = True) -> np.ndarray:
+    """Returns all decimal integers in `buffer` as an int64 array, in order of appearance.
+
+    Any byte other than a digit separates the numbers.  If `signed`, a "-" immediately preceding a number makes it
+    negative; pass `signed=False` for inputs using "-" as a separator, e.g., the ranges "2-4,6-8".  The parsing is
+    vectorized over the numbers, and only loops over the digit positions.
+    """
+    chars = np.frombuffer(buffer, dtype=np.uint8) if not isinstance(buffer, np.ndarray) else buffer
+    # Bytes below "0" wrap around to large values, so a single comparison finds the digits.
+    is_digit = (chars - np.uint8(_ZERO)) < 10
+
+    # +1 at the first digit of each number, -1 right after the last.
+    boundaries = np.diff(is_digit.astype(np.int8), prepend=np.int8(0), append=np.int8(0))
+    starts = np.flatnonzero(boundaries == 1)
+    lengths = np.flatnonzero(boundaries == -1) - starts
+    if len(starts) == 0:
+        return np.zeros(shape=(0,), dtype=np.int64)
+
+    max_length = int(lengths.max())
+    if max_length > 18:
+        raise ValueError(f"Numbers with {max_length} digits do not fit in int64!")
+
+    ret = np.zeros(shape=starts.shape, dtype=np.int64)
+    for position in range(max_length):
+        # Only the numbers that are long enough to have a digit at this position.
+        indices = np.flatnonzero(lengths > position)
+        ret[indices] = ret[indices] * 10 + (chars[starts[indices] + position] - _ZERO)
+
+    if signed:
+        has_sign = starts > 0
+        has_sign[has_sign] = chars[starts[has_sign] - 1] == _MINUS
+        ret[has_sign] *= -1
+
+    return ret
+
+
+def read_ints(file_path: str, signed: bool = True, chunk_size: int = _INT_CHUNK_SIZE) -> np.ndarray:
+    """Returns all integers in the file as an int64 array; see `parse_ints`.
+
+    The file is memory-mapped and parsed `chunk_size` bytes at a time (see `iter_ints`), so the memory used on top of
+    the returned array does not grow with the file size.
+    """
+    arrays = list(iter_ints(file_path=file_path, signed=signed, chunk_size=chunk_size))
+    return np.concatenate(arrays) if arrays else np.zeros(shape=(0,), dtype=np.int64)
+
+
+def iter_ints(file_path: str, signed: bool = True, chunk_size: int = _INT_CHUNK_SIZE) -> Iterator[np.ndarray]:
+    """Yields the integers in the file as int64 arrays, one per chunk of about `chunk_size` bytes; see `parse_ints`.
+
+    Only one chunk is parsed at a time (see `iter_chunks`), so files of any size can be consumed with a bounded amount
+    of memory.  The chunks are cut after any separator, so a long comma-separated line is streamed too.
+    """
+    for chars in iter_chunks(file_path=file_path, chunk_size=chunk_size, separators=_INT_SEPARATORS):
+        yield parse_ints(chars, signed=signed)
+
+
+def iter_chunks(file_path: str, chunk_size: int = _INT_CHUNK_SIZE, separators: bytes = b"\n") -> Iterator[np.ndarray]:
+    """Yields the content of the file as uint8 arrays of about `chunk_size` bytes, each ending with a separator.
+
+    The file is memory-mapped and the chunks are zero-copy views of it, only valid until the next chunk is requested.
+    The chunks are cut right after one of the `separators`, by default a line break, so no line is cut in half.
+    """
+    separator_values = list(separators)
+    with MappedFile(file_path) as mapped_file:
+        chars = mapped_file.as_array()
+
+        start = 0
+        while start < len(chars):
+            end = min(start + chunk_size, len(chars))
+            # Extend the chunk to the next separator, looking ahead in growing windows.
+            window_size = 4096
+            while end < len(chars):
+                found = np.flatnonzero(np.isin(chars[end : end + window_size], separator_values))
+                if len(found) > 0:
+                    end += int(found[0]) + 1
+                    break
+
+                end = min(end + window_size, len(chars))
+                window_size *= 2
+
+            yield chars[start:end]
+            start = end
+
+        del chars
+
+
+def iter_batches(values: Iterable[int], batch_size: int = _INT_CHUNK_SIZE // 8) -> Iterator[np.ndarray]:
+    """Yields the integers of an iterable, e.g., a stream of readings, as int64 arrays of up to `batch_size` values."""
+    iterator = iter(values)
+    while True:
+        batch = np.fromiter(itertools.islice(iterator, batch_size), dtype=np.int64)
+        if len(batch) == 0:
+            return
+
+        yield batch
+
+
+def make_lookup_table(values_by_char: Dict[str, int], default: int = 0, dtype: np.dtype = np.uint8) -> np.ndarray:
+    """Returns a 256-entry table mapping each byte to its value, for use with `read_grid` and `parse_grid`.
+
+    Bytes not in `values_by_char` map to `default`.
+    """
+    ret = np.full(shape=(256,), fill_value=default, dtype=dtype)
+    for char, value in values_by_char.items():
+        ret[ord(char)] = value
+    return ret
+
+
+# Maps the characters "0" to "9" to the digits 0 to 9.
+DIGIT_TABLE = make_lookup_table({str(x): x for x in range(10)})
+
+
+def parse_char_grid(buffer: Union[bytes, memoryview, np.ndarray]) -> np.ndarray:
+    """Returns the rectangular grid of characters in `buffer` as a 2D uint8 array of their byte values.
+
+    The returned array is a strided view of `buffer` without the line breaks, so no byte is copied.  Both "\n" and
+    "\r\n" line breaks are supported, and trailing whitespace at the end of the buffer is ignored.
+    """
+    chars = np.frombuffer(buffer, dtype=np.uint8) if not isinstance(buffer, np.ndarray) else buffer
+
+    end = len(chars)
+    while end > 0 and chars[end - 1] in _WHITESPACE:
+        end -= 1
+    if end == 0:
+        return np.zeros(shape=(0, 0), dtype=np.uint8)
+
+    line_breaks = np.flatnonzero(chars[: min(end, 1 << 20)] == _NEWLINE)
+    if len(line_breaks) == 0 and end > 1 << 20:
+        line_breaks = np.flatnonzero(chars[:end] == _NEWLINE)
+    if len(line_breaks) == 0:
+        # A single line, which may not be followed by a line break.
+        return chars[:end].reshape(1, end)
+
+    width = line_breaks[0]
+    line_break_length = 2 if width > 0 and chars[width - 1] == _CARRIAGE_RETURN else 1
+    width -= line_break_length - 1
+    stride = width + line_break_length
+
+    num_rows = (end + line_break_length) // stride
+    if num_rows * stride - line_break_length != end or np.any(chars[width:end:stride] != chars[width]):
+        raise ValueError("The lines of the grid do not have the same length!")
+
+    return np.lib.stride_tricks.as_strided(chars, shape=(num_rows, width), strides=(stride, 1), writeable=False)
+
+
+def parse_grid(
+    buffer: Union[bytes, memoryview, np.ndarray],
+    lookup_table: np.ndarray = DIGIT_TABLE,
+    dtype: Optional[np.dtype] = None,
+) -> np.ndarray:
+    """Returns the rectangular grid of characters in `buffer` as a 2D array of their values in `lookup_table`.
+
+    The array has the dtype of `lookup_table`, unless `dtype` is given.
+    """
+    if dtype is not None:
+        lookup_table = lookup_table.astype(dtype)
+
+    chars = parse_char_grid(buffer)
+    ret = np.empty(shape=chars.shape, dtype=lookup_table.dtype)
+    # Indexing converts the uint8 characters to intp indices.  Doing it a block of rows at a time keeps that temporary
+    # small and in cache, which is about twice as fast as a single `np.take` on a large grid.
+    num_rows_per_block = max(1, _GRID_BLOCK_SIZE // max(1, chars.shape[1]))
+    for start in range(0, chars.shape[0], num_rows_per_block):
+        np.take(lookup_table, chars[start : start + num_rows_per_block], out=ret[start : start + num_rows_per_block])
+
+    return ret
+
+
+def read_char_grid(file_path: str) -> np.ndarray:
+    """Returns the rectangular grid of characters in the file as a 2D uint8 array; see `parse_char_grid`.
+
+    The array is a read-only view of the memory-mapped file.
+    """
+    with MappedFile(file_path) as mapped_file:
+        return parse_char_grid(mapped_file.as_array())
+
+
+def read_grid(file_path: str, lookup_table: np.ndarray = DIGIT_TABLE, dtype: Optional[np.dtype] = None) -> np.ndarray:
+    """Returns the rectangular grid of characters in the file as a 2D array of their values; see `parse_grid`.
+
+    By default, the grid is made of digits, e.g., a height map.
+    """
+    with MappedFile(file_path) as mapped_file:
+        return parse_grid(mapped_file.as_array(), lookup_table=lookup_table, dtype=dtype)
@@ -1,29 +1,52 @@
 """https://adventofcode.com/2021/day/1"""
 import os
 import os.path
-from typing import List
+from typing import Iterable
+
+import numpy as np
+
+from adventofcode.util import iter_ints
 
 
 def main():
-    depths = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print(solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
+
+
+def solve(data_file_path: str) -> int:
+    return count_increases(depth_chunks=iter_ints(file_path=data_file_path), window=1)
+
+
+def count_increases(depth_chunks: Iterable[np.ndarray], window: int = 1) -> int:
+    """Returns the number of times the sum of a sliding window of depths increases, over a stream of depth chunks.
+
+    The depths are consumed chunk by chunk, e.g., from `iter_ints` or `iter_batches`, so a feed of any length can be
+    swept: only the last `window` depths are carried over from one chunk to the next.
+    """
+    if window < 1:
+        raise ValueError(f"The window size must be positive, got {window}!")
 
     count = 0
-    for i in range(len(depths) - 1):
-        if depths[i + 1] > depths[i]:
-            count += 1
+    tail = np.zeros(shape=(0,), dtype=np.int64)
+    for chunk in depth_chunks:
+        depths = np.concatenate([tail, chunk])
+        count += count_window_increases(depths=depths, window=window)
+        # Copy so that the chunk, which may be a view of a large buffer, is not kept alive.
+        tail = depths[-window:].copy()
 
-    print(count)
+    return count
 
 
-def _read_data(data_file_path: str) -> List[int]:
-    with open(data_file_path, "r") as file:
-        lines = file.readlines()
+def count_window_increases(depths: np.ndarray, window: int = 1) -> int:
+    """Returns the number of times the sum of a sliding window of depths increases.
 
-    ret = []
-    for line in lines:
-        ret.append(int(line.lstrip().rstrip()))
+    Two consecutive window sums share all but their first and last depths, so the sum increases iff
+    `depths[i + window] > depths[i]`, which is a single comparison of two views of the array.  No window sum is ever
+    computed, so `depths` can be any int array, e.g., a memory-mapped `np.load(..., mmap_mode="r")`.
+    """
+    if window < 1:
+        raise ValueError(f"The window size must be positive, got {window}!")
 
-    return ret
+    return int(np.count_nonzero(depths[window:] > depths[:-window]))
 
 
 if __name__ == "__main__":
@@ -1,33 +1,19 @@
 """https://adventofcode.com/2021/day/1"""
 import os
 import os.path
-from typing import List
 
-from scipy.signal import convolve
+from adventofcode.util import iter_ints
+from problems_2021.day1.solution_part1 import count_increases
 
+_WINDOW = 3
 
-def main():
-    depths = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
-
-    filtered_depths = convolve(depths, [1, 1, 1], mode="valid", method="direct")
-
-    count = 0
-    for i in range(len(filtered_depths) - 1):
-        if filtered_depths[i + 1] > filtered_depths[i]:
-            count += 1
 
-    print(count)
-
-
-def _read_data(data_file_path: str) -> List[int]:
-    with open(data_file_path, "r") as file:
-        lines = file.readlines()
+def main():
+    print(solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
 
-    ret = []
-    for line in lines:
-        ret.append(int(line.lstrip().rstrip()))
 
-    return ret
+def solve(data_file_path: str) -> int:
+    return count_increases(depth_chunks=iter_ints(file_path=data_file_path), window=_WINDOW)
 
 
 if __name__ == "__main__":
@@ -1,47 +1,113 @@
 """https://adventofcode.com/2021/day/10"""
+import itertools
 import os.path
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
 
+import numpy as np
 
-def _make_translation_table():
-    open_chars = "([{<"
-    close_chars = ")]}>"
-    return str.maketrans(open_chars + close_chars, close_chars + open_chars)
+from adventofcode.util import MappedFile, iter_chunks
 
+_OPEN_CHARS = b"([{<"
+_CLOSE_CHARS = b")]}>"
+# Maps the opening brackets to 0 to 3 and the closing brackets to 4 to 7, so a closing bracket matches the opening
+# bracket 4 below it.  Line breaks and other bytes are left as is, and are all above 7.
+_CODE_TABLE = bytes.maketrans(_OPEN_CHARS + _CLOSE_CHARS, bytes(range(2 * len(_OPEN_CHARS))))
+_NUM_BRACKET_TYPES = len(_OPEN_CHARS)
 
-_SWAP_DIRECTION_TABLE = _make_translation_table()
+# The scores of the first illegal closing bracket, and of each closing bracket completing a line, by bracket type.
+CORRUPTION_SCORES = [3, 57, 1197, 25137]
+COMPLETION_SCORES = [1, 2, 3, 4]
+_COMPLETION_BASE = 5
+
+# Number of bytes of lines checked at a time by a worker of `check_file`.
+_CHUNK_SIZE = 4 * 1024 * 1024
 
 
 def main():
-    lines = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print(solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
+
+
+def solve(data_file_path: str) -> int:
+    corruption_scores, _ = check_file(data_file_path=data_file_path)
+    return int(corruption_scores.sum())
+
+
+def check_file(
+    data_file_path: str, max_workers: Optional[int] = None, chunk_size: int = _CHUNK_SIZE
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the corruption and completion scores of the lines of the file, as arrays in the order of the lines.
+
+    The file is checked in chunks of about `chunk_size` bytes of whole lines.  A file of several chunks is checked
+    across a `ProcessPoolExecutor` with `max_workers` processes (defaults to the number of CPUs); a single chunk, e.g.,
+    the puzzle input, is checked in the current process.  Only the offsets of the chunks are sent to the workers, and
+    each worker maps the file and copies its own chunk, so the file is never held in memory as a whole.
+    """
+    starts = [0]
+    for chunk in iter_chunks(file_path=data_file_path, chunk_size=chunk_size):
+        starts.append(starts[-1] + len(chunk))
+    # An empty file is a single, empty chunk.
+    ends = starts[1:] or [0]
+    starts = starts[: len(ends)]
+
+    if len(starts) == 1:
+        results = [_check_file_slice(data_file_path, starts[0], ends[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_check_file_slice, itertools.repeat(data_file_path), starts, ends))
+
+    corruption_scores = np.concatenate([x for x, _ in results])
+    completion_scores = np.concatenate([x for _, x in results])
+    return corruption_scores, completion_scores
+
+
+def _check_file_slice(data_file_path: str, start: int, end: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the corruption and completion scores of the lines in bytes `start` to `end` of the file."""
+    with MappedFile(data_file_path) as mapped_file:
+        text = bytes(mapped_file.buffer[start:end])
+    return check_lines(text)
+
+
+def check_lines(text: bytes) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the corruption and completion scores of the lines of `text`; see `check_line`.
 
-    print(sum(_check_line(line) for line in lines))
+    The text is translated to bracket codes once, then each line is scanned as a `bytes` object of codes.
+    """
+    corruption_scores = []
+    completion_scores = []
+    for line in text.translate(_CODE_TABLE).split():
+        corruption_score, completion_score = check_line(line)
+        corruption_scores.append(corruption_score)
+        completion_scores.append(completion_score)
 
+    return np.array(corruption_scores, dtype=np.int64), _score_array(completion_scores)
 
-def _read_data(data_file_path: str) -> List[str]:
-    with open(data_file_path, "r") as file:
-        lines = file.readlines()
 
-    return [line.lstrip().rstrip() for line in lines]
+def check_line(codes: bytes) -> Tuple[int, int]:
+    """Returns the corruption and completion scores of a line of bracket codes.
 
+    The corruption score is 0 if the line is not corrupted, and the completion score is 0 if it is corrupted or
+    complete.
+    """
+    stack = bytearray()
+    for code in codes:
+        if code < _NUM_BRACKET_TYPES:
+            stack.append(code)
+        elif not stack or stack.pop() != code - _NUM_BRACKET_TYPES:
+            return CORRUPTION_SCORES[code - _NUM_BRACKET_TYPES], 0
 
-def _check_line(line) -> int:
-    """Returns the penalty score for line."""
-    scores_by_closing_char = {")": 3, "]": 57, "}": 1197, ">": 25137}
-    stack = []
-    for char in line:
-        if char in "([{<":
-            stack.append(char)
-        elif char != _flip_bracket(stack.pop()):
-            return scores_by_closing_char[char]
+    completion_score = 0
+    for code in reversed(stack):
+        completion_score = completion_score * _COMPLETION_BASE + COMPLETION_SCORES[code]
+    return 0, completion_score
 
-    # No corruption found.
-    return 0
 
+def _score_array(scores: List[int]) -> np.ndarray:
+    """Returns the scores as an int64 array, or as an array of Python ints if one of them does not fit in int64."""
+    if scores and max(scores) > np.iinfo(np.int64).max:
+        return np.array(scores, dtype=object)
 
-def _flip_bracket(char: str) -> str:
-    """Returns the opposite bracket."""
-    return char.translate(_SWAP_DIRECTION_TABLE)
+    return np.array(scores, dtype=np.int64)
 
 
 if __name__ == "__main__":
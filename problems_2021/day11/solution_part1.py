@@ -1,65 +1,85 @@
 """https://adventofcode.com/2021/day/11"""
-import itertools
 import os.path
-from typing import List
-from typing import Tuple
 
 import numpy as np
 
+from adventofcode.util import read_grid
 
-def main():
-    energy_level_map = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
-
-    print(sum(_simulate_one_step(energy_level_map) for _ in range(100)))
-
-
-def _read_data(data_file_path: str) -> np.ndarray:
-    with open(data_file_path, "r") as file:
-        lines = file.readlines()
-
-    return np.array([[int(x) for x in line.lstrip().rstrip()] for line in lines], dtype=np.uint8)
-
+# An octopus flashes once its energy level is above this.
+_MAX_ENERGY_LEVEL = 9
+_NUM_STEPS = 100
 
-def _simulate_one_step(energy_level_map: np.ndarray) -> int:
-    """Changes the energy level map in-place; returns the flashes in the current step."""
-    energy_level_map += 1
-    num_flashes = 0
 
-    all_saturated_indices = []
-    while True:
-        saturated_indices = _find_saturated_indices(energy_level_map)
-        if len(saturated_indices) == 0:
-            break
-
-        num_flashes += len(saturated_indices)
-        all_saturated_indices.extend(saturated_indices)
-
-        for i, j in saturated_indices:
-            for neighbor in _find_neighbors((i, j), energy_level_map.shape):
-                if neighbor not in all_saturated_indices:
-                    energy_level_map[neighbor[0], neighbor[1]] += 1
-
-            for i, j in saturated_indices:
-                energy_level_map[i, j] = 0
-
-    for i, j in all_saturated_indices:
-        energy_level_map[i, j] = 0
+def main():
+    print(solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
 
-    return num_flashes
 
+def solve(data_file_path: str) -> int:
+    energy_level_map = EnergyLevelMap(_read_data(data_file_path=data_file_path))
 
-def _find_saturated_indices(energy_level_map: np.ndarray) -> List[Tuple[int, int]]:
-    return [(i.item(), j.item()) for i, j in zip(*np.where(energy_level_map > 9))]
+    return sum(energy_level_map.step() for _ in range(_NUM_STEPS))
 
 
-def _find_neighbors(point: Tuple[int, int], shape: Tuple[int, int]) -> List[Tuple[int, int]]:
-    return [
-        (point[0] + i_offset, point[1] + j_offset)
-        for i_offset, j_offset in itertools.product(range(-1, 2), range(-1, 2))
-        if 0 <= point[0] + i_offset < shape[0]
-        and 0 <= point[1] + j_offset < shape[1]
-        and (i_offset, j_offset) != (0, 0)
-    ]
+def _read_data(data_file_path: str) -> np.ndarray:
+    return read_grid(file_path=data_file_path, dtype=np.uint8)
+
+
+class EnergyLevelMap:
+    """The energy levels of a grid of octopuses, simulated a step at a time.
+
+    A step propagates the flashes in waves over the whole grid: the cells flashing in a wave are a mask, and the number
+    of flashing neighbors of every cell is the 3x3 box sum of that mask, as 2 shifted sums along each axis of a copy
+    padded with zeros.  The arrays are allocated once, so a large map can be simulated for many steps.
+    """
+
+    def __init__(self, energy_levels: np.ndarray) -> None:
+        num_rows, num_cols = energy_levels.shape
+        self.energy_levels = np.array(energy_levels, dtype=np.uint8)
+        # The 0/1 mask of the cells flashing in the current wave, padded with zeros.
+        self._padded_flashing = np.zeros(shape=(num_rows + 2, num_cols + 2), dtype=np.uint8)
+        self._flashing = self._padded_flashing[1:-1, 1:-1]
+        self._flashed = np.zeros(shape=(num_rows, num_cols), dtype=bool)
+        # The number of flashing cells in each vertical run of 3 cells.
+        self._column_sums = np.zeros(shape=(num_rows, num_cols + 2), dtype=np.uint8)
+
+    @property
+    def size(self) -> int:
+        return self.energy_levels.size
+
+    def step(self) -> int:
+        """Simulates a step in-place; returns the number of flashes in the step."""
+        energy_levels = self.energy_levels
+        flashing = self._flashing
+        is_flashing = flashing.view(bool)
+        flashed = self._flashed
+        padded = self._padded_flashing
+        column_sums = self._column_sums
+
+        energy_levels += 1
+        flashed[...] = False
+        np.greater(energy_levels, _MAX_ENERGY_LEVEL, out=is_flashing)
+        num_flashes = 0
+        while True:
+            num_flashing = int(np.count_nonzero(flashing))
+            if num_flashing == 0:
+                break
+
+            num_flashes += num_flashing
+            flashed |= is_flashing
+            # A cell gets at most 8 increments in a step, so resetting the flashing cells to 0 now keeps them from
+            # flashing again.
+            np.copyto(energy_levels, 0, where=is_flashing)
+
+            np.add(padded[:-2], padded[1:-1], out=column_sums)
+            column_sums += padded[2:]
+            energy_levels += column_sums[:, :-2]
+            energy_levels += column_sums[:, 1:-1]
+            energy_levels += column_sums[:, 2:]
+
+            np.greater(energy_levels, _MAX_ENERGY_LEVEL, out=is_flashing)
+
+        np.copyto(energy_levels, 0, where=flashed)
+        return num_flashes
 
 
 if __name__ == "__main__":
@@ -13,9 +13,13 @@ _Graph = Dict[str, Set[str]]
 
 
 def main():
-    graph = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print(solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
 
-    print(_GraphPathFinder(graph=graph).num_paths)
+
+def solve(data_file_path: str) -> int:
+    graph = _read_data(data_file_path=data_file_path)
+
+    return _GraphPathFinder(graph=graph).num_paths
 
 
 def _read_data(data_file_path: str) -> _Graph:
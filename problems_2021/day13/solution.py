@@ -4,31 +4,64 @@ from typing import List
 from typing import Set
 from typing import Tuple
 
-import matplotlib.pyplot as plt
 import numpy as np
 
+from adventofcode.imports import lazy_import
+
+plt = lazy_import("matplotlib.pyplot")
+
 _Point = Tuple[int, int]
 _PointSet = Set[_Point]
 
 
 def main():
-    point_set, fold_instructions = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    num_points, code = solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print("Part 1: ", num_points)
+
+    plt.figure()
+    plt.imshow(np.array([[x == "#" for x in line] for line in code.splitlines()]))
+    plt.title("Part 2")
+    plt.show()
+
+
+def solve(data_file_path: str) -> Tuple[int, str]:
+    """Returns the number of points after the first fold, and the code drawn by the points after all folds."""
+    point_set, fold_instructions = _read_data(data_file_path=data_file_path)
 
     # Part 1.
     _fold(point_set=point_set, axis=fold_instructions[0][0], position=fold_instructions[0][1])
-    print("Part 1: ", len(point_set))
+    num_points = len(point_set)
 
     # Part 2.
     for axis, position in fold_instructions[1:]:
         _fold(point_set=point_set, axis=axis, position=position)
 
+    return num_points, _draw(point_set=point_set)
+
+
+def part1(data: Tuple[_PointSet, List[Tuple[int, int]]]) -> int:
+    """Returns the number of points after the first fold."""
+    point_set, fold_instructions = data
+    point_set = set(point_set)
+    _fold(point_set=point_set, axis=fold_instructions[0][0], position=fold_instructions[0][1])
+    return len(point_set)
+
+
+def part2(data: Tuple[_PointSet, List[Tuple[int, int]]]) -> str:
+    """Returns the code drawn by the points after all folds."""
+    point_set, fold_instructions = data
+    point_set = set(point_set)
+    for axis, position in fold_instructions:
+        _fold(point_set=point_set, axis=axis, position=position)
+    return _draw(point_set=point_set)
+
+
+def _draw(point_set: _PointSet) -> str:
     image = np.zeros(shape=(max(y for y, x in point_set) + 1, max(x for y, x in point_set) + 1), dtype=bool)
     for point in point_set:
         image[point[0], point[1]] = True
-    plt.figure()
-    plt.imshow(image)
-    plt.title("Part 2")
-    plt.show()
+
+    return "\n".join("".join("#" if x else "." for x in row) for row in image)
 
 
 def _read_data(data_file_path: str) -> Tuple[_PointSet, List[Tuple[int, int]]]:
@@ -11,18 +11,20 @@ _InsertionRule = Dict[Tuple[str, str], str]
 
 
 def main():
-    template, insertion_rule = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print(solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
+
+
+def solve(data_file_path: str) -> int:
+    template, insertion_rule = _read_data(data_file_path=data_file_path)
 
     template_as_list = [x for x in template]
     for i in range(10):
         _do_one_step_insertion(template_as_list=template_as_list, insertion_rule=insertion_rule)
 
-    print("".join(template_as_list))
-
     counter = Counter(template_as_list)
     # `most_common` returns a list of the (element, count) tuples.
     most_common = counter.most_common()
-    print(most_common[0][1] - most_common[-1][1])
+    return most_common[0][1] - most_common[-1][1]
 
 
 def _read_data(data_file_path: str) -> Tuple[str, _InsertionRule]:
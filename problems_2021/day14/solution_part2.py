@@ -15,7 +15,11 @@ _InsertionRule = Dict[Tuple[str, str], str]
 
 
 def main():
-    template, insertion_rule = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print(solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
+
+
+def solve(data_file_path: str) -> int:
+    template, insertion_rule = _read_data(data_file_path=data_file_path)
 
     # Find all valid chars.
     all_chars = set()
@@ -44,7 +48,7 @@ def main():
     char_count = Counter({x: y // 2 for x, y in char_count.items()})
 
     most_common = char_count.most_common()
-    print(most_common[0][1] - most_common[-1][1])
+    return most_common[0][1] - most_common[-1][1]
 
 
 def _read_data(data_file_path: str) -> Tuple[str, _InsertionRule]:
@@ -6,26 +6,33 @@ import itertools
 import os.path
 from typing import Tuple
 
-import networkx as nx
 import numpy as np
 
+from adventofcode.imports import lazy_import
+from adventofcode.util import read_grid
+
+nx = lazy_import("networkx")
+
 _Point = Tuple[int, int]
 
 
 def main():
-    risk_level_map = _expand_array_5x(_read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
+    print(solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
+
+
+def solve(data_file_path: str) -> int:
+    risk_level_map = _expand_array_5x(_read_data(data_file_path=data_file_path))
 
     graph = _graph_from_2d_array(risk_level_map)
     path = nx.dijkstra_path(graph, source=(0, 0), target=(risk_level_map.shape[0] - 1, risk_level_map.shape[1] - 1))
-    print(sum(risk_level_map[i, j] for i, j in path[1:]))
+    # The risk levels are uint8, so they are summed as int64 to not overflow.
+    rows, columns = np.array(path[1:], dtype=np.int64).reshape(-1, 2).T
+    return int(risk_level_map[rows, columns].sum(dtype=np.int64))
 
 
 def _read_data(data_file_path: str) -> np.ndarray:
     """Returns the risk level map."""
-    with open(data_file_path, "r") as file:
-        lines = file.readlines()
-
-    return np.array([[int(x) for x in line.lstrip().rstrip()] for line in lines], dtype=np.uint8)
+    return read_grid(file_path=data_file_path)
 
 
 def _expand_array_5x(array: np.ndarray) -> np.ndarray:
@@ -38,7 +45,7 @@ def _expand_array_5x(array: np.ndarray) -> np.ndarray:
     return ret
 
 
-def _graph_from_2d_array(array: np.ndarray) -> nx.DiGraph:
+def _graph_from_2d_array(array: np.ndarray) -> "nx.DiGraph":
     """Returns a directed graph from a 2D array.
 
     Each pixel is a node, and is connected to its 4 neighbors (diagonal neighbors are not connected) with bidirectional
@@ -63,7 +70,7 @@ def _graph_from_2d_array(array: np.ndarray) -> nx.DiGraph:
         if not is_forward:
             start_node, end_node = end_node, start_node
 
-        graph.add_edge(start_node, end_node, weight=array[end_node[0], end_node[1]])
+        graph.add_edge(start_node, end_node, weight=int(array[end_node[0], end_node[1]]))
 
     return graph
 
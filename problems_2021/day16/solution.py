@@ -15,12 +15,22 @@ _LITERAL_TYPE_ID = 4
 
 
 def main():
-    message = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    sum_of_versions, value = solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print(f"Part 1: Sum of all versions is {sum_of_versions}")
+    print(f"Part 2: Evaluated expression is {value}")
 
-    packets = _decode(message)
 
-    print(f"Part 1: Sum of all versions is {_sum_versions(packets)}")
-    print(f"Part 2: Evaluated expression is {_evaluate_expression(packets[0])}")
+def solve(data_file_path: str) -> Tuple[int, int]:
+    packets = _decode(_read_data(data_file_path=data_file_path))
+    return _sum_versions(packets), _evaluate_expression(packets[0])
+
+
+def part1(message: str) -> int:
+    return _sum_versions(_decode(message))
+
+
+def part2(message: str) -> int:
+    return _evaluate_expression(_decode(message)[0])
 
 
 def _read_data(data_file_path: str) -> str:
@@ -26,6 +26,7 @@ Look at all feasible vx's and find the intersection of the n intervals.
 import itertools
 import math
 import os.path
+from typing import List
 from typing import Optional
 from typing import Tuple
 from typing import Union
@@ -37,7 +38,29 @@ _Interval = Tuple[int, Union[int, float]]
 
 
 def main():
-    x_interval, y_interval = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    highest_y, num_velocities = solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print(highest_y)
+    print(num_velocities)
+
+
+def solve(data_file_path: str) -> Tuple[int, int]:
+    vxs_and_vys = _feasible_velocities(_read_data(data_file_path=data_file_path))
+
+    # Part 1 and part 2.
+    return _max_height(vxs_and_vys=vxs_and_vys), len(vxs_and_vys)
+
+
+def part1(intervals: Tuple[_Interval, _Interval]) -> int:
+    return _max_height(vxs_and_vys=_feasible_velocities(intervals))
+
+
+def part2(intervals: Tuple[_Interval, _Interval]) -> int:
+    return len(_feasible_velocities(intervals))
+
+
+def _feasible_velocities(intervals: Tuple[_Interval, _Interval]) -> List[Tuple[int, int]]:
+    """Returns all (vx, vy) initial velocities for which the probe is within the target area after some step."""
+    x_interval, y_interval = intervals
 
     feasible_vx_interval = _find_feasible_vx_interval(x_interval=x_interval)
     n_intervals_by_vx = {}
@@ -61,11 +84,11 @@ def main():
         if _intervals_have_overlap(n_intervals_by_vx[vx], n_intervals_by_vy[vy]):
             vxs_and_vys.append((vx, vy))
 
-    # Part 1.
-    print(max(_highest_y(vy) for vy in set(vy_ for vx_, vy_ in vxs_and_vys)))
+    return vxs_and_vys
+
 
-    # Part 2
-    print(len(vxs_and_vys))
+def _max_height(vxs_and_vys: List[Tuple[int, int]]) -> int:
+    return max(_highest_y(vy) for vy in set(vy_ for vx_, vy_ in vxs_and_vys))
 
 
 def _read_data(data_file_path: str) -> Tuple[_Interval, _Interval]:
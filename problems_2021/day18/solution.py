@@ -6,32 +6,44 @@ from typing import List
 from typing import Optional
 from typing import Tuple
 
-from binarytree import Node
+from adventofcode.imports import lazy_import
+from adventofcode.profiling import phase
+
+binarytree = lazy_import("binarytree")
 
 
 def main():
-    root_nodes = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    magnitude, max_sum_of_two = solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print("Part 1: ", magnitude)
+    print("Part 2: ", max_sum_of_two)
+
 
-    summed = root_nodes[0]
-    for root in root_nodes[1:]:
-        summed = _add(summed, root)
+def solve(data_file_path: str) -> Tuple[int, int]:
+    with phase("parse"):
+        root_nodes = _read_data(data_file_path=data_file_path)
 
-    print("Part 1: ", _calculate_magnitude(summed))
+    with phase("part1"):
+        summed = root_nodes[0]
+        for root in root_nodes[1:]:
+            summed = _add(summed, root)
+    magnitude = _calculate_magnitude(summed)
 
     max_sum_of_two = -float("inf")
     num_numbers = len(root_nodes)
-    for i, j in itertools.product(range(num_numbers), range(num_numbers)):
-        if i == j:
-            continue
+    with phase("part2"):
+        for i, j in itertools.product(range(num_numbers), range(num_numbers)):
+            if i == j:
+                continue
 
-        root_nodes = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
-        current_sum = _calculate_magnitude(_add(root_nodes[i], root_nodes[j]))
-        if current_sum > max_sum_of_two:
-            max_sum_of_two = current_sum
-    print("Part 2: ", max_sum_of_two)
+            root_nodes = _read_data(data_file_path=data_file_path)
+            current_sum = _calculate_magnitude(_add(root_nodes[i], root_nodes[j]))
+            if current_sum > max_sum_of_two:
+                max_sum_of_two = current_sum
+
+    return magnitude, max_sum_of_two
 
 
-def _read_data(data_file_path: str) -> List[Node]:
+def _read_data(data_file_path: str) -> List["binarytree.Node"]:
     """Returns a list of snailfish numbers as a list of root nodes for binary trees."""
     with open(data_file_path, "r") as file:
         lines = file.readlines()
@@ -39,14 +51,14 @@ def _read_data(data_file_path: str) -> List[Node]:
     ret = []
     for line in lines:
         num_as_list = json.loads(line.lstrip().rstrip())
-        root_node = Node(value=-1)
+        root_node = binarytree.Node(value=-1)
         _build_binary_tree(num_as_list, root_node)
         ret.append(root_node)
 
     return ret
 
 
-def _build_binary_tree(tree_as_list: List, root_node: Node) -> None:
+def _build_binary_tree(tree_as_list: List, root_node: "binarytree.Node") -> None:
     """Builds a binary tree off of `root_node` from `tree_as_list`.
 
     For nodes that do not have a value but only have left and right children, use -1 as the value.
@@ -54,19 +66,19 @@ def _build_binary_tree(tree_as_list: List, root_node: Node) -> None:
     left, right = tree_as_list
 
     if isinstance(left, int):
-        root_node.left = Node(value=left)
+        root_node.left = binarytree.Node(value=left)
     else:
-        root_node.left = Node(value=-1)
+        root_node.left = binarytree.Node(value=-1)
         _build_binary_tree(tree_as_list=left, root_node=root_node.left)
 
     if isinstance(right, int):
-        root_node.right = Node(value=right)
+        root_node.right = binarytree.Node(value=right)
     else:
-        root_node.right = Node(value=-1)
+        root_node.right = binarytree.Node(value=-1)
         _build_binary_tree(tree_as_list=right, root_node=root_node.right)
 
 
-def _inorder_traversal(node: Node, depth: int) -> List[Tuple[Node, int]]:
+def _inorder_traversal(node: "binarytree.Node", depth: int) -> List[Tuple["binarytree.Node", int]]:
     """Appends a list of (node, depth) pairs to the input `nodes_and_depths`.
 
     The real root node has depth of 0.
@@ -77,8 +89,8 @@ def _inorder_traversal(node: Node, depth: int) -> List[Tuple[Node, int]]:
     return _inorder_traversal(node.left, depth + 1) + [(node, depth)] + _inorder_traversal(node.right, depth + 1)
 
 
-def _add(first_root: Node, second_root: Node) -> Node:
-    new_root = Node(-1, left=first_root, right=second_root)
+def _add(first_root: "binarytree.Node", second_root: "binarytree.Node") -> "binarytree.Node":
+    new_root = binarytree.Node(-1, left=first_root, right=second_root)
 
     # Traverse all the nodes while giving out the depth (root has depth of 0) of each node. Then for the nodes at depth
     # of 4, check whether it has children that have left and right children. If so, execute the explosion rule. If there
@@ -95,14 +107,14 @@ def _add(first_root: Node, second_root: Node) -> Node:
         if node_for_splitting is None:
             break
 
-        node_for_splitting.left = Node(node_for_splitting.value // 2)
-        node_for_splitting.right = Node(node_for_splitting.value - node_for_splitting.value // 2)
+        node_for_splitting.left = binarytree.Node(node_for_splitting.value // 2)
+        node_for_splitting.right = binarytree.Node(node_for_splitting.value - node_for_splitting.value // 2)
         node_for_splitting.value = -1
 
     return new_root
 
 
-def _parent_node_index_for_explosion(nodes_and_depths: List[Tuple[Node, int]]) -> Optional[int]:
+def _parent_node_index_for_explosion(nodes_and_depths: List[Tuple["binarytree.Node", int]]) -> Optional[int]:
     """Returns the index of the node in `nodes_and_depths` that should undergo explosion.
 
     Returns None if it does not exist.
@@ -114,7 +126,7 @@ def _parent_node_index_for_explosion(nodes_and_depths: List[Tuple[Node, int]]) -
     return None
 
 
-def _execute_explosion(inorder_nodes: List[Node], parent_node_index: int) -> None:
+def _execute_explosion(inorder_nodes: List["binarytree.Node"], parent_node_index: int) -> None:
     node_to_explode = inorder_nodes[parent_node_index]
 
     for i in range(parent_node_index - 2, -1, -1):
@@ -132,7 +144,7 @@ def _execute_explosion(inorder_nodes: List[Node], parent_node_index: int) -> Non
     node_to_explode.right = None
 
 
-def _node_for_splitting(nodes_and_depths: List[Tuple[Node, int]]) -> Optional[Node]:
+def _node_for_splitting(nodes_and_depths: List[Tuple["binarytree.Node", int]]) -> Optional["binarytree.Node"]:
     for node, depth in nodes_and_depths:
         if node.value >= 10:
             return node
@@ -140,7 +152,7 @@ def _node_for_splitting(nodes_and_depths: List[Tuple[Node, int]]) -> Optional[No
     return None
 
 
-def _calculate_magnitude(root: Node) -> int:
+def _calculate_magnitude(root: "binarytree.Node") -> int:
     if root.value != -1:
         return root.value
 
@@ -13,9 +13,13 @@ from typing import Optional
 from typing import Set
 from typing import Tuple
 
-import networkx as nx
 import numpy as np
 
+from adventofcode.cache import cached_parser
+from adventofcode.imports import lazy_import
+
+nx = lazy_import("networkx")
+
 # 3D point in x, y, z.
 _3DPoint = Tuple[int, int, int]
 
@@ -29,8 +33,30 @@ _MIN_NUM_COMMON_BEACONS: int = 12
 
 
 def main():
-    point_sets = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    num_beacons, max_distance = solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print("Part 1: ", num_beacons)
+    print("Part 2: ", max_distance)
+
+
+def solve(data_file_path: str) -> Tuple[int, int]:
+    point_sets = _read_data(data_file_path=data_file_path)
+
+    transformation_matrices = _align_scanners(point_sets)
+    return _num_beacons(point_sets, transformation_matrices), _max_distance(transformation_matrices)
+
 
+def part1(point_sets: List[Set[_3DPoint]]) -> int:
+    """Returns the number of beacons."""
+    return _num_beacons(point_sets, _align_scanners(point_sets))
+
+
+def part2(point_sets: List[Set[_3DPoint]]) -> int:
+    """Returns the largest Manhattan distance between two scanners."""
+    return _max_distance(_align_scanners(point_sets))
+
+
+def _align_scanners(point_sets: List[Set[_3DPoint]]) -> List[np.ndarray]:
+    """Returns the transformation matrix from each scanner to scanner 0."""
     num_scanners = len(point_sets)
     # A directed graph whose edges store the transformation matrix between scanner pairs (as attribute
     # "local_transformation") and whose nodes store the transformation matrix between each scanner and scanner 0 (as
@@ -53,12 +79,15 @@ def main():
                 second_scanner_index, first_scanner_index, local_transformation=np.linalg.inv(transformation_matrix)
             )
 
-    transformation_matrices: List[np.ndarray] = _find_global_transformation_matrices(graph)
-    all_beacons = _gather_points(point_sets, transformation_matrices)
+    return _find_global_transformation_matrices(graph)
 
-    print("Part 1: ", len(all_beacons))
 
-    max_distance = max(
+def _num_beacons(point_sets: List[Set[_3DPoint]], transformation_matrices: List[np.ndarray]) -> int:
+    return len(_gather_points(point_sets, transformation_matrices))
+
+
+def _max_distance(transformation_matrices: List[np.ndarray]) -> int:
+    return max(
         int(
             np.sum(
                 np.abs(
@@ -67,11 +96,11 @@ def main():
                 )
             )
         )
-        for first_scanner_index, second_scanner_index in itertools.combinations(range(num_scanners), 2)
+        for first_scanner_index, second_scanner_index in itertools.combinations(range(len(transformation_matrices)), 2)
     )
-    print("Part 2: ", max_distance)
 
 
+@cached_parser
 def _read_data(data_file_path: str) -> List[Set[_3DPoint]]:
     """Returns a list 3D point lists, each representing the points detected by a single scanner."""
     with open(data_file_path, "r") as file:
@@ -170,7 +199,7 @@ def _transformation_matrix_from_rotation_and_shift(rotation: _Rotation, shift: _
     return ret
 
 
-def _find_global_transformation_matrices(graph: nx.DiGraph) -> List[np.ndarray]:
+def _find_global_transformation_matrices(graph: "nx.DiGraph") -> List[np.ndarray]:
     """Returns a list of transformation matrices of each scanner w.r.t. the 0th scanner."""
     nx.set_node_attributes(graph, {0: np.eye(4)}, "global_transformation")
     for next_node, previous_node in nx.dfs_predecessors(graph, 0).items():
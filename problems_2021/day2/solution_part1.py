@@ -1,35 +1,48 @@
 """https://adventofcode.com/2021/day/2"""
 import os
 import os.path
-from typing import List, Tuple
+from typing import Iterator, Tuple
+
+import numpy as np
+
+from adventofcode.util import iter_chunks, parse_ints
+
+_DOWN = ord("d")
+_UP = ord("u")
+_FORWARD = ord("f")
 
 
 def main():
-    vectors = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print(solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
+
 
-    final_position = (sum([x[0] for x in vectors]), sum([x[1] for x in vectors]))
-    print(final_position[0] * final_position[1])
+def solve(data_file_path: str) -> int:
+    depth = horizontal_position = 0
+    for vertical, forward in iter_commands(data_file_path=data_file_path):
+        depth += int(vertical.sum())
+        horizontal_position += int(forward.sum())
 
+    return depth * horizontal_position
 
-def _read_data(data_file_path: str) -> List[Tuple[int, int]]:
-    """Returns the (y, x) vector of all steps."""
-    with open(data_file_path, "r") as file:
-        lines = file.readlines()
 
-    ret = []
-    for line in lines:
-        command, distance = line.lstrip().rstrip().split()
-        distance = int(distance)
+def iter_commands(data_file_path: str) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Yields the commands as (vertical, forward) int64 arrays, one pair per chunk of the file.
 
-        if command == "forward":
-            vector = (0, distance)
-        elif command == "up":
-            vector = (-distance, 0)
-        else:
-            vector = (distance, 0)
-        ret.append(vector)
+    A "down X" command is a vertical X, an "up X" is a vertical -X, and a "forward X" is a forward X; the other entry
+    of each command is 0.  Every command is recognized by the first letter of its line, so the chunks are decoded
+    without splitting the lines.
+    """
+    for chars in iter_chunks(file_path=data_file_path):
+        # The first letter of each command is a letter preceded by a non-letter, or by nothing.
+        is_letter = chars >= ord("a")
+        first_letters = chars[np.flatnonzero(is_letter & ~np.concatenate([[False], is_letter[:-1]]))]
+        distances = parse_ints(chars, signed=False)
+        if len(first_letters) != len(distances):
+            raise ValueError(f"Got {len(first_letters)} commands but {len(distances)} distances!")
 
-    return ret
+        vertical = np.where(first_letters == _DOWN, distances, 0) - np.where(first_letters == _UP, distances, 0)
+        forward = np.where(first_letters == _FORWARD, distances, 0)
+        yield vertical, forward
 
 
 if __name__ == "__main__":
@@ -1,40 +1,29 @@
 """https://adventofcode.com/2021/day/2"""
 import os
 import os.path
-from typing import List, Tuple
 
+import numpy as np
 
-def main():
-    commands_and_distances = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
-
-    y, x, aim = 0, 0, 0
-
-    for command, distance in commands_and_distances:
-        if command == "down":
-            aim += distance
-        elif command == "up":
-            aim -= distance
-        else:
-            x += distance
-            y += aim * distance
-
-        print(y, x, aim)
+from problems_2021.day2.solution_part1 import iter_commands
 
-    print(y * x)
 
-
-def _read_data(data_file_path: str) -> List[Tuple[str, int]]:
-    """Returns the (command, distance) tuples of all steps."""
-    with open(data_file_path, "r") as file:
-        lines = file.readlines()
-
-    ret = []
-    for line in lines:
-        command, distance = line.lstrip().rstrip().split()
-        distance = int(distance)
-        ret.append((command, distance))
-
-    return ret
+def main():
+    print(solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
+
+
+def solve(data_file_path: str) -> int:
+    depth = horizontal_position = aim = 0
+    for vertical, forward in iter_commands(data_file_path=data_file_path):
+        # Only the forward commands change the depth, by the aim times their distance.  The aim carried over from the
+        # previous chunks is applied to the chunk's total forward distance as a Python int, so the products of the
+        # chunk itself stay small enough for int64 however long the course is.
+        aims = np.cumsum(vertical)
+        chunk_forward = int(forward.sum())
+        depth += aim * chunk_forward + int(np.dot(aims, forward))
+        horizontal_position += chunk_forward
+        aim += int(aims[-1]) if len(aims) > 0 else 0
+
+    return depth * horizontal_position
 
 
 if __name__ == "__main__":
@@ -8,12 +8,29 @@ import numpy as np
 
 
 def main():
-    algorithm, input_image = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    num_lit_2, num_lit_50 = solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print("Part 1: ", num_lit_2)
+    print("Part 2: ", num_lit_50)
 
-    print("Part 1: ", np.sum(_enhance_image(input_image=input_image, pad_value=0, algorithm=algorithm, num_times=2)[0]))
-    print(
-        "Part 2: ", np.sum(_enhance_image(input_image=input_image, pad_value=0, algorithm=algorithm, num_times=50)[0])
-    )
+
+def solve(data_file_path: str) -> Tuple[int, int]:
+    data = _read_data(data_file_path=data_file_path)
+    return part1(data), part2(data)
+
+
+def part1(data: Tuple[np.ndarray, np.ndarray]) -> int:
+    return _num_lit_pixels(data=data, num_times=2)
+
+
+def part2(data: Tuple[np.ndarray, np.ndarray]) -> int:
+    return _num_lit_pixels(data=data, num_times=50)
+
+
+def _num_lit_pixels(data: Tuple[np.ndarray, np.ndarray], num_times: int) -> int:
+    algorithm, input_image = data
+    return np.sum(
+        _enhance_image(input_image=input_image, pad_value=0, algorithm=algorithm, num_times=num_times)[0]
+    ).item()
 
 
 def _read_data(data_file_path: str) -> Tuple[np.ndarray, np.ndarray]:
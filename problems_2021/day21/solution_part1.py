@@ -1,9 +1,26 @@
 """https://adventofcode.com/2021/day/21."""
+import os.path
+from typing import Tuple
+
+from adventofcode.util import read_lines_stripping_both_ends
 
 
 def main():
-    game = _Game(6, 10, _DeterministicDice())
-    print(game.num_rolls * game.score_of_losing_player)
+    print(solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
+
+
+def solve(data_file_path: str) -> int:
+    position_1, position_2 = _read_data(data_file_path=data_file_path)
+    game = _Game(position_1, position_2, _DeterministicDice())
+    return game.num_rolls * game.score_of_losing_player
+
+
+def _read_data(data_file_path: str) -> Tuple[int, int]:
+    """Returns the starting positions of the two players."""
+    position_1, position_2 = (
+        int(x.rsplit(" ", 1)[1]) for x in read_lines_stripping_both_ends(file_path=data_file_path)
+    )
+    return position_1, position_2
 
 
 class _DeterministicDice:
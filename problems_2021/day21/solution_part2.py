@@ -5,9 +5,12 @@ The two players can be decoupled to reduce the complexity.
 """
 import functools
 import itertools
+import os.path
 from collections import Counter
 from typing import Tuple, Dict
 
+from adventofcode.util import read_lines_stripping_both_ends
+
 # A player status is defined as the current position and the current score.
 _PlayerStatus = Tuple[int, int]
 _GameStatus = Tuple[_PlayerStatus, _PlayerStatus]
@@ -16,7 +19,20 @@ _WINNING_SCORE = 21
 
 
 def main():
-    print(max(_nums_win(game_status=((6, 0), (10, 0)))))
+    print(solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
+
+
+def solve(data_file_path: str) -> int:
+    position_1, position_2 = _read_data(data_file_path=data_file_path)
+    return max(_nums_win(game_status=((position_1, 0), (position_2, 0))))
+
+
+def _read_data(data_file_path: str) -> Tuple[int, int]:
+    """Returns the starting positions of the two players."""
+    position_1, position_2 = (
+        int(x.rsplit(" ", 1)[1]) for x in read_lines_stripping_both_ends(file_path=data_file_path)
+    )
+    return position_1, position_2
 
 
 @functools.lru_cache(maxsize=None)
@@ -12,7 +12,11 @@ _Step = Tuple[bool, Tuple[_Interval, _Interval, _Interval]]
 
 
 def main():
-    steps = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print(solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
+
+
+def solve(data_file_path: str) -> int:
+    steps = _read_data(data_file_path=data_file_path)
 
     # Part 1.
     # Array has dims of y, x, z.
@@ -34,7 +38,7 @@ def main():
             )
         array[slice_3d] = to_turn_on
 
-    print(np.sum(array).item())
+    return np.sum(array).item()
 
 
 def _read_data(data_file_path: str) -> List[_Step]:
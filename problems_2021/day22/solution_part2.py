@@ -18,7 +18,11 @@ _Step = Tuple[bool, _Interval3D]
 
 
 def main():
-    steps = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print(solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
+
+
+def solve(data_file_path: str) -> int:
+    steps = _read_data(data_file_path=data_file_path)
 
     cuboid_collection = _CuboidCollection()
     for to_turn_on, interval_3d in steps:
@@ -27,7 +31,7 @@ def main():
         else:
             cuboid_collection.subtract(_Cuboid(interval_3d=interval_3d))
 
-    print(cuboid_collection.total_volume)
+    return cuboid_collection.total_volume
 
 
 def _read_data(data_file_path: str) -> List[_Step]:
@@ -1,5 +1,6 @@
 """https://adventofcode.com/2021/day/23."""
 import functools
+import os.path
 from typing import List
 from typing import Set
 from typing import Tuple
@@ -31,20 +32,37 @@ _EXAMPLE_START_STATUS = (
     ((3, 1), (1, 8), False),
 )
 
-_TEST_START_STATUS = (
-    ((0, 0), (2, 6), False),
-    ((0, 1), (2, 8), False),
-    ((1, 0), (1, 2), False),
-    ((1, 1), (1, 8), False),
-    ((2, 0), (1, 4), False),
-    ((2, 1), (1, 6), False),
-    ((3, 0), (2, 2), False),
-    ((3, 1), (2, 4), False),
-)
-
 
 def main():
-    print(lowest_cost_and_moves(game_status=_TEST_START_STATUS))
+    print(solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
+
+
+def solve(data_file_path: str) -> int:
+    return lowest_cost_and_moves(game_status=_read_data(data_file_path=data_file_path))[0]
+
+
+def _read_data(data_file_path: str) -> _GameStatus:
+    with open(data_file_path, "r") as file:
+        lines = file.readlines()
+
+    # The rows of the rooms follow the wall and the hallway; the columns of the map are offset by the left wall.
+    types_by_position = {
+        (row_idx, col_idx): "ABCD".index(lines[row_idx + 1][col_idx + 1])
+        for row_idx in range(1, _ROOM_DEPTH + 1)
+        for col_idx in _HOME_COLUMNS_BY_AMPHIPOD_TYPE.values()
+    }
+
+    ret = []
+    num_amphipods_by_type = {x: 0 for x in _HOME_COLUMNS_BY_AMPHIPOD_TYPE}
+    for (row_idx, col_idx), amphipod_type in types_by_position.items():
+        # An amphipod is home if it is in its own room, and so are all the amphipods below it.
+        at_home = col_idx == _HOME_COLUMNS_BY_AMPHIPOD_TYPE[amphipod_type] and all(
+            types_by_position[(x, col_idx)] == amphipod_type for x in range(row_idx, _ROOM_DEPTH + 1)
+        )
+        ret.append(((amphipod_type, num_amphipods_by_type[amphipod_type]), (row_idx, col_idx), at_home))
+        num_amphipods_by_type[amphipod_type] += 1
+
+    return tuple(sorted(ret))
 
 
 @functools.lru_cache(maxsize=None)
@@ -1,5 +1,6 @@
 """https://adventofcode.com/2021/day/23."""
 import functools
+import os.path
 from typing import List
 from typing import Set
 from typing import Tuple
@@ -17,6 +18,8 @@ _Move = Tuple[int, _Position, _Position]
 _HOME_COLUMNS_BY_AMPHIPOD_TYPE = {0: 2, 1: 4, 2: 6, 3: 8}
 _HALLWAY_VALID_X_POSITIONS = {0, 1, 3, 5, 7, 9, 10}
 _ROOM_DEPTH = 4
+# The lines to unfold between the two lines of the rooms in the input.
+_UNFOLDED_LINES = ["  #D#C#B#A#\n", "  #D#B#A#C#\n"]
 
 
 _EXAMPLE_START_STATUS: _GameStatus = (
@@ -38,29 +41,37 @@ _EXAMPLE_START_STATUS: _GameStatus = (
     (3, (1, 8), False),
 )
 
-_TEST_START_STATUS: _GameStatus = (
-    (0, (4, 6), False),
-    (0, (4, 8), False),
-    (0, (3, 6), False),
-    (0, (2, 8), False),
-    (1, (1, 2), False),
-    (1, (1, 8), False),
-    (1, (3, 4), False),
-    (1, (2, 6), False),
-    (2, (1, 4), False),
-    (2, (1, 6), False),
-    (2, (2, 4), False),
-    (2, (3, 8), False),
-    (3, (4, 2), False),
-    (3, (4, 4), False),
-    (3, (2, 2), False),
-    (3, (3, 2), False),
-)
-
 
 def main():
+    print(solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
+
+
+def solve(data_file_path: str) -> int:
+    return lowest_cost_and_moves(game_status=_read_data(data_file_path=data_file_path))[0]
+
+
+def _read_data(data_file_path: str) -> _GameStatus:
+    with open(data_file_path, "r") as file:
+        lines = file.readlines()
+    lines = lines[:3] + _UNFOLDED_LINES + lines[3:]
+
+    # The rows of the rooms follow the wall and the hallway; the columns of the map are offset by the left wall.
+    types_by_position = {
+        (row_idx, col_idx): "ABCD".index(lines[row_idx + 1][col_idx + 1])
+        for row_idx in range(1, _ROOM_DEPTH + 1)
+        for col_idx in _HOME_COLUMNS_BY_AMPHIPOD_TYPE.values()
+    }
+
+    ret = []
+    for (row_idx, col_idx), amphipod_type in types_by_position.items():
+        # An amphipod is home if it is in its own room, and so are all the amphipods below it.
+        at_home = col_idx == _HOME_COLUMNS_BY_AMPHIPOD_TYPE[amphipod_type] and all(
+            types_by_position[(x, col_idx)] == amphipod_type for x in range(row_idx, _ROOM_DEPTH + 1)
+        )
+        ret.append((amphipod_type, (row_idx, col_idx), at_home))
+
     # Sort the game status so that an identical game status can always be fetched from function cache.
-    print(lowest_cost_and_moves(game_status=tuple(sorted(_TEST_START_STATUS))))
+    return tuple(sorted(ret))
 
 
 @functools.lru_cache(maxsize=None)
@@ -17,7 +17,7 @@ w_i is a number between 1 and 9, there is at most a single w_i that satisfies th
 satisfy the condition).
 """
 import functools
-from typing import Optional, Tuple
+from typing import Optional, Sequence, Tuple
 
 MODEL_NUM_LENGTH = 14
 
@@ -25,6 +25,7 @@ MODEL_NUM_LENGTH = 14
 Program = Tuple[int, int, Optional[int]]
 
 
+# The programs of the MONAD program in the puzzle input, which is not in the repository.
 PROGRAMS = [
     (0, 6, None),
     (0, 14, None),
@@ -44,20 +45,52 @@ PROGRAMS = [
 
 
 def main():
-    print("Part 1: ", _find_extreme_number())
-    print("Part 2: ", _find_extreme_number(largest=False))
+    largest, smallest = _extreme_numbers(programs=tuple(PROGRAMS))
+    print("Part 1: ", largest)
+    print("Part 2: ", smallest)
+
+
+def solve(data_file_path: str) -> Tuple[int, int]:
+    return _extreme_numbers(programs=_read_data(data_file_path=data_file_path))
+
+
+def _read_data(data_file_path: str) -> Tuple[Program, ...]:
+    """Returns the programs of a MONAD program, which has a block of 18 instructions per digit."""
+    with open(data_file_path, "r") as file:
+        instructions = [x.split() for x in file.read().strip().splitlines()]
+
+    ret = []
+    for start in range(0, len(instructions), 18):
+        block = instructions[start : start + 18]
+        # "div z 26" makes a type-1 program; its alpha is in "add x <alpha>" and its beta in "add y <beta>".  A type-0
+        # program only adds "add y <alpha>" to the digit.
+        if block[4][2] == "26":
+            ret.append((1, int(block[5][2]), int(block[15][2])))
+        else:
+            ret.append((0, int(block[15][2]), None))
+
+    return tuple(ret)
+
+
+def _extreme_numbers(programs: Tuple[Program, ...]) -> Tuple[int, int]:
+    """Returns the largest and the smallest valid model numbers."""
+    return int(_find_extreme_number(programs=programs)), int(_find_extreme_number(programs=programs, largest=False))
 
 
 @functools.lru_cache(maxsize=None)
-def _find_extreme_number(digit_position: int = 0, z: int = 0, largest: bool = True) -> Optional[str]:
+def _find_extreme_number(
+    programs: Sequence[Program], digit_position: int = 0, z: int = 0, largest: bool = True
+) -> Optional[str]:
     if digit_position > 13:
         return ""
 
-    if PROGRAMS[digit_position][0] == 0:
+    if programs[digit_position][0] == 0:
         digits_to_search = range(9, 0, -1) if largest else range(1, 10)
         for digit in digits_to_search:
-            new_z = 26 * z + digit + PROGRAMS[digit_position][1]
-            largest_remaining = _find_extreme_number(digit_position=digit_position + 1, z=new_z, largest=largest)
+            new_z = 26 * z + digit + programs[digit_position][1]
+            largest_remaining = _find_extreme_number(
+                programs=programs, digit_position=digit_position + 1, z=new_z, largest=largest
+            )
             if largest_remaining is None:
                 continue
 
@@ -67,13 +100,15 @@ def _find_extreme_number(digit_position: int = 0, z: int = 0, largest: bool = Tr
         return None
 
     # The current program is type 1.
-    digit = z % 26 + PROGRAMS[digit_position][1]
+    digit = z % 26 + programs[digit_position][1]
     if not 1 <= digit <= 9:
         # No valid w exists.
         return None
 
     new_z = z // 26
-    largest_remaining = _find_extreme_number(digit_position=digit_position + 1, z=new_z, largest=largest)
+    largest_remaining = _find_extreme_number(
+        programs=programs, digit_position=digit_position + 1, z=new_z, largest=largest
+    )
     return str(digit) + largest_remaining if largest_remaining is not None else None
 
 
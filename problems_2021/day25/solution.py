@@ -1,20 +1,26 @@
 """https://adventofcode.com/2021/day/25."""
-import itertools
 import os
 
 import numpy as np
 
+from adventofcode.util import make_lookup_table, read_grid
+
+_SEA_CUCUMBER_TABLE = make_lookup_table({">": 2, "v": 1, ".": 0}, dtype=int)
+
 
 def main():
-    sea_cucumber_map = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print(solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
+
+
+def solve(data_file_path: str) -> int:
+    sea_cucumber_map = _read_data(data_file_path=data_file_path)
 
     step = 0
     while True:
         step += 1
         new_sea_cucumber_map = _move(sea_cucumber_map)
         if np.all(new_sea_cucumber_map == sea_cucumber_map):
-            print(step)
-            break
+            return step
 
         sea_cucumber_map = new_sea_cucumber_map
 
@@ -37,15 +43,7 @@ def _move(sea_cucumber_map: np.ndarray) -> np.ndarray:
 
 def _read_data(data_file_path: str) -> np.ndarray:
     """Returns the sea cucumber map where east are represented by 2, south 1, and empty space 0."""
-    with open(data_file_path, "r") as file:
-        lines = file.readlines()
-
-    lines = list(map(lambda x: x.strip(), lines))
-    ret = np.zeros((len(lines), len(lines[0])), dtype=int)
-    for i, j in itertools.product(range(len(lines)), range(len(lines[0]))):
-        ret[i, j] = {">": 2, "v": 1, ".": 0}[lines[i][j]]
-
-    return ret
+    return read_grid(file_path=data_file_path, lookup_table=_SEA_CUCUMBER_TABLE)
 
 
 if __name__ == "__main__":
@@ -1,51 +1,53 @@
-"""https://adventofcode.com/2021/day/4#part2"""
-import math
+"""https://adventofcode.com/2021/day/3"""
 import os
 import os.path
-from typing import List
 
+import numpy as np
 
-def main():
-    binary_strings = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
-    string_length = len(binary_strings[0])
+from adventofcode.util import read_grid
+
+# Number of rows packed at a time by `pack_bits`.
+_PACK_BLOCK_SIZE = 64 * 1024
 
-    gamma = ""
-    epsilon = ""
-    for i in range(string_length):
-        most_common = _find_most_common([int(x[i]) for x in binary_strings])
-        gamma = gamma + str(most_common)
-        epsilon = epsilon + str(int(not most_common))
 
-    print(int(gamma, 2) * int(epsilon, 2))
+def main():
+    print(solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
+
 
+def solve(data_file_path: str) -> int:
+    bits = _read_data(data_file_path=data_file_path)
+    num_reports, bit_width = bits.shape
 
-def _read_data(data_file_path: str) -> List[str]:
-    with open(data_file_path, "r") as file:
-        lines = file.readlines()
+    # The number of ones in each column, most significant bit first.
+    num_ones = np.count_nonzero(bits, axis=0)
+    most_common = (2 * num_ones > num_reports).astype(np.uint8)
+    # On a tie, the value that first reached half of the reports is the most common, i.e., not the last value.
+    is_tie = 2 * num_ones == num_reports
+    most_common[is_tie] = 1 - bits[-1, is_tie]
 
-    return [line.rstrip() for line in lines]
+    gamma = int(pack_bits(most_common[np.newaxis, :])[0])
+    epsilon = gamma ^ ((1 << bit_width) - 1)
+    return gamma * epsilon
 
 
-def _find_most_common(binary_nums: List[int]) -> int:
-    """Find most common binary number.
+def _read_data(data_file_path: str) -> np.ndarray:
+    """Returns the report as a (num_reports, bit_width) matrix of 0s and 1s, most significant bit first."""
+    return read_grid(file_path=data_file_path, dtype=np.uint8)
 
-    Inputs must be 0 or 1.
-    """
-    num_zeros = 0
-    num_ones = 0
 
-    # If count reaches half length, can terminate.
-    half_length = math.ceil(len(binary_nums) / 2)
-    for i, num in enumerate(binary_nums):
-        if num == 0:
-            num_zeros += 1
-            if num_zeros >= half_length:
-                return 0
-            continue
+def pack_bits(bits: np.ndarray) -> np.ndarray:
+    """Returns the rows of a matrix of 0s and 1s, most significant bit first, as uint64 numbers."""
+    if bits.shape[1] > 64:
+        raise ValueError(f"Numbers of {bits.shape[1]} bits do not fit in uint64!")
 
-        num_ones += 1
-        if num_ones >= half_length:
-            return 1
+    ret = np.zeros(shape=bits.shape[0], dtype=np.uint64)
+    # Shift in one column at a time, a block of rows at a time so the block stays in cache.
+    for start in range(0, bits.shape[0], _PACK_BLOCK_SIZE):
+        block = ret[start : start + _PACK_BLOCK_SIZE]
+        for column in bits[start : start + _PACK_BLOCK_SIZE].T:
+            block <<= np.uint64(1)
+            block |= column
+    return ret
 
 
 if __name__ == "__main__":
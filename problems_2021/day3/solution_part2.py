@@ -1,71 +1,133 @@
-"""https://adventofcode.com/2021/day/4#part2"""
+"""https://adventofcode.com/2021/day/3"""
 import os
 import os.path
-from typing import List
+from typing import Iterable, Union
 
+import numpy as np
 
-def main():
-    binary_strings = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
-
-    print(_compute_rating(binary_strings, most_common=True) * _compute_rating(binary_strings, most_common=False))
-
-
-def _read_data(data_file_path: str) -> List[str]:
-    with open(data_file_path, "r") as file:
-        lines = file.readlines()
+from adventofcode.util import read_grid
+from problems_2021.day3.solution_part1 import pack_bits
 
-    return [line.rstrip() for line in lines]
 
+def main():
+    print(solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
 
-def _compute_rating(binary_strings: List[str], most_common: bool = True) -> int:
-    """Returns rating number based on most/least common criterion."""
-    keep = [True] * len(binary_strings)
-    num_left = len(binary_strings)
-
-    for position in range(len(binary_strings[0])):
-        chosen_num = _find_most_common(binary_nums=[int(x[position]) for i, x in enumerate(binary_strings) if keep[i]])
-        if not most_common:
-            chosen_num = int(not chosen_num)
-
-        print(f"Position {position}, chosen digit {chosen_num}.")
 
-        for i, string in enumerate(binary_strings):
-            if not keep[i]:
-                continue
+def solve(data_file_path: str) -> int:
+    bits = _read_data(data_file_path=data_file_path)
+    trie = BitTrie(bit_width=bits.shape[1])
+    trie.extend(pack_bits(bits))
 
-            if int(string[position]) != chosen_num:
-                print(f"String {i} eliminated.")
+    return trie.rating(most_common=True) * trie.rating(most_common=False)
 
-                keep[i] = False
-                num_left -= 1
 
-        if num_left == 1:
-            return int(binary_strings[keep.index(True)], 2)
+def _read_data(data_file_path: str) -> np.ndarray:
+    """Returns the report as a (num_reports, bit_width) matrix of 0s and 1s, most significant bit first."""
+    return read_grid(file_path=data_file_path, dtype=np.uint8)
 
 
-def _find_most_common(binary_nums: List[int]) -> int:
-    """Find most common binary number.
+class BitTrie:
+    """A binary trie of report numbers, most significant bit first, with the number of reports below each node.
 
-    Inputs must be 0 or 1. If equal number, return 1.
+    The nodes are rows of two arrays: `children`, the node of the 0 and 1 child of each node, and `counts`.  The root
+    is node 0, which is never a child, so 0 also stands for a missing child.  The arrays grow by doubling, so numbers
+    can be inserted as they stream in, without rebuilding the trie.
     """
-    num_zeros = 0
-    num_ones = 0
-
-    # If count is more than half length, can terminate.
-    winning_count = len(binary_nums) // 2 + 1
-    for i, num in enumerate(binary_nums):
-        if num == 0:
-            num_zeros += 1
-            if num_zeros >= winning_count:
-                return 0
-            continue
-
-        num_ones += 1
-        if num_ones >= winning_count:
-            return 1
-
-    # Equal count, return 1.
-    return 1
+
+    def __init__(self, bit_width: int, capacity: int = 1024) -> None:
+        if not 1 <= bit_width <= 64:
+            raise ValueError(f"The bit width must be between 1 and 64, got {bit_width}!")
+
+        self.bit_width = bit_width
+        self._children = np.zeros(shape=(capacity, 2), dtype=np.int64)
+        self._counts = np.zeros(shape=capacity, dtype=np.int64)
+        self._num_nodes = 1
+
+    def __len__(self) -> int:
+        """Returns the number of numbers inserted."""
+        return int(self._counts[0])
+
+    def insert(self, number: int) -> None:
+        self.extend(np.array([number], dtype=np.uint64))
+
+    def extend(self, numbers: Union[np.ndarray, Iterable[int]]) -> None:
+        """Inserts all numbers.
+
+        The batch is sorted first, so the numbers below any new node are a contiguous range, which at each level is
+        split wherever the next bit of the sorted numbers changes.  Each level is then a few array operations over the
+        batch, plus one per range.
+        """
+        numbers = np.sort(np.asarray(numbers if isinstance(numbers, np.ndarray) else list(numbers), dtype=np.uint64))
+        if len(numbers) == 0:
+            return
+        if int(numbers[-1]) >> self.bit_width:
+            raise ValueError(f"Numbers must have at most {self.bit_width} bits!")
+
+        self._counts[0] += len(numbers)
+        # The ranges of numbers sharing their leading bits, as their starts, and the node of each range.
+        is_start = np.zeros(shape=len(numbers), dtype=bool)
+        is_start[0] = True
+        starts = np.zeros(shape=1, dtype=np.int64)
+        nodes = np.zeros(shape=1, dtype=np.int64)
+        for position in range(self.bit_width - 1, -1, -1):
+            prefixes = numbers >> np.uint64(position)
+            is_start[1:] |= prefixes[1:] != prefixes[:-1]
+            new_starts = np.flatnonzero(is_start)
+
+            parents = nodes[np.searchsorted(starts, new_starts, side="right") - 1]
+            bits = (prefixes[new_starts] & np.uint64(1)).astype(np.int64)
+            children = self._children[parents, bits]
+
+            # The ranges are distinct prefixes, so each missing child is created once.
+            missing = children == 0
+            if missing.any():
+                children[missing] = self._allocate(int(np.count_nonzero(missing)))
+                self._children[parents[missing], bits[missing]] = children[missing]
+
+            self._counts[children] += np.diff(new_starts, append=len(numbers))
+            starts, nodes = new_starts, children
+
+    def rating(self, most_common: bool = True) -> int:
+        """Returns the rating of the numbers based on the most/least common criterion.
+
+        At each bit, the walk goes down to the child with the most (or least) numbers.  Ties go to the 1 child for the
+        most common criterion and to the 0 child for the least common one, and a child without numbers is never taken.
+        """
+        if len(self) == 0:
+            raise ValueError("The trie is empty!")
+
+        node = 0
+        ret = 0
+        for _ in range(self.bit_width):
+            zero_child, one_child = self._children[node]
+            num_zeros = self._counts[zero_child] if zero_child != 0 else 0
+            num_ones = self._counts[one_child] if one_child != 0 else 0
+
+            take_one = num_ones >= num_zeros if most_common else num_ones < num_zeros
+            if take_one and num_ones > 0 or num_zeros == 0:
+                node = one_child
+                ret = ret * 2 + 1
+            else:
+                node = zero_child
+                ret = ret * 2
+
+        return ret
+
+    def _allocate(self, num_nodes: int) -> np.ndarray:
+        """Returns the indices of `num_nodes` new nodes, growing the arrays as needed."""
+        capacity = len(self._counts)
+        while self._num_nodes + num_nodes > capacity:
+            capacity *= 2
+
+        if capacity > len(self._counts):
+            self._children = np.concatenate(
+                [self._children, np.zeros(shape=(capacity - len(self._counts), 2), dtype=np.int64)]
+            )
+            self._counts = np.concatenate([self._counts, np.zeros(shape=capacity - len(self._counts), dtype=np.int64)])
+
+        ret = np.arange(self._num_nodes, self._num_nodes + num_nodes)
+        self._num_nodes += num_nodes
+        return ret
 
 
 if __name__ == "__main__":
@@ -1,91 +1,69 @@
-"""https://adventofcode.com/2021/day/4#part2"""
-import itertools
+"""https://adventofcode.com/2021/day/4"""
 import os
 import os.path
-from typing import List, Tuple
+from typing import Tuple
 
 import numpy as np
 
+from adventofcode.util import MappedFile, parse_ints
 
-def main():
-    order, boards = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
-
-    found = False
+_BOARD_SIZE = 5
 
-    for num_called in order:
-        for board in boards:
-            board.register_num(num_called)
-            if board.bingo:
-                last_num = num_called
-                winning_board = board
-                found = True
-                break
 
-        if found:
-            break
-
-    # Include the last number.
-    result = winning_board.remaining * last_num
+def main():
+    result = solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
     print(f"Result is {result}.")
 
 
-def _read_data(data_file_path: str) -> Tuple[List[int], List["Board"]]:
-    with open(data_file_path, "r") as file:
-        first_line = file.readline().rstrip()
-        order = [int(x) for x in first_line.split(",")]
+def solve(data_file_path: str) -> int:
+    order, boards = _read_data(data_file_path=data_file_path)
+    draw_indices = win_draw_indices(order=order, boards=boards)
 
-        # Read 6 lines at a time.
-        boards = []
+    # The first board to win; on a tie, the first such board.
+    board_index = int(np.argmin(draw_indices))
+    return final_score(order=order, board=boards[board_index], draw_index=int(draw_indices[board_index]))
 
-        next_line = file.readline()
-        while next_line:
-            next_lines = [file.readline().rstrip().lstrip() for i in range(5)]
-            board = np.zeros((5, 5), dtype=int)
-            for row_index, row in enumerate(next_lines):
-                board[row_index, :] = [int(x) for x in row.split()]
 
-            print()
-            print(board)
+def _read_data(data_file_path: str) -> Tuple[np.ndarray, np.ndarray]:
+    return read_game(data_file_path=data_file_path)
 
-            boards.append(Board(board))
 
-            next_line = file.readline()
+def read_game(data_file_path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the drawn numbers in order, and all boards as a (num_boards, 5, 5) array."""
+    with MappedFile(data_file_path) as mapped_file:
+        chars = mapped_file.as_array()
+        first_line_end = mapped_file.find(b"\n")
+        order = parse_ints(chars[:first_line_end])
+        boards = parse_ints(chars[first_line_end:]).reshape(-1, _BOARD_SIZE, _BOARD_SIZE)
+        del chars
 
     return order, boards
 
 
-class Board:
-    def __init__(self, board: np.ndarray):
-        self.remaining = np.sum(board)
-
-        self._coordinates = {}
-        for i, j in itertools.product(range(5), range(5)):
-            self._coordinates[board[i, j]] = (i, j)
-
-        self._nums_called_rows = [0] * 5
-        self._nums_called_cols = [0] * 5
-
-        self.bingo = False
+def win_draw_indices(order: np.ndarray, boards: np.ndarray) -> np.ndarray:
+    """Returns the index in `order` of the draw on which each board wins, or `len(order)` if it never wins.
 
-    def _coordinate(self, value):
-        """Returns the (i, j) coordinate corresponding to input value."""
-        return self._coordinates[value]
+    A row wins on the draw of its last number, i.e., the max of the draw indices of its numbers, and a board wins with
+    its first row or column, i.e., the min of those maxes.  A lookup table from number to draw index makes it a few
+    reductions over all boards at once.
+    """
+    # Numbers never drawn are drawn "after the last draw".  If a number is drawn twice, only the first draw counts.
+    draw_index_by_number = np.full(shape=max(int(order.max()), int(boards.max())) + 1, fill_value=len(order))
+    draw_index_by_number[order[::-1]] = np.arange(len(order) - 1, -1, -1)
+    draw_indices = draw_index_by_number.astype(np.int32)[boards]
 
-    def register_num(self, num: int):
-        try:
-            i, j = self._coordinate(num)
-        except KeyError:
-            return
+    row_wins = draw_indices.max(axis=2).min(axis=1)
+    column_wins = draw_indices.max(axis=1).min(axis=1)
+    return np.minimum(row_wins, column_wins)
 
-        self.remaining -= num
 
-        self._nums_called_cols[j] += 1
-        if self._nums_called_cols[j] == 5:
-            self.bingo = True
+def final_score(order: np.ndarray, board: np.ndarray, draw_index: int) -> int:
+    """Returns the sum of the numbers of the board not drawn up to `draw_index`, times the number then drawn."""
+    if draw_index >= len(order):
+        raise ValueError("The board never wins!")
 
-        self._nums_called_rows[i] += 1
-        if self._nums_called_rows[i] == 5:
-            self.bingo = True
+    unmarked = ~np.isin(board, order[: draw_index + 1])
+    return int(board[unmarked].sum()) * int(order[draw_index])
 
 
 if __name__ == "__main__":
@@ -1,100 +1,33 @@
 """https://adventofcode.com/2021/day/4#part2"""
-import itertools
 import os
 import os.path
-from typing import List, Tuple
+from typing import Tuple
 
 import numpy as np
 
+from problems_2021.day4.solution_part1 import final_score, read_game, win_draw_indices
 
-def main():
-    order, boards = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
-
-    boards_already_won = [False] * len(boards)
-    num_boards_left = len(boards)
-    found = False
-
-    for num_called in order:
-        for i, board in enumerate(boards):
-            if boards_already_won[i]:
-                continue
-
-            board.register_num(num_called)
-            if board.bingo:
-                boards_already_won[i] = True
-                num_boards_left -= 1
-
-                if num_boards_left == 0:
-                    last_board = board
-                    last_num = num_called
-                    found = True
-                    break
 
-        if found:
-            break
-
-    # Include the last number.
-    result = last_board.remaining * last_num
+def main():
+    result = solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
     print(f"Result is {result}.")
 
 
-def _read_data(data_file_path: str) -> Tuple[List[int], List["Board"]]:
-    with open(data_file_path, "r") as file:
-        first_line = file.readline().rstrip()
-        order = [int(x) for x in first_line.split(",")]
-
-        # Read 6 lines at a time.
-        boards = []
-
-        next_line = file.readline()
-        while next_line:
-            next_lines = [file.readline().rstrip().lstrip() for i in range(5)]
-            board = np.zeros((5, 5), dtype=int)
-            for row_index, row in enumerate(next_lines):
-                board[row_index, :] = [int(x) for x in row.split()]
-
-            print()
-            print(board)
-
-            boards.append(Board(board))
-
-            next_line = file.readline()
-
-    return order, boards
-
-
-class Board:
-    def __init__(self, board: np.ndarray):
-        self.remaining = np.sum(board)
-
-        self._coordinates = {}
-        for i, j in itertools.product(range(5), range(5)):
-            self._coordinates[board[i, j]] = (i, j)
-
-        self._nums_called_rows = [0] * 5
-        self._nums_called_cols = [0] * 5
-
-        self.bingo = False
-
-    def _coordinate(self, value):
-        """Returns the (i, j) coordinate corresponding to input value."""
-        return self._coordinates[value]
-
-    def register_num(self, num: int):
-        try:
-            i, j = self._coordinate(num)
-        except KeyError:
-            return
+def solve(data_file_path: str) -> int:
+    order, boards = _read_data(data_file_path=data_file_path)
+    draw_indices = win_draw_indices(order=order, boards=boards)
 
-        self.remaining -= num
+    # The last board to win, among the boards that win at all; on a tie, the last such board.
+    winning_board_indices = np.flatnonzero(draw_indices < len(order))
+    if len(winning_board_indices) == 0:
+        raise ValueError("No board ever wins!")
+    winning_draw_indices = draw_indices[winning_board_indices]
+    board_index = int(winning_board_indices[len(winning_board_indices) - 1 - np.argmax(winning_draw_indices[::-1])])
+    return final_score(order=order, board=boards[board_index], draw_index=int(draw_indices[board_index]))
 
-        self._nums_called_cols[j] += 1
-        if self._nums_called_cols[j] == 5:
-            self.bingo = True
 
-        self._nums_called_rows[i] += 1
-        if self._nums_called_rows[i] == 5:
-            self.bingo = True
+def _read_data(data_file_path: str) -> Tuple[np.ndarray, np.ndarray]:
+    return read_game(data_file_path=data_file_path)
 
 
 if __name__ == "__main__":
@@ -1,53 +1,294 @@
-"""https://adventofcode.com/2021/day/5#part2"""
+"""https://adventofcode.com/2021/day/5"""
 import os
 import os.path
-import re
-from collections import Counter
-from typing import List, Tuple
+from typing import Tuple
+
+import numpy as np
+
+from adventofcode.util import read_ints
+
+# Bounding boxes of up to this many cells are rasterized into a dense grid.
+_MAX_DENSE_CELLS = 1 << 26
+# Otherwise, up to this many segment points are sorted and counted, and beyond that the overlaps are computed from the
+# segment endpoints only.
+_MAX_SPARSE_POINTS = 1 << 25
+# The sparse mode keys the points as `y * width + x`, so bounding boxes of more cells use the analytic mode.
+_MAX_SPARSE_CELLS = np.iinfo(np.int64).max
+# Candidate pairs of crossing pieces checked at a time by the analytic mode.
+_MAX_CANDIDATE_PAIRS = 1 << 22
+
+# The lines of the horizontal, vertical, diagonal and anti-diagonal segments, as the (a, b) of their equations
+# `a * x + b * y = c`.  The constant `c` identifies the line within its direction.
+_LINE_COEFFICIENTS = [(0, 1), (1, 0), (1, -1), (1, 1)]
+_VERTICAL = 1
 
 
 def main():
-    start_end_points = _filter_vertical_and_horizontal(
-        _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print(solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
+
+
+def solve(data_file_path: str) -> int:
+    return count_overlaps(segments=_read_data(data_file_path=data_file_path), include_diagonals=False)
+
+
+def _read_data(data_file_path: str) -> np.ndarray:
+    """Returns the segments as rows of (x1, y1, x2, y2)."""
+    return read_ints(file_path=data_file_path).reshape(-1, 4)
+
+
+def count_overlaps(
+    segments: np.ndarray,
+    include_diagonals: bool = True,
+    max_dense_cells: int = _MAX_DENSE_CELLS,
+    max_sparse_points: int = _MAX_SPARSE_POINTS,
+) -> int:
+    """Returns the number of points covered by at least two of the horizontal, vertical and 45-degree segments.
+
+    Diagonal segments are ignored unless `include_diagonals`, and so are any other segments.  The segments are
+    rasterized into a dense grid if their bounding box has up to `max_dense_cells` cells.  Otherwise, their points are
+    sorted and counted if there are up to `max_sparse_points` of them (and their keys fit in int64), and the overlaps
+    are computed analytically from the segment endpoints beyond that, e.g., for coordinates in the billions.
+    """
+    x1, y1, x2, y2 = segments.T
+    is_horizontal = y1 == y2
+    is_vertical = (x1 == x2) & ~is_horizontal
+    is_diagonal = (np.abs(x2 - x1) == np.abs(y2 - y1)) & ~is_horizontal & ~is_vertical
+    segments = segments[is_horizontal | is_vertical | (is_diagonal & include_diagonals)]
+    if len(segments) == 0:
+        return 0
+
+    x_min, y_min = segments[:, [0, 2]].min(), segments[:, [1, 3]].min()
+    width = int(segments[:, [0, 2]].max() - x_min) + 1
+    height = int(segments[:, [1, 3]].max() - y_min) + 1
+    # Work in the coordinates relative to the bounding box.
+    segments = segments - [x_min, y_min, x_min, y_min]
+
+    if width * height <= max_dense_cells:
+        return _count_overlaps_dense(segments=segments, width=width, height=height)
+
+    num_points = int(
+        (np.maximum(np.abs(segments[:, 2] - segments[:, 0]), np.abs(segments[:, 3] - segments[:, 1])) + 1).sum()
     )
+    if num_points <= max_sparse_points and width * height <= _MAX_SPARSE_CELLS:
+        return _count_overlaps_sparse(segments=segments, width=width)
+
+    return _count_overlaps_analytic(segments=segments)
+
 
-    counts_by_coordinate = Counter()
-    for start_point, end_point in start_end_points:
-        is_vertical = start_point[1] == end_point[1]
+def _count_overlaps_dense(segments: np.ndarray, width: int, height: int) -> int:
+    """Counts the overlaps by rasterizing the segments into a uint16 grid of coverage counts.
 
-        fixed_axis = 1 if is_vertical else 0
-        moving_axis = 0 if is_vertical else 1
+    The segments of each direction are drawn at once as a difference grid, +1 at the first point of each segment and
+    -1 right after its last, whose cumulative sum along that direction is the coverage.  The difference grid has an
+    extra row and an extra column on both sides, for the points after the last one.
+    """
+    # Each segment goes from (x1, y1) to (x2, y2) with y1 <= y2, and with x1 <= x2 if horizontal.
+    swap = (segments[:, 1] > segments[:, 3]) | ((segments[:, 1] == segments[:, 3]) & (segments[:, 0] > segments[:, 2]))
+    segments = np.where(swap[:, np.newaxis], segments[:, [2, 3, 0, 1]], segments)
+    x1, y1, x2, y2 = segments.T
+    x_steps, y_steps = np.sign(x2 - x1), np.sign(y2 - y1)
+    # A single point is drawn as a horizontal segment.
+    x_steps[(x_steps == 0) & (y_steps == 0)] = 1
 
-        start_index = min(start_point[moving_axis], end_point[moving_axis])
-        # End point is exclusive.
-        end_index = max(start_point[moving_axis], end_point[moving_axis]) + 1
+    grid = np.zeros(shape=(height + 1, width + 2), dtype=np.uint16)
+    differences = np.zeros(shape=grid.shape, dtype=np.int32)
+    for x_step, y_step in [(1, 0), (0, 1), (1, 1), (-1, 1)]:
+        in_direction = (x_steps == x_step) & (y_steps == y_step)
+        if not in_direction.any():
+            continue
 
-        if is_vertical:
-            for index in range(start_index, end_index):
-                counts_by_coordinate[(index, start_point[fixed_axis])] += 1
+        differences[:] = 0
+        # The columns are offset by one, so the point after the last one of a down-left segment is in the grid.
+        np.add.at(differences, (y1[in_direction], x1[in_direction] + 1), 1)
+        np.add.at(differences, (y2[in_direction] + y_step, x2[in_direction] + 1 + x_step), -1)
+
+        if y_step == 0:
+            np.cumsum(differences, axis=1, out=differences)
+        elif x_step == 0:
+            np.cumsum(differences, axis=0, out=differences)
         else:
-            for index in range(start_index, end_index):
-                counts_by_coordinate[(start_point[fixed_axis], index)] += 1
+            # Accumulate along the diagonals, one row at a time.
+            for row in range(1, len(differences)):
+                if x_step == 1:
+                    differences[row, 1:] += differences[row - 1, :-1]
+                else:
+                    differences[row, :-1] += differences[row - 1, 1:]
 
-    print(len([coordinate for coordinate in counts_by_coordinate if counts_by_coordinate[coordinate] > 1]))
+        # Only whether a point is covered at least twice matters, so saturating each direction keeps uint16 exact.
+        grid += np.minimum(differences, 2).astype(np.uint16)
 
+    return int(np.count_nonzero(grid > 1))
 
-def _read_data(data_file_path: str) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
-    with open(data_file_path, "r") as file:
-        lines = file.readlines()
 
-    ret = []
-    for line in lines:
-        nums = [int(x) for x in re.split(",| -> ", line.lstrip().rstrip())]
-        ret.append(((nums[1], nums[0]), (nums[3], nums[2])))
+def _count_overlaps_sparse(segments: np.ndarray, width: int) -> int:
+    """Counts the overlaps by listing the points of all segments as sorted keys and counting the repeated keys."""
+    x1, y1, x2, y2 = segments.T
+    x_steps, y_steps = np.sign(x2 - x1), np.sign(y2 - y1)
+    lengths = np.maximum(np.abs(x2 - x1), np.abs(y2 - y1)) + 1
 
-    return ret
+    # The index of each point within its segment.
+    segment_indices = np.repeat(np.arange(len(segments)), lengths)
+    offsets = np.arange(len(segment_indices)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+
+    keys = (y1[segment_indices] + offsets * y_steps[segment_indices]) * width
+    keys += x1[segment_indices] + offsets * x_steps[segment_indices]
+    keys.sort()
+
+    # Count each run of repeated keys once, at its second key.
+    is_repeated = keys[1:] == keys[:-1]
+    return int(np.count_nonzero(is_repeated & ~np.concatenate([[False], is_repeated[:-1]])))
+
+
+def _count_overlaps_analytic(segments: np.ndarray) -> int:
+    """Counts the overlaps from the segment endpoints, in time depending on the number of segments, not their lengths.
+
+    Each segment is an interval of positions on its line, the x coordinate, or the y coordinate for vertical lines.  A
+    sweep over the sorted interval endpoints of each line cuts the line into pieces of constant coverage, and the
+    pieces covered at least twice are the overlaps within the line.  The other overlaps are crossings of two lines,
+    each at a single point: those of the covered pieces are found by intersection arithmetic.  A crossing point is
+    counted once, minus the number of lines where it is already counted as covered twice.
+
+    The points are sorted as (x, y) or (line, position) pairs with `np.lexsort`, so any coordinates whose sums fit in
+    int64 are supported.
+    """
+    x1, y1, x2, y2 = segments.T
+    is_horizontal = y1 == y2
+    is_vertical = (x1 == x2) & ~is_horizontal
+    is_diagonal = (x2 - x1 == y2 - y1) & ~is_horizontal & ~is_vertical
+    is_anti_diagonal = (x2 - x1 == y1 - y2) & ~is_horizontal & ~is_vertical
+
+    pieces = []
+    for direction, is_in_direction in enumerate([is_horizontal, is_vertical, is_diagonal, is_anti_diagonal]):
+        a, b = _LINE_COEFFICIENTS[direction]
+        lines = a * x1[is_in_direction] + b * y1[is_in_direction]
+        positions = [y1, y2] if direction == _VERTICAL else [x1, x2]
+        starts = np.minimum(*positions)[is_in_direction]
+        ends = np.maximum(*positions)[is_in_direction] + 1
+        pieces.append(_covered_pieces(lines=lines, starts=starts, ends=ends))
 
+    ret = sum(int((x[2] - x[1])[x[3] > 1].sum()) for x in pieces)
 
-def _filter_vertical_and_horizontal(
-    start_end_points: List[Tuple[Tuple[int, int], Tuple[int, int]]]
-) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
-    return [x for x in start_end_points if x[0][0] == x[1][0] or x[0][1] == x[1][1]]
+    crossings = [np.zeros(shape=(0, 2), dtype=np.int64)]
+    for direction_1 in range(len(pieces)):
+        for direction_2 in range(direction_1 + 1, len(pieces)):
+            crossings.append(_crossings(pieces[direction_1], direction_1, pieces[direction_2], direction_2))
+    # Deduplicate the crossings by sorting them, much faster than `np.unique(..., axis=0)`.
+    crossings = np.concatenate(crossings)
+    crossings = crossings[np.lexsort((crossings[:, 1], crossings[:, 0]))]
+    crossings = crossings[np.concatenate([[True], np.any(crossings[1:] != crossings[:-1], axis=1)])[: len(crossings)]]
+
+    num_lines_covered_twice = sum(
+        _is_in_pieces(
+            pieces=[x[pieces[direction][3] > 1] for x in pieces[direction]], direction=direction, points=crossings
+        ).astype(np.int64)
+        for direction in range(len(pieces))
+    )
+    return ret + len(crossings) - int(np.sum(num_lines_covered_twice))
+
+
+def _covered_pieces(lines: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Returns the (line, start, end, coverage) of the pieces of the lines covered by the intervals [start, end).
+
+    The pieces are sorted by line and start, and are disjoint.
+    """
+    endpoint_lines = np.concatenate([lines, lines])
+    positions = np.concatenate([starts, ends])
+    order = np.lexsort((positions, endpoint_lines))
+    endpoint_lines, positions = endpoint_lines[order], positions[order]
+    coverages = np.cumsum(np.concatenate([np.ones_like(starts), -np.ones_like(ends)])[order])
+
+    # A piece spans from each endpoint to the next one.  The coverage drops to 0 after the last endpoint of a line, so
+    # covered pieces never span two lines.
+    is_piece = (coverages[:-1] > 0) & (positions[1:] > positions[:-1])
+    return endpoint_lines[:-1][is_piece], positions[:-1][is_piece], positions[1:][is_piece], coverages[:-1][is_piece]
+
+
+def _crossings(
+    pieces_1: Tuple[np.ndarray, ...], direction_1: int, pieces_2: Tuple[np.ndarray, ...], direction_2: int
+) -> np.ndarray:
+    """Returns the (x, y) points where the pieces of two directions cross, possibly with duplicates.
+
+    Along a piece of the first direction, the line of the second direction changes monotonically, so the pieces it may
+    cross are a range of the pieces of the second direction sorted by line.
+    """
+    lines_1, starts_1, ends_1, _ = pieces_1
+    lines_2, starts_2, ends_2, _ = pieces_2
+    a_1, b_1 = _LINE_COEFFICIENTS[direction_1]
+    a_2, b_2 = _LINE_COEFFICIENTS[direction_2]
+
+    # The lines of the second direction through the first and last points of each piece of the first direction.
+    first_x, first_y = _point_on_line(direction_1, lines_1, starts_1)
+    last_x, last_y = _point_on_line(direction_1, lines_1, ends_1 - 1)
+    first_lines, last_lines = a_2 * first_x + b_2 * first_y, a_2 * last_x + b_2 * last_y
+    range_starts = np.searchsorted(lines_2, np.minimum(first_lines, last_lines), side="left")
+    range_ends = np.searchsorted(lines_2, np.maximum(first_lines, last_lines), side="right")
+    num_candidates = range_ends - range_starts
+
+    ret = [np.zeros(shape=(0, 2), dtype=np.int64)]
+    # Check the candidate pairs a block of pieces at a time, to bound the memory.
+    block_ends = np.searchsorted(
+        np.cumsum(num_candidates),
+        np.arange(1, 1 + int(num_candidates.sum()) // _MAX_CANDIDATE_PAIRS) * _MAX_CANDIDATE_PAIRS,
+    )
+    for indices in np.split(np.arange(len(lines_1)), block_ends):
+        counts = num_candidates[indices]
+        indices_1 = np.repeat(indices, counts)
+        indices_2 = np.arange(len(indices_1)) - np.repeat(np.cumsum(counts) - counts, counts)
+        indices_2 += np.repeat(range_starts[indices], counts)
+
+        # Cramer's rule; the determinant of two different directions is 1 or 2 in absolute value.
+        determinant = a_1 * b_2 - a_2 * b_1
+        x_numerators = lines_1[indices_1] * b_2 - lines_2[indices_2] * b_1
+        y_numerators = a_1 * lines_2[indices_2] - a_2 * lines_1[indices_1]
+        x, y = x_numerators // determinant, y_numerators // determinant
+
+        position_1 = y if direction_1 == _VERTICAL else x
+        position_2 = y if direction_2 == _VERTICAL else x
+        is_crossing = (
+            (x_numerators % determinant == 0)
+            & (y_numerators % determinant == 0)
+            & (starts_1[indices_1] <= position_1)
+            & (position_1 < ends_1[indices_1])
+            & (starts_2[indices_2] <= position_2)
+            & (position_2 < ends_2[indices_2])
+        )
+        ret.append(np.stack([x[is_crossing], y[is_crossing]], axis=1))
+
+    return np.concatenate(ret)
+
+
+def _point_on_line(direction: int, lines: np.ndarray, positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the (x, y) of the points at the given positions on the lines of a direction."""
+    a, b = _LINE_COEFFICIENTS[direction]
+    if direction == _VERTICAL:
+        return lines, positions
+
+    # Here `a` is 0 or 1 and `b` is 1 or -1, so `y = (c - a * x) / b` is exact.
+    return positions, (lines - a * positions) * b
+
+
+def _is_in_pieces(pieces: Tuple[np.ndarray, ...], direction: int, points: np.ndarray) -> np.ndarray:
+    """Returns whether each (x, y) point is in one of the pieces of a direction."""
+    lines, starts, ends = pieces[:3]
+    a, b = _LINE_COEFFICIENTS[direction]
+    point_lines = a * points[:, 0] + b * points[:, 1]
+    point_positions = points[:, 1] if direction == _VERTICAL else points[:, 0]
+
+    # Merge the pieces, which are sorted by (line, start), and the points in the order of (line, position), with each
+    # point after the pieces starting at its position.  The last piece before a point is the one that may contain it.
+    is_point = np.arange(len(lines) + len(points)) >= len(lines)
+    order = np.lexsort((is_point, np.concatenate([starts, point_positions]), np.concatenate([lines, point_lines])))
+    last_piece_indices = np.maximum.accumulate(np.where(is_point[order], -1, order))
+    point_indices = order[is_point[order]] - len(lines)
+    indices = last_piece_indices[is_point[order]]
+
+    ret = np.zeros(shape=len(points), dtype=bool)
+    is_candidate = indices >= 0
+    point_indices, indices = point_indices[is_candidate], indices[is_candidate]
+    ret[point_indices] = (lines[indices] == point_lines[point_indices]) & (
+        point_positions[point_indices] < ends[indices]
+    )
+    return ret
 
 
 if __name__ == "__main__":
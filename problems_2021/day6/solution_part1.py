@@ -1,30 +1,115 @@
 """https://adventofcode.com/2021/day/6"""
 import os
 import os.path
-from typing import List
+from typing import Iterable, List, Sequence
 
+import numpy as np
+
+from adventofcode.util import read_ints
+
+_NUM_DAYS = 80
+# A fish resets to this timer after spawning, and a new fish starts with the last timer.
+_RESET_TIMER = 6
+_NUM_TIMERS = 9
 
-def main():
-    days_left = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
 
-    num_days = 80
+def main():
+    print(solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
 
-    for day in range(num_days):
-        for index_fish in range(len(days_left)):
-            if days_left[index_fish] == 0:
-                days_left[index_fish] = 6
-                days_left.append(8)
-            else:
-                days_left[index_fish] -= 1
 
-    print(len(days_left))
+def solve(data_file_path: str) -> int:
+    return sum(simulate(counts=_read_data(data_file_path=data_file_path), days=_NUM_DAYS))
 
 
 def _read_data(data_file_path: str) -> List[int]:
-    with open(data_file_path, "r") as file:
-        line = file.readline()
+    """Returns the number of fish with each timer value."""
+    return np.bincount(read_ints(file_path=data_file_path), minlength=_NUM_TIMERS).tolist()
+
+
+def simulate(counts: Sequence[int], days: int) -> List[int]:
+    """Returns the number of fish with each timer value after the given number of days."""
+    return simulate_many(counts=counts, days=[days])[0]
+
+
+def simulate_many(counts: Sequence[int], days: Iterable[int]) -> List[List[int]]:
+    """Returns the number of fish with each timer value after each of the given numbers of days.
+
+    The counts after `n` days are `M^n @ counts` for the transition matrix `M`.  Since `M^9 = M^2 + I`, every power of
+    `M` is a polynomial of degree below 9 in `M`, computed by squaring in about log2(n) squarings of 45 products each,
+    and evaluated on the counts.  The queried days are answered in increasing order, each from the counts of the
+    previous one, so the polynomial of each query only spans the gap to the previous day, and its coefficients are
+    that much smaller than the counts.  The coefficients are Python ints, so the counts never overflow.
+
+    The counts grow about 9% a day, so after `n` days they have about `n / 8` bits, and the time is dominated by
+    multiplying such numbers, in O(n^1.59) with the Karatsuba multiplication of Python ints: about 0.1 s for 10^6 days,
+    and about 20 ms for each further query 10^4 days after the previous one, for its 81 products of the counts.
+    """
+    days = list(days)
+    if any(x < 0 for x in days):
+        raise ValueError("The numbers of days must not be negative!")
+
+    counts_by_days = {}
+    current_counts = [int(x) for x in counts]
+    current_day = 0
+    for day in sorted(set(days)):
+        current_counts = _advance(counts=current_counts, days=day - current_day)
+        counts_by_days[day] = current_counts
+        current_day = day
+
+    return [list(counts_by_days[x]) for x in days]
+
+
+def _advance(counts: List[int], days: int) -> List[int]:
+    """Returns the counts after the given number of days, as the polynomial of `M^days` evaluated on the counts."""
+    ret = [0] * _NUM_TIMERS
+    for coefficient in _power_polynomial(days):
+        if coefficient != 0:
+            for timer, count in enumerate(counts):
+                ret[timer] += coefficient * count
+        counts = _step(counts)
+    return ret
+
+
+def _step(counts: List[int]) -> List[int]:
+    """Returns the counts of the next day, i.e., `M @ counts`."""
+    # The fish with a timer of 0 reset, and spawn as many new fish.
+    ret = counts[1:] + counts[:1]
+    ret[_RESET_TIMER] += counts[0]
+    return ret
+
+
+def _power_polynomial(exponent: int) -> List[int]:
+    """Returns the coefficients of the polynomial of degree below 9 equal to `M^exponent`, lowest degree first.
+
+    The bits of the exponent are scanned from the highest, squaring the polynomial for each bit and multiplying it by
+    `M`, a shift of its coefficients, for each bit set.
+    """
+    ret = [1] + [0] * (_NUM_TIMERS - 1)
+    for bit in bin(exponent)[2:]:
+        ret = _square_polynomial(ret)
+        if bit == "1":
+            # `M^9 = M^2 + I`.
+            ret = [ret[-1]] + ret[:-1]
+            ret[2] += ret[0]
+    return ret
+
+
+def _square_polynomial(polynomial: List[int]) -> List[int]:
+    """Returns the square of a polynomial of M, reduced to degree below 9 with `M^9 = M^2 + I`."""
+    ret = [0] * (2 * _NUM_TIMERS - 1)
+    for i, coefficient_1 in enumerate(polynomial):
+        if coefficient_1 == 0:
+            continue
+        ret[2 * i] += coefficient_1 * coefficient_1
+        # The products of two different coefficients appear twice.
+        doubled = 2 * coefficient_1
+        for j in range(i + 1, _NUM_TIMERS):
+            ret[i + j] += doubled * polynomial[j]
 
-    return [int(x) for x in line.lstrip().rstrip().split(",")]
+    for degree in range(len(ret) - 1, _NUM_TIMERS - 1, -1):
+        ret[degree - _NUM_TIMERS + 2] += ret[degree]
+        ret[degree - _NUM_TIMERS] += ret[degree]
+    return ret[:_NUM_TIMERS]
 
 
 if __name__ == "__main__":
@@ -1,25 +1,77 @@
 """https://adventofcode.com/2021/day/7"""
 import os
 import os.path
-from typing import List
+from typing import Iterable, Tuple
 
 import numpy as np
 
+from adventofcode.util import iter_ints
+
 
 def main():
-    positions = np.array(_read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
+    print(solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
+
+
+def solve(data_file_path: str) -> int:
+    _, counts = _read_data(data_file_path=data_file_path)
+    return int(linear_costs(counts).min())
+
+
+def _read_data(data_file_path: str) -> Tuple[int, np.ndarray]:
+    return position_histogram(position_chunks=iter_ints(file_path=data_file_path))
+
+
+def position_histogram(position_chunks: Iterable[np.ndarray]) -> Tuple[int, np.ndarray]:
+    """Returns the lowest position and the number of crabs at each position from there on.
+
+    The positions are consumed chunk by chunk, e.g., from `iter_ints`, so any number of crabs can be compressed into a
+    histogram as large as the range of their positions.
+    """
+    start = 0
+    counts = np.zeros(shape=0, dtype=np.int64)
+    for chunk in position_chunks:
+        if len(chunk) == 0:
+            continue
+
+        # Extend the histogram to cover the positions of the chunk.
+        new_start = min(int(chunk.min()), start) if len(counts) > 0 else int(chunk.min())
+        new_end = max(int(chunk.max()), start + len(counts) - 1) if len(counts) > 0 else int(chunk.max())
+        if new_start != start or new_end - new_start + 1 != len(counts):
+            new_counts = np.zeros(shape=new_end - new_start + 1, dtype=np.int64)
+            new_counts[start - new_start : start - new_start + len(counts)] = counts
+            start, counts = new_start, new_counts
+
+        counts += np.bincount(chunk - start, minlength=len(counts))
+
+    return start, counts
+
+
+def linear_costs(counts: np.ndarray) -> np.ndarray:
+    """Returns the total fuel to align all crabs at each position of the histogram, at a cost of 1 per step.
 
-    # Median minimizes the l1 distance from all points.
-    # Ref: https://math.stackexchange.com/a/113336
-    sum_distance_from_median = np.sum(np.abs(positions - np.median(positions)))
-    print(int(sum_distance_from_median))
+    With the prefix sums `C(x)` of the counts and `S(x)` of the counts times their positions, the cost at `x` is
+    `x * C(x) - S(x)` for the crabs up to `x`, plus `(S - S(x)) - x * (N - C(x))` for the others, which is exact in
+    integers.  The entries are Python ints if the costs may not fit in int64.
+    """
+    counts = counts.astype(_cost_dtype(counts))
+    positions = np.arange(len(counts)).astype(counts.dtype)
+    cumulative_counts = np.cumsum(counts)
+    cumulative_moments = np.cumsum(counts * positions)
+    if len(counts) == 0:
+        return cumulative_counts
 
+    total_count, total_moment = cumulative_counts[-1], cumulative_moments[-1]
+    return (
+        positions * cumulative_counts
+        - cumulative_moments
+        + (total_moment - cumulative_moments)
+        - positions * (total_count - cumulative_counts)
+    )
 
-def _read_data(data_file_path: str) -> List[int]:
-    with open(data_file_path, "r") as file:
-        line = file.readline()
 
-    return [int(x) for x in line.lstrip().rstrip().split(",")]
+def _cost_dtype(counts: np.ndarray) -> type:
+    """Returns int64 if the squared distances times the total count fit in it, and object for Python ints otherwise."""
+    return np.int64 if int(counts.sum()) * len(counts) ** 2 < 1 << 61 else object
 
 
 if __name__ == "__main__":
@@ -1,40 +1,43 @@
 """https://adventofcode.com/2021/day/7"""
 import os
 import os.path
-from typing import List
+from typing import Tuple
 
 import numpy as np
 
+from adventofcode.util import iter_ints
+from problems_2021.day7.solution_part1 import linear_costs, position_histogram
+
 
 def main():
-    positions = np.array(_read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
+    print(solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
+
 
-    # Mean minimizes the sum of squared distances from all points.
-    mean_position = np.mean(positions)
-    # The gradient of the total cost is:
-    # 1/n df/fx = x - mu + 1/2n sum_i(sng(x - x_i)), where the last term is bounded by (-0.5, 0.5). Therefore, the
-    # fractional optimal position must reside in (mean - 0.5, mean + 0.5). Therefore, only need to check the floor and
-    # ceil of both (mean - 0.5) and (mean + 0.5).
-    positions_to_check = {
-        np.floor(mean_position - 0.5),
-        np.ceil(mean_position - 0.5),
-        np.floor(mean_position + 0.5),
-        np.ceil(mean_position + 0.5),
-    }
+def solve(data_file_path: str) -> int:
+    _, counts = _read_data(data_file_path=data_file_path)
+    return int(triangular_costs(counts).min())
 
-    print(min([_cost(alignment_position=x, starting_positions=positions) for x in positions_to_check]))
 
+def _read_data(data_file_path: str) -> Tuple[int, np.ndarray]:
+    return position_histogram(position_chunks=iter_ints(file_path=data_file_path))
 
-def _read_data(data_file_path: str) -> List[int]:
-    with open(data_file_path, "r") as file:
-        line = file.readline()
 
-    return [int(x) for x in line.lstrip().rstrip().split(",")]
+def triangular_costs(counts: np.ndarray) -> np.ndarray:
+    """Returns the total fuel to align all crabs at each position of the histogram, at a cost of n for the n-th step.
 
+    A crab `d` steps away costs `d * (d + 1) / 2 = (d^2 + d) / 2`.  Summed over the crabs, the squares expand into
+    `x^2 * N - 2 * x * S_1 + S_2` with the sums `S_k` of the counts times the k-th power of their positions, and the
+    distances are the linear costs, so every cost is exact in integers.
+    """
+    linear = linear_costs(counts)
+    counts = counts.astype(linear.dtype)
+    positions = np.arange(len(counts)).astype(counts.dtype)
 
-def _cost(alignment_position: int, starting_positions: np.ndarray) -> int:
-    distances = np.abs(starting_positions - alignment_position)
-    return int(np.sum(0.5 * distances * (distances + 1)))
+    total_count = counts.sum()
+    first_moment = (counts * positions).sum()
+    second_moment = (counts * positions * positions).sum()
+    squares = positions * positions * total_count - 2 * positions * first_moment + second_moment
+    return (squares + linear) // 2
 
 
 if __name__ == "__main__":
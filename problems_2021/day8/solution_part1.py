@@ -1,31 +1,54 @@
 """https://adventofcode.com/2021/day/8"""
 import os.path
-import re
-from typing import List
-from typing import Tuple
+from typing import Iterator
 
+import numpy as np
 
-def main():
-    digits_and_outputs = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+from adventofcode.util import iter_chunks
 
-    unique_lengths = {2, 4, 3, 7}
-    count = 0
-    for digits, outputs in digits_and_outputs:
-        count += len([x for x in outputs if len(x) in unique_lengths])
+# The number of patterns of a display line: the 10 unique signal patterns, then the 4 output digits.
+NUM_PATTERNS = 10
+_NUM_OUTPUTS = 4
+# The number of segments lit in 1, 4, 7 and 8, which no other digit shares.
+_UNIQUE_LENGTHS = [2, 4, 3, 7]
 
-    print(count)
+# The number of segments of each 7-bit pattern.
+POPCOUNT = np.array([bin(x).count("1") for x in range(128)], dtype=np.uint8)
 
 
-def _read_data(data_file_path: str) -> List[Tuple[List[str], List[str]]]:
-    with open(data_file_path, "r") as file:
-        lines = file.readlines()
+def main():
+    print(solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
 
-    ret = []
-    for line in lines:
-        strings = [x.lstrip().rstrip() for x in re.split(" \\| | ", line.lstrip().rstrip())]
-        ret.append((strings[:10], strings[10:]))
 
-    return ret
+def solve(data_file_path: str) -> int:
+    count = 0
+    for patterns in iter_patterns(data_file_path=data_file_path):
+        count += int(np.count_nonzero(np.isin(POPCOUNT[patterns[:, NUM_PATTERNS:]], _UNIQUE_LENGTHS)))
+
+    return count
+
+
+def iter_patterns(data_file_path: str) -> Iterator[np.ndarray]:
+    """Yields the display lines as (num_lines, 14) uint8 matrices of 7-bit patterns, one per chunk of the file.
+
+    Segment "a" is bit 0, ..., "g" is bit 6, so a pattern is the OR of the bits of its letters whatever their order.
+    The patterns of a whole chunk are reduced at once from the bits of all its characters.
+    """
+    for chars in iter_chunks(file_path=data_file_path):
+        # Shifting by the offset from "a" is much faster than a lookup table.  The offsets of the separators, " ", "|" and
+        # the line breaks, are 8 or more once wrapped around, so their bits are 0.
+        bits = np.left_shift(np.uint8(1), chars - np.uint8(ord("a"))) & np.uint8(0x7F)
+        # A pattern starts at each letter not right after another letter, and the bits from there to the next pattern
+        # are its letters followed by separators, which have no bits.
+        is_letter = bits != 0
+        pattern_starts = np.flatnonzero(is_letter[1:] & ~is_letter[:-1]) + 1
+        if len(is_letter) > 0 and is_letter[0]:
+            pattern_starts = np.concatenate([[0], pattern_starts])
+        patterns = np.bitwise_or.reduceat(bits, pattern_starts) if len(pattern_starts) > 0 else bits[:0]
+        if len(patterns) % (NUM_PATTERNS + _NUM_OUTPUTS) != 0:
+            raise ValueError(f"Expected {NUM_PATTERNS + _NUM_OUTPUTS} patterns per line, got {len(patterns)} in all!")
+
+        yield patterns.reshape(-1, NUM_PATTERNS + _NUM_OUTPUTS)
 
 
 if __name__ == "__main__":
@@ -1,107 +1,67 @@
 """https://adventofcode.com/2021/day/8"""
 import os.path
-import re
-from typing import Dict, TypeAlias
-from typing import List
-from typing import Tuple
 
-
-# A code is the numerical representation (e.g., [2, 5]) of a string (e.g., "cf") representing a single digit. A code
-# is order-insensitive. A code is made up of several code nums (e.g., 2 and 5).
-_Code: TypeAlias = List[int]
+import numpy as np
+
+from problems_2021.day8.solution_part1 import NUM_PATTERNS, POPCOUNT, iter_patterns
+
+# The number of segments of each digit, and of those it shares with 1 and with 4.
+_FEATURES_BY_DIGIT = [
+    (6, 2, 3),
+    (2, 2, 2),
+    (5, 1, 2),
+    (5, 2, 3),
+    (4, 2, 4),
+    (5, 1, 3),
+    (6, 1, 3),
+    (3, 2, 2),
+    (7, 2, 4),
+    (6, 2, 4),
+]
+# The digit of each signature `15 * length + 5 * shared_with_one + shared_with_four` of the features, or
+# `_UNKNOWN_DIGIT` if no digit has that signature.
+_UNKNOWN_DIGIT = 255
+_DIGIT_BY_SIGNATURE = np.full(shape=128, fill_value=_UNKNOWN_DIGIT, dtype=np.uint8)
+_DIGIT_BY_SIGNATURE[[15 * x + 5 * y + z for x, y, z in _FEATURES_BY_DIGIT]] = np.arange(len(_FEATURES_BY_DIGIT))
 
 
 def main():
-    strings_and_outputs_list = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
-
-    nums = []
-    for strings, outputs in strings_and_outputs_list:
-        codes = []
-        for string in strings:
-            codes.append([_letter_to_int(x) for x in string])
-
-        output_codes = []
-        for output_code in outputs:
-            output_codes.append([_letter_to_int(x) for x in output_code])
-
-        true_code_nums_by_apparent_code_num = _decode(codes=codes)
-        output = 0
-        for output_code in output_codes:
-            output *= 10
-            output += _num_by_string_nums([true_code_nums_by_apparent_code_num[x] for x in output_code])
-
-        nums.append(output)
-
-    print(sum(nums))
-
-
-def _read_data(data_file_path: str) -> List[Tuple[List[str], List[str]]]:
-    with open(data_file_path, "r") as file:
-        lines = file.readlines()
-
-    ret = []
-    for line in lines:
-        strings = [x.lstrip().rstrip() for x in re.split(" \\| | ", line.lstrip().rstrip())]
-        ret.append((strings[:10], strings[10:]))
+    print(solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
 
-    return ret
 
+def solve(data_file_path: str) -> int:
+    total = 0
+    for patterns in iter_patterns(data_file_path=data_file_path):
+        digits = decode_outputs(patterns=patterns).astype(np.int64)
+        total += int((digits @ np.array([1000, 100, 10, 1])).sum())
 
-def _letter_to_int(letter: str) -> int:
-    return ord(letter) - 97
+    return total
 
 
-def _decode(codes: List[_Code]) -> Dict[int, int]:
-    """Returns a mapping where the keys are the apparent code nums and the values are the true code nums.
+def decode_outputs(patterns: np.ndarray) -> np.ndarray:
+    """Returns the (num_lines, 4) output digits of the (num_lines, 14) patterns of display lines.
 
-    Based on the 10 codes representing 10 digits (0-9) (unordered), returns the mapping between strings to digits.
+    The wiring does not need to be solved segment by segment: a digit is told apart from the others by its number of
+    segments and the numbers of those it shares with 1 and with 4, which are the only patterns of 2 and 4 segments.
+    Whatever the wiring, those numbers are popcounts of bitwise ANDs of the patterns, and a table maps them to the
+    digit.
     """
-    signatures = _get_unique_occurrence_tuples_and_num_total_occurrences(codes)
-
-    true_code_nums_by_apparent_code_num = {}
-    true_code_nums_by_apparent_code_num[signatures.index(((0, 0, 1, 1), 8))] = 0
-    true_code_nums_by_apparent_code_num[signatures.index(((0, 1, 0, 1), 6))] = 1
-    true_code_nums_by_apparent_code_num[signatures.index(((1, 1, 1, 1), 8))] = 2
-    true_code_nums_by_apparent_code_num[signatures.index(((0, 1, 0, 1), 7))] = 3
-    true_code_nums_by_apparent_code_num[signatures.index(((0, 0, 0, 1), 4))] = 4
-    true_code_nums_by_apparent_code_num[signatures.index(((1, 1, 1, 1), 9))] = 5
-    true_code_nums_by_apparent_code_num[signatures.index(((0, 0, 0, 1), 7))] = 6
-
-    return true_code_nums_by_apparent_code_num
-
-
-def _get_unique_occurrence_tuples_and_num_total_occurrences(codes: List[_Code]) -> List[Tuple[Tuple[int, ...], int]]:
-    # The return is used as a signature (like a feature vector) to uniquely identify code nums.
-    code_lengths = [len(x) for x in codes]
-    one_four_seven_eight_codes = [codes[code_lengths.index(x)] for x in [2, 4, 3, 7]]
-    ret = []
-    for letter_index in range(7):
-        unique_occurrences_tuple = tuple(int(letter_index in x) for x in one_four_seven_eight_codes)
-        num_total_occurrences = sum([letter_index in x for x in codes])
-        ret.append((unique_occurrences_tuple, num_total_occurrences))
-    return ret
-
-
-def _num_by_string_nums(string_nums: List[int]) -> int:
-    on_off_status = ()
-    for i in range(7):
-        on_off_status += (int(i in string_nums),)
-    return _num_by_on_off_status(on_off_status=on_off_status)
-
-
-def _num_by_on_off_status(on_off_status: Tuple[int, ...]) -> int:
-    return {
-        (1, 1, 1, 0, 1, 1, 1): 0,
-        (0, 0, 1, 0, 0, 1, 0): 1,
-        (1, 0, 1, 1, 1, 0, 1): 2,
-        (1, 0, 1, 1, 0, 1, 1): 3,
-        (0, 1, 1, 1, 0, 1, 0): 4,
-        (1, 1, 0, 1, 0, 1, 1): 5,
-        (1, 1, 0, 1, 1, 1, 1): 6,
-        (1, 0, 1, 0, 0, 1, 0): 7,
-        (1, 1, 1, 1, 1, 1, 1): 8,
-        (1, 1, 1, 1, 0, 1, 1): 9,
-    }[on_off_status]
+    lengths = POPCOUNT[patterns[:, :NUM_PATTERNS]]
+    if not np.all(np.any(lengths == 2, axis=1) & np.any(lengths == 4, axis=1)):
+        raise ValueError("The signal patterns of a line do not include the patterns of 1 and 4!")
+
+    rows = np.arange(len(patterns))
+    ones = patterns[rows, np.argmax(lengths == 2, axis=1)][:, np.newaxis]
+    fours = patterns[rows, np.argmax(lengths == 4, axis=1)][:, np.newaxis]
+
+    outputs = patterns[:, NUM_PATTERNS:]
+    # At most 119, so the signatures fit in uint8.
+    signatures = 15 * POPCOUNT[outputs] + 5 * POPCOUNT[outputs & ones] + POPCOUNT[outputs & fours]
+    digits = _DIGIT_BY_SIGNATURE[signatures]
+    if np.any(digits == _UNKNOWN_DIGIT):
+        raise ValueError("An output pattern does not match any digit!")
+
+    return digits
 
 
 if __name__ == "__main__":
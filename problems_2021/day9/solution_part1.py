@@ -1,34 +1,78 @@
 """https://adventofcode.com/2021/day/9"""
 import os.path
+from typing import Iterator, Optional, Tuple
 
 import numpy as np
-from skimage.feature import peak_local_max
+
+from adventofcode.util import DIGIT_TABLE, MappedFile, parse_char_grid
+
+# Pads the map, so the points on its edges are compared against something higher than any height.
+_PADDING_HEIGHT = 10
+# The highest points are never low points, even if all their neighbors are as high.
+_MAX_HEIGHT = 9
+# Number of grid cells in a tile yielded by `iter_tiles`.
+_TILE_SIZE = 4 * 1024 * 1024
 
 
 def main():
-    height_map = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print(solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
 
-    # Need to take the negative because `peak_local_max` finds peaks not valleys.  Need to also add 10 to make all
-    # heights positive, because under the hood `peak_local_max` uses a max filter with zero padding on the boundaries.
-    # If the heights are negatives, the low points on the boundaries will be wrongly missed.
-    peak_coordinates = peak_local_max(
-        -height_map.astype(int) + 10,
-        footprint=np.array([[0, 1, 0], [1, 1, 1], [0, 1, 0]], dtype=bool),
-        exclude_border=False,
-    )
 
+def solve(data_file_path: str) -> int:
     result = 0
-    for peak_coordinate in peak_coordinates:
-        result += height_map[peak_coordinate[0], peak_coordinate[1]] + 1
+    for tile, row_above, row_below in iter_tiles(data_file_path=data_file_path):
+        low_heights = tile[low_points(tile, row_above=row_above, row_below=row_below)]
+        result += int(low_heights.sum(dtype=np.int64)) + len(low_heights)
+
+    return result
+
+
+def low_points(
+    height_map: np.ndarray, row_above: Optional[np.ndarray] = None, row_below: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Returns a boolean mask of the low points of the map, i.e., the points not higher than any of their 4 neighbors.
+
+    The map may be a tile of rows of a larger map, in which case `row_above` and `row_below` are the halo rows
+    bordering it, and None at the edges of the larger map.  A plateau is made of low points, unless it is made of 9s:
+    the points of height 9 are never low points.
+    """
+    num_rows, num_cols = height_map.shape
+    padded = np.full(shape=(num_rows + 2, num_cols + 2), fill_value=_PADDING_HEIGHT, dtype=np.uint8)
+    padded[1:-1, 1:-1] = height_map
+    if row_above is not None:
+        padded[0, 1:-1] = row_above
+    if row_below is not None:
+        padded[-1, 1:-1] = row_below
+
+    ret = height_map < _MAX_HEIGHT
+    ret &= height_map <= padded[:-2, 1:-1]
+    ret &= height_map <= padded[2:, 1:-1]
+    ret &= height_map <= padded[1:-1, :-2]
+    ret &= height_map <= padded[1:-1, 2:]
+    return ret
 
-    print(result)
 
+def iter_tiles(
+    data_file_path: str, tile_size: int = _TILE_SIZE
+) -> Iterator[Tuple[np.ndarray, Optional[np.ndarray], Optional[np.ndarray]]]:
+    """Yields the height map a tile of rows at a time, as `(tile, row_above, row_below)` uint8 arrays; see `low_points`.
 
-def _read_data(data_file_path: str) -> np.ndarray:
-    with open(data_file_path, "r") as file:
-        lines = file.readlines()
+    The file is memory-mapped and each tile of about `tile_size` points is parsed with its halo rows, so a map of any
+    size can be processed with a bounded amount of memory.
+    """
+    with MappedFile(data_file_path) as mapped_file:
+        chars = parse_char_grid(mapped_file.as_array())
+        num_rows = chars.shape[0]
+        num_rows_per_tile = max(1, tile_size // max(1, chars.shape[1]))
+        for start in range(0, num_rows, num_rows_per_tile):
+            end = min(start + num_rows_per_tile, num_rows)
+            # The tile and its halo rows, which are shared with the neighboring tiles.
+            heights = np.take(DIGIT_TABLE, chars[max(0, start - 1) : min(num_rows, end + 1)])
+            row_above = heights[0] if start > 0 else None
+            row_below = heights[-1] if end < num_rows else None
+            yield heights[int(start > 0) : len(heights) - int(end < num_rows)], row_above, row_below
 
-    return np.array([[int(x) for x in line.lstrip().rstrip()] for line in lines])
+        del chars
 
 
 if __name__ == "__main__":
@@ -1,77 +1,50 @@
 """https://adventofcode.com/2021/day/9"""
 import os.path
-from typing import List
-from typing import Tuple
 
 import numpy as np
-from skimage.feature import peak_local_max
+
+from adventofcode.imports import lazy_import
+from adventofcode.util import read_grid
+
+ndimage = lazy_import("scipy.ndimage")
+
+_WALL_HEIGHT = 9
+_NUM_LARGEST_BASINS = 3
+# Number of labels counted at a time by `basin_sizes`.
+_BINCOUNT_BLOCK_SIZE = 1 << 22
 
 
 def main():
-    height_map = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
-
-    # Need to take the negative because `peak_local_max` finds peaks not valleys.  Need to also add 10 to make all
-    # heights positive, because under the hood `peak_local_max` uses a max filter with zero padding on the boundaries.
-    # If the heights are negatives, the low points on the boundaries will be wrongly missed.
-    peak_coordinates = peak_local_max(
-        -height_map.astype(int) + 10,
-        footprint=np.array([[0, 1, 0], [1, 1, 1], [0, 1, 0]], dtype=bool),
-        exclude_border=False,
-    )
-
-    basin_mask = np.zeros(shape=height_map.shape, dtype=bool)
-    point_collections = [[] for _ in range(len(peak_coordinates))]
-    for peak_coordinate, point_collection in zip(peak_coordinates, point_collections):
-        _flood_fill(
-            point=tuple(peak_coordinate), height_map=height_map, basin_mask=basin_mask, points_in_basin=point_collection
-        )
-
-    # Remove duplicates.
-    unique_basin_point_collections = []
-    all_basin_points = []
-    for point_collection in point_collections:
-        # Skip duplicate basins.
-        if point_collection[0] in all_basin_points:
-            continue
-
-        unique_basin_point_collections.append(point_collection)
-        all_basin_points.extend(point_collection)
-
-    # Find the size of the three largest basins.
-    largest_sizes = sorted(len(x) for x in unique_basin_point_collections)[-3:]
-    print(np.prod(largest_sizes).item())
+    print(solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")))
 
 
-def _read_data(data_file_path: str) -> np.ndarray:
-    with open(data_file_path, "r") as file:
-        lines = file.readlines()
+def solve(data_file_path: str) -> int:
+    height_map = _read_data(data_file_path=data_file_path)
+
+    largest_sizes = np.sort(basin_sizes(height_map=height_map))[-_NUM_LARGEST_BASINS:]
+    return int(np.prod(largest_sizes))
 
-    return np.array([[int(x) for x in line.lstrip().rstrip()] for line in lines])
 
+def _read_data(data_file_path: str) -> np.ndarray:
+    return read_grid(file_path=data_file_path, dtype=np.uint8)
 
-def _flood_fill(
-    point: Tuple[int, int], height_map: np.ndarray, basin_mask: np.ndarray, points_in_basin: List[Tuple[int, int]]
-) -> None:
-    """Recursively updates `basin_mask` and puts valid basin points to `points_in_basin`."""
-    # Out of bounds.
-    if not (0 <= point[0] < height_map.shape[0] and 0 <= point[1] < height_map.shape[1]):
-        return
 
-    # Hit a wall.
-    if height_map[point[0], point[1]] == 9:
-        return
+def basin_sizes(height_map: np.ndarray) -> np.ndarray:
+    """Returns the number of points of each basin.
 
-    # Already visited.
-    if basin_mask[point[0], point[1]]:
-        return
+    Every point below the wall height belongs to exactly one basin, so the basins are the 4-connected components of
+    those points.  They are labelled in a single pass, without recursion, and counted with `np.bincount`.
+    """
+    labels, num_basins = ndimage.label(height_map != _WALL_HEIGHT, output=np.int32)
 
-    basin_mask[point[0], point[1]] = True
-    points_in_basin.append(point)
+    # Count a block of rows at a time, since `np.bincount` makes an intp copy of its input.
+    counts = np.zeros(shape=num_basins + 1, dtype=np.int64)
+    num_rows_per_block = max(1, _BINCOUNT_BLOCK_SIZE // max(1, labels.shape[1]))
+    for start in range(0, labels.shape[0], num_rows_per_block):
+        counts += np.bincount(labels[start : start + num_rows_per_block].ravel(), minlength=num_basins + 1)
 
-    _flood_fill((point[0] - 1, point[1]), height_map=height_map, basin_mask=basin_mask, points_in_basin=points_in_basin)
-    _flood_fill((point[0] + 1, point[1]), height_map=height_map, basin_mask=basin_mask, points_in_basin=points_in_basin)
-    _flood_fill((point[0], point[1] - 1), height_map=height_map, basin_mask=basin_mask, points_in_basin=points_in_basin)
-    _flood_fill((point[0], point[1] + 1), height_map=height_map, basin_mask=basin_mask, points_in_basin=points_in_basin)
+    # Label 0 is the walls.
+    return counts[1:]
 
 
 if __name__ == "__main__":
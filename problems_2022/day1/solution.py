@@ -1,18 +1,27 @@
 """https://adventofcode.com/2022/day/1."""
 import os
-from typing import List
+from typing import List, Tuple
 
 
 def main():
-    numbers = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
-    calories = [sum(x) for x in numbers]
-    max_sum = max(calories)
+    max_sum, sum_of_three_max = solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
     print(f"Part 1: The max is {max_sum}.")
-
-    sum_of_three_max = sum(list(sorted(calories, reverse=True))[:3])
     print(f"Part 2: The sum of three maximum carried calories is {sum_of_three_max}.")
 
 
+def solve(data_file_path: str) -> Tuple[int, int]:
+    numbers = _read_data(data_file_path=data_file_path)
+    return part1(numbers), part2(numbers)
+
+
+def part1(numbers: List[List[int]]) -> int:
+    return max(sum(x) for x in numbers)
+
+
+def part2(numbers: List[List[int]]) -> int:
+    return sum(list(sorted((sum(x) for x in numbers), reverse=True))[:3])
+
+
 def _read_data(data_file_path: str) -> List[List[int]]:
     with open(data_file_path, "r") as file:
         lines = [x.strip() for x in file.readlines()]
@@ -1,23 +1,33 @@
 """https://adventofcode.com/2022/day/10."""
 import os
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from adventofcode.util import read_lines_stripping_both_ends
 
 
+# The 1-based cycles at which the signal strength is measured.
+_CYCLE_INDICES = list(range(20, 221, 40))
+
+
 def main():
-    instructions = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    sum_of_strengths, pattern = solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print(f"Part 1: The sum of strengths at cycles {_CYCLE_INDICES} is {sum_of_strengths}.")
+    print(f"Part 2: The pattern is ")
+    print(pattern)
+
 
+def solve(data_file_path: str) -> Tuple[int, str]:
+    instructions = _read_data(data_file_path=data_file_path)
+    return part1(instructions), part2(instructions)
+
+
+def part1(instructions: List[Optional[int]]) -> int:
     positions = _simulate_positions(instructions=instructions)
-    # The cycle indices are 1-based.
-    cycle_indices = list(range(20, 221, 40))
-    sum_of_strengths = sum(positions[cycle_index - 1] * cycle_index for cycle_index in cycle_indices)
-    print(f"Part 1: The sum of strengths at cycles {cycle_indices} is {sum_of_strengths}.")
+    return sum(positions[cycle_index - 1] * cycle_index for cycle_index in _CYCLE_INDICES)
 
-    pattern = _compute_pattern(positions=positions)
-    print(f"Part 2: The pattern is ")
-    for line in pattern:
-        print(line)
+
+def part2(instructions: List[Optional[int]]) -> str:
+    return "\n".join(_compute_pattern(positions=_simulate_positions(instructions=instructions)))
 
 
 def _read_data(data_file_path: str) -> List[Optional[int]]:
@@ -1,5 +1,8 @@
 """https://adventofcode.com/2022/day/11."""
-from typing import List, Callable
+import functools
+import operator
+import os.path
+from typing import List, Callable, Tuple
 
 import numpy as np
 
@@ -9,97 +12,78 @@ class Monkey:
         self,
         starting_items: List[int],
         operation: Callable[[int], int],
-        test: Callable[[int], bool],
+        divisor: int,
         idx_to_throw_to_if_true: int,
         idx_to_thow_to_if_false: int,
     ) -> None:
         self.items = starting_items
         self.operation = operation
-        self.test = test
+        self.divisor = divisor
         self.idx_to_thow_to_if_true = idx_to_throw_to_if_true
         self.idx_to_throw_to_if_false = idx_to_thow_to_if_false
 
-
-def initialize_monkeys() -> List[Monkey]:
-    return [
-        Monkey(
-            starting_items=[66, 59, 64, 51],
-            operation=lambda x: x * 3,
-            test=lambda x: x % 2 == 0,
-            idx_to_throw_to_if_true=1,
-            idx_to_thow_to_if_false=4,
-        ),
-        Monkey(
-            starting_items=[67, 61],
-            operation=lambda x: x * 19,
-            test=lambda x: x % 7 == 0,
-            idx_to_throw_to_if_true=3,
-            idx_to_thow_to_if_false=5,
-        ),
-        Monkey(
-            starting_items=[86, 93, 80, 70, 71, 81, 56],
-            operation=lambda x: x + 2,
-            test=lambda x: x % 11 == 0,
-            idx_to_throw_to_if_true=4,
-            idx_to_thow_to_if_false=0,
-        ),
-        Monkey(
-            starting_items=[94],
-            operation=lambda x: x**2,
-            test=lambda x: x % 19 == 0,
-            idx_to_throw_to_if_true=7,
-            idx_to_thow_to_if_false=6,
-        ),
-        Monkey(
-            starting_items=[71, 92, 64],
-            operation=lambda x: x + 8,
-            test=lambda x: x % 3 == 0,
-            idx_to_throw_to_if_true=5,
-            idx_to_thow_to_if_false=1,
-        ),
-        Monkey(
-            starting_items=[58, 81, 92, 75, 56],
-            operation=lambda x: x + 6,
-            test=lambda x: x % 5 == 0,
-            idx_to_throw_to_if_true=3,
-            idx_to_thow_to_if_false=6,
-        ),
-        Monkey(
-            starting_items=[82, 98, 77, 94, 86, 81],
-            operation=lambda x: x + 7,
-            test=lambda x: x % 17 == 0,
-            idx_to_throw_to_if_true=7,
-            idx_to_thow_to_if_false=2,
-        ),
-        Monkey(
-            starting_items=[54, 95, 70, 93, 88, 93, 63, 50],
-            operation=lambda x: x + 4,
-            test=lambda x: x % 13 == 0,
-            idx_to_throw_to_if_true=2,
-            idx_to_thow_to_if_false=0,
-        ),
-    ]
-
-
-# The test is always to check whether the item is divisible by a prime number.  We can compute the modulus of all the
-# item values against the least common multiple of the prime numbers, and get the same "throw to" decisions, under the
-# operations (adding a constant, multiplication by a constant, and squaring).
-LEAST_COMMON_MULTIPLE = 2 * 7 * 11 * 19 * 3 * 5 * 17 * 13
+    def test(self, item: int) -> bool:
+        return item % self.divisor == 0
 
 
 def main():
-    monkeys = initialize_monkeys()
+    monkey_business_1, monkey_business_2 = solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print(f"Part 1: The monkey business is {monkey_business_1}.")
+    print(f"Part 2: The monkey business is {monkey_business_2}.")
+
+
+def solve(data_file_path: str) -> Tuple[int, int]:
+    # The items of the monkeys change during the rounds, so each part starts from freshly read monkeys.
+    return part1(_read_data(data_file_path=data_file_path)), part2(_read_data(data_file_path=data_file_path))
+
+
+def part1(monkeys: List[Monkey]) -> int:
     nums = nums_of_inspections(monkeys=monkeys, num_rounds=20, divide_by=3)
-    monkey_business = np.prod(list(sorted(nums, reverse=True))[:2]).item()
-    print(f"Part 1: The monkey business is {monkey_business}.")
+    return np.prod(list(sorted(nums, reverse=True))[:2]).item()
+
 
-    monkeys = initialize_monkeys()
+def part2(monkeys: List[Monkey]) -> int:
     nums = nums_of_inspections(monkeys=monkeys, num_rounds=10000)
-    monkey_business = np.prod(list(sorted(nums, reverse=True))[:2]).item()
-    print(f"Part 2: The monkey business is {monkey_business}.")
+    return np.prod(list(sorted(nums, reverse=True))[:2]).item()
+
+
+def _read_data(data_file_path: str) -> List[Monkey]:
+    with open(data_file_path, "r") as file:
+        paragraphs = file.read().strip().split("\n\n")
+
+    ret = []
+    for paragraph in paragraphs:
+        lines = [x.strip() for x in paragraph.splitlines()]
+        ret.append(
+            Monkey(
+                starting_items=[int(x) for x in lines[1].split(": ")[1].split(", ")],
+                operation=_parse_operation(lines[2].split("new = ")[1]),
+                divisor=int(lines[3].rsplit(" ", 1)[1]),
+                idx_to_throw_to_if_true=int(lines[4].rsplit(" ", 1)[1]),
+                idx_to_thow_to_if_false=int(lines[5].rsplit(" ", 1)[1]),
+            )
+        )
+
+    return ret
+
+
+def _parse_operation(expression: str) -> Callable[[int], int]:
+    """Returns the operation of an expression like "old * 3", "old + 2" or "old * old"."""
+    _, operator_char, operand = expression.split(" ")
+    binary_operator = operator.mul if operator_char == "*" else operator.add
+    if operand == "old":
+        return lambda x: binary_operator(x, x)
+
+    value = int(operand)
+    return lambda x: binary_operator(x, value)
 
 
 def nums_of_inspections(monkeys: List[Monkey], num_rounds: int, divide_by: int = 1) -> List[int]:
+    # The test is always to check whether the item is divisible by a prime number.  We can compute the modulus of all
+    # the item values against the least common multiple of the prime numbers, and get the same "throw to" decisions,
+    # under the operations (adding a constant, multiplication by a constant, and squaring).
+    least_common_multiple = functools.reduce(operator.mul, {x.divisor for x in monkeys})
+
     ret = [0] * len(monkeys)
 
     for round_idx in range(num_rounds):
@@ -108,7 +92,7 @@ def nums_of_inspections(monkeys: List[Monkey], num_rounds: int, divide_by: int =
             for item_idx in range(num_items):
                 ret[monkey_idx] += 1
                 item = monkey.items.pop(0)
-                item = (monkey.operation(item) // divide_by) % LEAST_COMMON_MULTIPLE
+                item = (monkey.operation(item) // divide_by) % least_common_multiple
                 idx_to_throw_to = (
                     monkey.idx_to_thow_to_if_true if monkey.test(item) else monkey.idx_to_throw_to_if_false
                 )
@@ -3,58 +3,58 @@ import itertools
 import os
 from typing import Tuple
 
-import networkx as nx
 import numpy as np
 
-from adventofcode.util import read_lines_stripping_both_ends
+from adventofcode.imports import lazy_import
+from adventofcode.util import make_lookup_table, read_char_grid
+
+nx = lazy_import("networkx")
+
+# Heights of "a" to "z" are 0 to 25.  The start point has height of "a", and the end point has height of "z".
+_HEIGHT_TABLE = make_lookup_table({**{chr(ord("a") + x): x for x in range(26)}, "S": 0, "E": 25}, dtype=int)
 
 
 def main():
-    height_map, start_position, end_position = _read_data(
-        data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")
-    )
-    graph = _build_graph(height_map=height_map)
-    shortest_path_length = nx.shortest_path_length(G=graph, source=start_position, target=end_position)
+    shortest_path_length, min_trail_length = solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
     print(f"Part 1: The shortest path length is {shortest_path_length}.")
+    print(f"Part 2: The shortest trail length is {min_trail_length}.")
+
+
+def solve(data_file_path: str) -> Tuple[int, int]:
+    data = _read_data(data_file_path=data_file_path)
+    return part1(data), part2(data)
+
+
+def part1(data: Tuple[np.ndarray, Tuple[int, int], Tuple[int, int]]) -> int:
+    """Returns the fewest steps from the start position to the end position."""
+    height_map, start_position, end_position = data
+    graph = _build_graph(height_map=height_map)
+    return nx.shortest_path_length(G=graph, source=start_position, target=end_position)
 
+
+def part2(data: Tuple[np.ndarray, Tuple[int, int], Tuple[int, int]]) -> int:
+    """Returns the fewest steps from any position of the lowest elevation to the end position."""
+    height_map, _, end_position = data
+    graph = _build_graph(height_map=height_map)
     min_trail_length = float("inf")
     for node_idx, path_length in nx.single_target_shortest_path_length(G=graph, target=end_position):
         if height_map[node_idx[0], node_idx[1]] != 0:
             continue
 
         min_trail_length = min(min_trail_length, path_length)
-    print(f"Part 2: The shortest trail length is {min_trail_length}.")
+
+    return min_trail_length
 
 
 def _read_data(data_file_path: str) -> Tuple[np.ndarray, Tuple[int, int], Tuple[int, int]]:
     """Returns the (height map, start position, end position)."""
-    ret = []
-    start_position = None
-    end_position = None
-    for line_idx, line in enumerate(read_lines_stripping_both_ends(file_path=data_file_path)):
-        row = []
-        for column_idx, char in enumerate(line):
-            if char == "S":
-                # Start point has height of "a", i.e., 0.
-                row.append(0)
-                start_position = (line_idx, column_idx)
-                continue
-
-            if char == "E":
-                # End point has height of "z", i.e., 25.
-                row.append(25)
-                end_position = (line_idx, column_idx)
-                continue
-
-            # The ASCII index of "a" is 97.
-            row.append(ord(char) - 97)
-
-        ret.append(row)
-
-    return np.array(ret, dtype=int), start_position, end_position
+    char_grid = read_char_grid(file_path=data_file_path)
+    start_position = tuple(np.argwhere(char_grid == ord("S"))[0].tolist())
+    end_position = tuple(np.argwhere(char_grid == ord("E"))[0].tolist())
+    return np.take(_HEIGHT_TABLE, char_grid), start_position, end_position
 
 
-def _build_graph(height_map: np.ndarray) -> nx.DiGraph:
+def _build_graph(height_map: np.ndarray) -> "nx.DiGraph":
     # For each (y, x) point, add an edge to the neighbors if the destination_height <= source_height + 1.
     ret = nx.DiGraph()
     indices = list(itertools.product(range(height_map.shape[0]), range(height_map.shape[1])))
@@ -4,6 +4,7 @@ from typing import Tuple, List, Any
 
 import numpy as np
 
+from adventofcode.cache import cached_parser
 from adventofcode.util import read_lines_stripping_both_ends
 
 
@@ -49,15 +50,28 @@ class Packet:
 
 
 def main():
-    data = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    sum_of_indices, decoder_key = solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print(f"Part 1: The sum of indices of right order is {sum_of_indices}.")
+    print(f"Part 2: The product of decoder packet positions is {decoder_key}.")
 
+
+def solve(data_file_path: str) -> Tuple[int, int]:
+    data = _read_data(data_file_path=data_file_path)
+    return part1(data), part2(data)
+
+
+def part1(data: List[Tuple[Packet, Packet]]) -> int:
+    """Returns the sum of the 1-based indices of the pairs in the right order."""
     indices = []
     for idx, (left, right) in enumerate(data):
         if left < right:
             indices.append(idx + 1)
 
-    print(f"Part 1: The sum of indices of right order is {sum(indices)}.")
+    return sum(indices)
 
+
+def part2(data: List[Tuple[Packet, Packet]]) -> int:
+    """Returns the decoder key: the product of the 1-based positions of the decoder packets among the sorted packets."""
     # Sort all packets along with the decoder packets.
     all_packets = []
     for packet_pair in data:
@@ -72,9 +86,11 @@ def main():
     for packet_idx, packet in enumerate(sorted_packets):
         if packet.value in decoder_packet_values:
             decoder_positions.append(packet_idx + 1)
-    print(f"Part 2: The product of decoder packet positions is {np.prod(decoder_positions).item()}.")
+
+    return np.prod(decoder_positions).item()
 
 
+@cached_parser
 def _read_data(data_file_path: str) -> List[Tuple[Packet, Packet]]:
     """Returns the list of (left, right) tuples."""
     ret = []
@@ -8,21 +8,36 @@ from adventofcode.util import read_lines_stripping_both_ends
 
 
 def main():
-    source_position = np.array([0, 500])
-    rock_map, top_left = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    num_sands_1, num_sands_2 = solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print(f"Part 1: The number of sands is {num_sands_1}.")
+    print(f"Part 2: The number of sands is {num_sands_2}.")
+
+
+def solve(data_file_path: str) -> Tuple[int, int]:
+    data = _read_data(data_file_path=data_file_path)
+    return part1(data), part2(data)
 
-    resulting_rock_map = _simulate_until_stable_or_block_source(
-        rock_map=rock_map, source_position=source_position - top_left
-    )
-    num_sands = np.sum(resulting_rock_map) - np.sum(rock_map)
-    print(f"Part 1: The number of sands is {num_sands}.")
 
+def part1(data: Tuple[np.ndarray, np.ndarray]) -> int:
+    """Returns the number of units of sand at rest before sand flows into the abyss."""
+    rock_map, top_left = data
+    return _num_sands(rock_map=rock_map, top_left=top_left)
+
+
+def part2(data: Tuple[np.ndarray, np.ndarray]) -> int:
+    """Returns the number of units of sand at rest once the source is blocked, with the floor."""
+    rock_map, top_left = data
+    rock_map = rock_map.copy()
     rock_map[-1, :] = True
+    return _num_sands(rock_map=rock_map, top_left=top_left)
+
+
+def _num_sands(rock_map: np.ndarray, top_left: np.ndarray) -> int:
+    source_position = np.array([0, 500])
     resulting_rock_map = _simulate_until_stable_or_block_source(
         rock_map=rock_map, source_position=source_position - top_left
     )
-    num_sands = np.sum(resulting_rock_map) - np.sum(rock_map)
-    print(f"Part 2: The number of sands is {num_sands}.")
+    return (np.sum(resulting_rock_map) - np.sum(rock_map)).item()
 
 
 def _read_data(data_file_path: str) -> Tuple[np.ndarray, np.ndarray]:
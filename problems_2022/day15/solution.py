@@ -15,19 +15,30 @@ _Interval = Tuple[int, int]
 
 
 def main():
-    sensors_and_beacons = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    num_impossible_positions, tuning_frequency = solve(
+        data_file_path=os.path.join(os.path.dirname(__file__), "data.txt")
+    )
+    print(f"Part 1: The number of impossible positions is {num_impossible_positions}.")
+    print(f"Part 2: The tuning frequency is {tuning_frequency}.")
+
+
+def solve(data_file_path: str) -> Tuple[int, int]:
+    sensors_and_beacons = _read_data(data_file_path=data_file_path)
+    return part1(sensors_and_beacons), part2(sensors_and_beacons)
 
+
+def part1(sensors_and_beacons: List[Tuple[_Point, _Point]]) -> int:
+    """Returns the number of positions of row 2000000 where no beacon can be."""
     intervals, points_occupied = _row_impossible_intervals_and_beacon_points(
         row_index=2000000, sensors_and_beacons=sensors_and_beacons
     )
-    num_impossible_positions = sum(x_max - x_min + 1 for x_min, x_max in intervals) - len(points_occupied)
-    print(f"Part 1: The number of impossible positions is {num_impossible_positions}.")
+    return sum(x_max - x_min + 1 for x_min, x_max in intervals) - len(points_occupied)
 
+
+def part2(sensors_and_beacons: List[Tuple[_Point, _Point]]) -> int:
+    """Returns the tuning frequency of the only position where the distress beacon can be."""
     only_possible_point = _only_possible_point(sensors_and_beacons=sensors_and_beacons)
-    print(
-        f"Part 2: The point is {only_possible_point}.  The tuning frequency is "
-        f"{only_possible_point[1] * 4000000 + only_possible_point[0]}."
-    )
+    return only_possible_point[1] * 4000000 + only_possible_point[0]
 
 
 def _read_data(data_file_path: str) -> List[Tuple[_Point, _Point]]:
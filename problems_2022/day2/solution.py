@@ -11,12 +11,22 @@ WIN_LOSE_SCORE_MAPPING = {-1: 0, 0: 3, 1: 6}
 
 
 def main():
-    inputs = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
-    total_score = sum(_score(opponent_input=x, my_input=y) for x, y in inputs)
-    print(f"Part 1: Total score is {total_score}.")
+    total_score_1, total_score_2 = solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print(f"Part 1: Total score is {total_score_1}.")
+    print(f"Part 2: Total score is {total_score_2}.")
 
-    total_score = sum(_score_based_on_win_lose(opponent_input=x, win_lose=y - 2) for x, y in inputs)
-    print(f"Part 2: Total score is {total_score}.")
+
+def solve(data_file_path: str) -> Tuple[int, int]:
+    inputs = _read_data(data_file_path=data_file_path)
+    return part1(inputs), part2(inputs)
+
+
+def part1(inputs: List[Tuple[int, int]]) -> int:
+    return sum(_score(opponent_input=x, my_input=y) for x, y in inputs)
+
+
+def part2(inputs: List[Tuple[int, int]]) -> int:
+    return sum(_score_based_on_win_lose(opponent_input=x, win_lose=y - 2) for x, y in inputs)
 
 
 def _read_data(data_file_path: str) -> List[Tuple[int, int]]:
@@ -6,7 +6,12 @@ from adventofcode.util import read_lines_stripping_both_ends
 
 
 def main():
-    inputs = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    sum_priorities = solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print(f"Part 1: The sum of priorities is {sum_priorities}.")
+
+
+def solve(data_file_path: str) -> int:
+    inputs = _read_data(data_file_path=data_file_path)
 
     sum_priorities = 0
     for left, right in inputs:
@@ -15,7 +20,7 @@ def main():
             raise RuntimeError(f"Number of common letters is not 1 between {left} and {right}!")
         common_letter = next(iter(common_letter))
         sum_priorities += letter_to_priority(letter=common_letter)
-    print(f"Part 1: The sum of priorities is {sum_priorities}.")
+    return sum_priorities
 
 
 def _read_data(data_file_path: str) -> List[Tuple[str, str]]:
@@ -7,7 +7,12 @@ from problems_2022.day3.solution_part1 import letter_to_priority
 
 
 def main():
-    inputs = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    sum_priorities = solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print(f"Part 2: The sum of priorities is {sum_priorities}.")
+
+
+def solve(data_file_path: str) -> int:
+    inputs = _read_data(data_file_path=data_file_path)
 
     sum_priorities = 0
     num_lines = len(inputs)
@@ -20,7 +25,7 @@ def main():
         common_letter = next(iter(common_letter))
         sum_priorities += letter_to_priority(letter=common_letter)
 
-    print(f"Part 2: The sum of priorities is {sum_priorities}.")
+    return sum_priorities
 
 
 def _read_data(data_file_path: str) -> List[str]:
@@ -8,15 +8,22 @@ _Range = Tuple[int, int]
 
 
 def main():
-    inputs = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    num_containments, num_overlaps = solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print(f"Part 1: The number of cases where one range contains the other is {num_containments}.")
+    print(f"Part 2: The number of cases where the two ranges overlap is {num_overlaps}.")
 
-    print(inputs)
 
-    num_containments = sum(_one_range_contains_other(range_1=x, range_2=y) for x, y in inputs)
-    print(f"Part 1: The number of cases where one range contains the other is {num_containments}.")
+def solve(data_file_path: str) -> Tuple[int, int]:
+    inputs = _read_data(data_file_path=data_file_path)
+    return part1(inputs), part2(inputs)
 
-    num_overlaps = sum(_ranges_overlap(range_1=x, range_2=y) for x, y in inputs)
-    print(f"Part 2: The number of cases where the two ranges overlap is {num_overlaps}.")
+
+def part1(inputs: List[Tuple[_Range, _Range]]) -> int:
+    return sum(_one_range_contains_other(range_1=x, range_2=y) for x, y in inputs)
+
+
+def part2(inputs: List[Tuple[_Range, _Range]]) -> int:
+    return sum(_ranges_overlap(range_1=x, range_2=y) for x, y in inputs)
 
 
 def _read_data(data_file_path: str) -> List[Tuple[_Range, _Range]]:
@@ -18,26 +18,38 @@ MoveInstructions = List[Tuple[int, int, int]]
 
 
 def main():
-    stack_status, move_instructions = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    top_elements_1, top_elements_2 = solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print(f"Part 1: The top elements are {top_elements_1}.")
+    print(f"Part 2: The top elements are {top_elements_2}.")
 
-    print("Stack status:", stack_status)
-    print("Move instructions: ", move_instructions)
 
+def solve(data_file_path: str) -> Tuple[str, str]:
+    data = _read_data(data_file_path=data_file_path)
+    return part1(data), part2(data)
+
+
+def part1(data: Tuple[StackStatus, MoveInstructions]) -> str:
+    """Returns the top elements after moving the crates one at a time."""
+    stack_status, move_instructions = data
     work_stack_status = copy.deepcopy(stack_status)
     for num_moves, source, destination in move_instructions:
         for _ in range(num_moves):
             element = work_stack_status[source].pop()
             work_stack_status[destination].append(element)
 
-    print(f"Part 1: The top elements are {_top_elements(stack_status=work_stack_status)}.")
+    return _top_elements(stack_status=work_stack_status)
+
 
+def part2(data: Tuple[StackStatus, MoveInstructions]) -> str:
+    """Returns the top elements after moving the crates of each move at once."""
+    stack_status, move_instructions = data
     work_stack_status = copy.deepcopy(stack_status)
     for num_moves, source, destination in move_instructions:
         elements = work_stack_status[source][-num_moves:]
         work_stack_status[source] = work_stack_status[source][:-num_moves]
         work_stack_status[destination].extend(elements)
 
-    print(f"Part 2: The top elements are {_top_elements(stack_status=work_stack_status)}.")
+    return _top_elements(stack_status=work_stack_status)
 
 
 def _read_data(data_file_path: str) -> Tuple[StackStatus, MoveInstructions]:
@@ -1,18 +1,26 @@
 """https://adventofcode.com/2022/day/6."""
 import os
-from typing import Generator, Iterable
+from typing import Generator, Iterable, Tuple
 from collections import deque
 
 
 def main():
-    characters = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
-    position = _find_position_first_n_consecutive_different_characters(characters=characters, num_consecutive=4) + 1
-    print(f"Part 1: The 1-based position of the first 4 consecutive different characters is {position}.")
-
-    # Need to recreate the generator.
-    characters = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
-    position = _find_position_first_n_consecutive_different_characters(characters=characters, num_consecutive=14) + 1
-    print(f"Part 2: The 1-based position of the first 14 consecutive different characters is {position}.")
+    position_1, position_2 = solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print(f"Part 1: The 1-based position of the first 4 consecutive different characters is {position_1}.")
+    print(f"Part 2: The 1-based position of the first 14 consecutive different characters is {position_2}.")
+
+
+def solve(data_file_path: str) -> Tuple[int, int]:
+    # Need to recreate the generator for each part.
+    return part1(_read_data(data_file_path=data_file_path)), part2(_read_data(data_file_path=data_file_path))
+
+
+def part1(characters: Iterable[str]) -> int:
+    return _find_position_first_n_consecutive_different_characters(characters=characters, num_consecutive=4) + 1
+
+
+def part2(characters: Iterable[str]) -> int:
+    return _find_position_first_n_consecutive_different_characters(characters=characters, num_consecutive=14) + 1
 
 
 def _read_data(data_file_path: str) -> Generator[str, None, None]:
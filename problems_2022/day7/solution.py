@@ -1,6 +1,6 @@
 """https://adventofcode.com/2022/day/7."""
 import os
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from dataclasses import dataclass
 
 from adventofcode.util import read_lines_stripping_both_ends
@@ -29,22 +29,42 @@ class Node:
 
 
 def main():
-    lines = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    total_size_under_limit, size_to_delete = solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print(f"Part 1: The total size of directories with sizes under 100000 is {total_size_under_limit}.")
+    print(f"Part 2: The smallest folder to delete, which will free up enough space, has size of {size_to_delete}.")
+
+
+def solve(data_file_path: str) -> Tuple[int, int]:
+    sizes, total_size = _directory_sizes(lines=_read_data(data_file_path=data_file_path))
+    return _total_size_under_limit(sizes=sizes), _size_to_delete(sizes=sizes, total_size=total_size)
+
+
+def part1(lines: List[str]) -> int:
+    sizes, _ = _directory_sizes(lines=lines)
+    return _total_size_under_limit(sizes=sizes)
+
+
+def part2(lines: List[str]) -> int:
+    sizes, total_size = _directory_sizes(lines=lines)
+    return _size_to_delete(sizes=sizes, total_size=total_size)
+
+
+def _directory_sizes(lines: List[str]) -> Tuple[List[int], int]:
+    """Returns the sizes of all directories, and the total size."""
     root = construct_tree(inputs=lines)
 
     sizes = []
     list_directory_sizes(root=root, sizes=sizes)
-    print(
-        f"Part 1: The total size of directories with sizes under 100000 is "
-        f"{sum(size for size in sizes if size <= 100000)}."
-    )
+    return sizes, root.size
+
+
+def _total_size_under_limit(sizes: List[int]) -> int:
+    return sum(size for size in sizes if size <= 100000)
+
 
-    total_size = root.size
+def _size_to_delete(sizes: List[int], total_size: int) -> int:
     min_freed_space = 30000000 - (70000000 - total_size)
-    print(
-        f"Part 2: The smallest folder to delete, which will free up enough space, has size of "
-        f"{min(x for x in sizes if x >= min_freed_space)}."
-    )
+    return min(x for x in sizes if x >= min_freed_space)
 
 
 def _read_data(data_file_path: str) -> List[str]:
@@ -5,23 +5,37 @@ from typing import Tuple, List
 
 import numpy as np
 
-from adventofcode.util import read_lines_stripping_both_ends
+from adventofcode.util import read_grid
 
 
 def main():
-    tree_height_matrix = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    num_visible_trees, max_visibility_score = solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print(f"Part 1: The number of visible trees is {num_visible_trees}.")
+    print(f"Part 2: The maximum visibility score is {max_visibility_score}.")
+
+
+def solve(data_file_path: str) -> Tuple[int, int]:
+    tree_height_matrix = _read_data(data_file_path=data_file_path)
     visible_mask, visibility_range_maps = _visible_mask_and_visilility_range_maps(tree_height_matrix=tree_height_matrix)
-    print(f"Part 1: The number of visible trees is {np.sum(visible_mask)}.")
+    return np.sum(visible_mask).item(), _max_visibility_score(visibility_range_maps=visibility_range_maps)
+
+
+def part1(tree_height_matrix: np.ndarray) -> int:
+    visible_mask, _ = _visible_mask_and_visilility_range_maps(tree_height_matrix=tree_height_matrix)
+    return np.sum(visible_mask).item()
+
+
+def part2(tree_height_matrix: np.ndarray) -> int:
+    _, visibility_range_maps = _visible_mask_and_visilility_range_maps(tree_height_matrix=tree_height_matrix)
+    return _max_visibility_score(visibility_range_maps=visibility_range_maps)
+
 
-    visibility_scores = np.prod(np.stack(visibility_range_maps, axis=0), axis=0)
-    print(f"Part 2: The maximum visibility score is {np.max(visibility_scores)}.")
+def _max_visibility_score(visibility_range_maps: List[np.ndarray]) -> int:
+    return np.max(np.prod(np.stack(visibility_range_maps, axis=0), axis=0)).item()
 
 
 def _read_data(data_file_path: str) -> np.ndarray:
-    array = []
-    for line in read_lines_stripping_both_ends(file_path=data_file_path):
-        array.append([int(x) for x in line])
-    return np.array(array, dtype=int)
+    return read_grid(file_path=data_file_path, dtype=int)
 
 
 def _visible_mask_and_visilility_range_maps(tree_height_matrix: np.ndarray) -> Tuple[np.ndarray, List[np.ndarray]]:
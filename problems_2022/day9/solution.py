@@ -14,13 +14,22 @@ _Instruction = Tuple[str, int]
 
 
 def main():
-    instructions = _read_data(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    num_positions_1, num_positions_2 = solve(data_file_path=os.path.join(os.path.dirname(__file__), "data.txt"))
+    print(f"Part 1: The number of unique tail positions is {num_positions_1}.")
+    print(f"Part 2: The number of unique tail positions is {num_positions_2}.")
 
-    tail_positions = _tail_positions(start_position=(0, 0), instructions=instructions, num_knots=2)
-    print(f"Part 1: The number of unique tail positions is {len(set(tail_positions))}.")
 
-    tail_positions = _tail_positions(start_position=(0, 0), instructions=instructions, num_knots=10)
-    print(f"Part 2: The number of unique tail positions is {len(set(tail_positions))}.")
+def solve(data_file_path: str) -> Tuple[int, int]:
+    instructions = _read_data(data_file_path=data_file_path)
+    return part1(instructions), part2(instructions)
+
+
+def part1(instructions: List[_Instruction]) -> int:
+    return len(set(_tail_positions(start_position=(0, 0), instructions=instructions, num_knots=2)))
+
+
+def part2(instructions: List[_Instruction]) -> int:
+    return len(set(_tail_positions(start_position=(0, 0), instructions=instructions, num_knots=10)))
 
 
 def _read_data(data_file_path: str) -> List[_Instruction]: